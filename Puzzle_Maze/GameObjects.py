@@ -2,11 +2,14 @@
 and other"""
 
 from __future__ import annotations
-from typing import Tuple, List, Any
+from typing import Tuple, List, Any, Dict, Union
 from abc import ABC, abstractmethod
 from typing import TypeVar, Generic
 import pygame
 from pygame.locals import K_UP, K_DOWN, K_LEFT, K_RIGHT
+from game_input import KeyState
+from asset_cache import AssetCache
+from maze_grid import MazeLike
 
 TILE_SIZE: int = 64
 PLAYER_MOVE_DELAY: int = 200
@@ -19,6 +22,16 @@ TILE_KEY: int = 4
 TILE_UNLOCKED: int = 5
 
 
+def load_tile_image(path: str, headless: bool = False) -> pygame.Surface:
+    """Loads an image scaled to the tile size through the shared asset cache,
+    so each file is decoded and scaled once. A headless game draws nothing
+    and may have no display to convert images for, so it gets a blank tile
+    instead."""
+    if headless:
+        return pygame.Surface((TILE_SIZE, TILE_SIZE))
+    return AssetCache.get_instance().load_image(path, (TILE_SIZE, TILE_SIZE))
+
+
 class GameObject:
     """Game object class from which objects such as player and enemy are derived"""
 
@@ -57,16 +70,11 @@ class Player(GameObject):
 
     # want there to be a default image
     def __init__(self, position: Tuple[int, int],
-                 image: pygame.Surface | None = None) -> None:
-        """init function that sets a default image and requires the starting position"""
+                 image: pygame.Surface | None = None, headless: bool = False) -> None:
+        """init function that sets a default image and requires the starting position,
+        a headless game's player gets a blank one"""
         if image is None:
-            # load image
-            # convert_alpha converts to same pixel format as display
-            # and supports transparency
-            default_image = pygame.image.load("assets/player.png").convert_alpha()
-            # set the correct scale
-            default_image = pygame.transform.scale(default_image,
-                                                   (TILE_SIZE, TILE_SIZE))
+            default_image = load_tile_image("assets/player.png", headless)
         else:  # allow for the player image to change
             default_image = image
 
@@ -82,21 +90,22 @@ class Player(GameObject):
         super().draw(screen)
 
     # handle movement
-    def update(self, maze: List[List[int]], doors: List[Door]) -> None:
+    def update(self, maze: MazeLike, doors: DoorLookup,
+               keys: KeyState | None = None, current_time: int | None = None) -> None:
         """Handles player input, basically copied handle_player_input()
         from previous version of game.py
         This version requires passing in the 'maze' which are the matrices
-        created in the load_levels() function."""
+        created in the load_levels() function.
+        The key state and time default to pygame's keyboard and clock, a
+        headless game passes in its own."""
 
-        # # print("[DEBUG] Player.update() CALLED")
-        keys = pygame.key.get_pressed()
-        # # print("Keys pressed:", [i for i, key in enumerate(keys) if key])
-
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         if current_time - self.last_move_time < PLAYER_MOVE_DELAY:
             return
 
-        keys = pygame.key.get_pressed()
+        if keys is None:
+            keys = pygame.key.get_pressed()
         dx = dy = 0
         if keys[K_UP]:
             dy = -1
@@ -115,7 +124,7 @@ class Player(GameObject):
 
         self._move(maze, doors, dy, dx, current_time)
 
-    def _move(self, maze: List[List[int]], doors: List[Door], dy: int,
+    def _move(self, maze: MazeLike, doors: DoorLookup, dy: int,
               dx: int, current_time: int) -> None:
         new_row = self.rect.top // TILE_SIZE + dy
         new_col = self.rect.left // TILE_SIZE + dx
@@ -123,11 +132,9 @@ class Player(GameObject):
         if not (0 <= new_row < len(maze) and 0 <= new_col < len(maze[0])):
             return
 
-        for door in doors:
-            if door.rect.collidepoint(new_col * TILE_SIZE, new_row * TILE_SIZE):
-                door.interact(self, maze)
-                tile_index = maze[new_row][new_col]
-                break
+        door = find_door(doors, new_row, new_col)
+        if door is not None:
+            door.interact(self, maze)
 
         # utilize the maze matrix used to draw the level to
         # decide what the player can do:
@@ -152,10 +159,10 @@ class Enemy(GameObject):
     """Enemy GameObject class"""
 
     def __init__(self, position: Tuple[int, int],
-                 image: pygame.Surface | None = None, velocity: int = 1) -> None:
+                 image: pygame.Surface | None = None, velocity: int = 1,
+                 headless: bool = False) -> None:
         if image is None:
-            default_image = pygame.image.load("assets/enemy.png").convert_alpha()
-            default_image = pygame.transform.scale(default_image, (TILE_SIZE, TILE_SIZE))
+            default_image = load_tile_image("assets/enemy.png", headless)
         else:
             default_image = image
 
@@ -163,11 +170,14 @@ class Enemy(GameObject):
 
         self.velocity = velocity
         self.last_move_time = 0
+        self.caught_player = False
 
-    def update(self, maze: List[List[int]], player: GameObject) -> None:
+    def update(self, maze: MazeLike, player: GameObject,
+               current_time: int | None = None) -> None:
         """Update logic for the enemy class, pass in the maze 2D array and
-        the player game object."""
-        current_time = pygame.time.get_ticks()
+        the player game object. The time defaults to pygame's clock."""
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         if current_time - self.last_move_time < ENEMY_MOVE_DELAY:
             return
 
@@ -187,14 +197,32 @@ class Enemy(GameObject):
 
         if self.collides_with(player):
             print("You Died!")
-            # ADDED to make return to main menu with player death
-            # Will return if player presses escape or dies, as an escape key click is mocked
-            mock_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
-            pygame.event.post(mock_event)
+            # the game ends itself when it sees caught_player
+            self.caught_player = True
 
 
 T = TypeVar('T', bound=GameObject)
 
+# doors either as a list (scanned) or indexed by their (row, col) cell
+DoorLookup = Union[List['Door'], Dict[Tuple[int, int], 'Door']]
+
+
+def index_doors(doors: List[Door]) -> Dict[Tuple[int, int], Door]:
+    """Builds the (row, col) -> door index of a level"""
+    return {(door.rect.top // TILE_SIZE, door.rect.left // TILE_SIZE): door
+            for door in doors}
+
+
+def find_door(doors: DoorLookup, row: int, col: int) -> Door | None:
+    """Returns the door at the cell, in constant time when the doors are
+    indexed by cell"""
+    if isinstance(doors, dict):
+        return doors.get((row, col))
+    for door in doors:
+        if door.rect.collidepoint(col * TILE_SIZE, row * TILE_SIZE):
+            return door
+    return None
+
 
 class ObjectState(ABC, Generic[T]):
     """Base abstract state class. Declares methods that all concrete states
@@ -211,7 +239,7 @@ class ObjectState(ABC, Generic[T]):
         self._context = context
 
     @abstractmethod
-    def handle(self, player: Player, maze: List[List[int]]) -> None:
+    def handle(self, player: Player, maze: MazeLike) -> None:
         """handle interactions with the player"""
         pass
 
@@ -226,10 +254,12 @@ class Door(GameObject):
     by the ObjectState class. The two states are the LockedDoorState and
     UnlockedDoorState classes."""
 
-    def __init__(self, position: Tuple[int, int], state: ObjectState['Door']) -> None:
+    def __init__(self, position: Tuple[int, int], state: ObjectState['Door'],
+                 headless: bool = False) -> None:
 
-        default_image = pygame.image.load("assets/door.png").convert_alpha()
-        default_image = pygame.transform.scale(default_image, (TILE_SIZE, TILE_SIZE))
+        # a headless game's doors get blank images
+        self.headless: bool = headless
+        default_image = load_tile_image("assets/door.png", headless)
 
         super().__init__("Door", position, default_image)
 
@@ -243,7 +273,7 @@ class Door(GameObject):
         self._state = state
         self._state.context = self
 
-    def interact(self, player: Player, maze: List[List[int]]) -> None:
+    def interact(self, player: Player, maze: MazeLike) -> None:
         """Passes the player object in to state object to handle behavior.
         Maze is passed in to update images."""
         if self._state is not None:
@@ -262,14 +292,13 @@ class Door(GameObject):
 class LockedDoorState(ObjectState['Door']):
     """class for simple functionality of a locked door (can't pass)"""
 
-    def handle(self, player: Player, maze: List[List[int]]) -> None:
+    def handle(self, player: Player, maze: MazeLike) -> None:
         if player.key_count > 0:
             player.key_count -= 1
             print("key used, new key count: ", player.key_count)
 
             # change image to unlocked:
-            new_img = pygame.image.load("assets/door_unlocked.png").convert_alpha()
-            new_img = pygame.transform.scale(new_img, (TILE_SIZE, TILE_SIZE))
+            new_img = load_tile_image("assets/door_unlocked.png", self.context.headless)
             self.context.change_img(new_img)
 
             # update the maze array door position with new value:
@@ -291,7 +320,7 @@ class LockedDoorState(ObjectState['Door']):
 class UnlockedDoorState(ObjectState['Door']):
     """State for door object that allows open door to be treated as an empty tile"""
 
-    def handle(self, player: Player, maze: List[List[int]]) -> None:
+    def handle(self, player: Player, maze: MazeLike) -> None:
         # print("door is still unlocked.")
         pass
 
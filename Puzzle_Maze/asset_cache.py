@@ -0,0 +1,98 @@
+"""Process wide cache of decoded and scaled images, so game objects and
+tilesets share one surface per image and size instead of loading the file
+every time they are created."""
+
+from typing import Callable, Dict, Hashable, Optional, Tuple
+import pygame
+
+Size = Tuple[int, int]
+
+
+class AssetCache:
+    """Singleton cache of images keyed by path and size, with hit and miss
+    counters"""
+    _instance: Optional['AssetCache'] = None
+
+    def __init__(self) -> None:
+        self._decoded: Dict[str, pygame.Surface] = {}
+        self._assets: Dict[Hashable, pygame.Surface] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def load_image(self, path: str, size: Size | None = None,
+                   alpha: bool = True) -> pygame.Surface:
+        """Returns the image at path, scaled to size when one is given.
+        The file is decoded once, each size is scaled once.
+
+        Args:
+            path (str): path of the image file
+            size (Size | None): width and height to scale to
+            alpha (bool): convert with per pixel alpha (needs a display)
+        """
+        key: Hashable = ("image", path, size, alpha)
+        image: pygame.Surface | None = self._assets.get(key)
+        if image is not None:
+            self._hits += 1
+            return image
+        self._misses += 1
+        image = self._decode(path, alpha)
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        self._assets[key] = image
+        return image
+
+    def get(self, key: Hashable,
+            factory: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Returns the surface stored under key, building it with factory on
+        the first request. Used for derived images such as composited tiles."""
+        surface: pygame.Surface | None = self._assets.get(key)
+        if surface is not None:
+            self._hits += 1
+            return surface
+        self._misses += 1
+        surface = factory()
+        self._assets[key] = surface
+        return surface
+
+    def _decode(self, path: str, alpha: bool) -> pygame.Surface:
+        """Loads the file once and converts it to the display format"""
+        decoded_key: str = f"{path}:{'alpha' if alpha else 'raw'}"
+        image: pygame.Surface | None = self._decoded.get(decoded_key)
+        if image is None:
+            image = pygame.image.load(path)
+            if alpha:
+                image = image.convert_alpha()
+            self._decoded[decoded_key] = image
+        return image
+
+    def clear(self) -> None:
+        """Drops every cached surface and resets the counters"""
+        self._decoded.clear()
+        self._assets.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    @property
+    def hits(self) -> int:
+        """returns how many requests were served from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """returns how many requests had to load or build a surface"""
+        return self._misses
+
+    @classmethod
+    def get_instance(cls) -> 'AssetCache':
+        """Returns the shared cache, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Drops the shared cache, the next get_instance starts empty"""
+        cls._instance = None
@@ -0,0 +1,189 @@
+"""Vectorized environment stepping many mazes in lockstep, for training and
+evaluating bots. Every instance plays one level with the rules of
+Player._move, Enemy.update and Game.step, but the whole batch is advanced
+with NumPy array operations instead of game objects.
+
+The API follows gym vector environments: reset() returns (observation,
+info), step(actions) returns (observation, reward, terminated, truncated,
+info). One step is one logic step of STEP_MS and actions are the direction
+codes of the replay module. Levels of different sizes are padded with
+walls, which blocks players and turns enemies around just like the edge of
+the maze."""
+
+from typing import Any, Dict, List, Sequence, Tuple
+import numpy as np
+import numpy.typing as npt
+from GameObjects import (TILE_WALL, TILE_EMPTY, TILE_GOAL, TILE_DOOR, TILE_KEY, TILE_UNLOCKED,
+                         PLAYER_MOVE_DELAY, ENEMY_MOVE_DELAY)
+from game import STEP_MS
+from level_format import LevelData, DOOR_UNLOCKED
+from replay import NO_MOVE, UP, DOWN, LEFT, RIGHT
+
+Observation = Dict[str, npt.NDArray[Any]]
+StepResult = Tuple[Observation, npt.NDArray[np.float32], npt.NDArray[np.bool_],
+                   npt.NDArray[np.bool_], Dict[str, Any]]
+
+# (drow, dcol) of every action code
+ACTION_DELTAS: npt.NDArray[np.int64] = np.zeros((5, 2), dtype=np.int64)
+ACTION_DELTAS[UP] = (-1, 0)
+ACTION_DELTAS[DOWN] = (1, 0)
+ACTION_DELTAS[LEFT] = (0, -1)
+ACTION_DELTAS[RIGHT] = (0, 1)
+WIN_REWARD: float = 1.0
+CAUGHT_REWARD: float = -1.0
+
+
+class BatchMazeEnv:
+    """N independent maze instances stepped together"""
+
+    def __init__(self, levels: Sequence[LevelData], num_envs: int | None = None,
+                 max_steps: int | None = None, autoreset: bool = True) -> None:
+        """Constructor for BatchMazeEnv
+
+        Args:
+            levels (Sequence[LevelData]): levels to play, instance i plays
+            levels[i % len(levels)]
+            num_envs (int | None): number of instances, defaults to one per level
+            max_steps (int | None): steps after which an episode is truncated
+            autoreset (bool): restart finished instances at the end of step
+        """
+        if not levels:
+            raise ValueError("at least one level is needed")
+        self.num_envs: int = len(levels) if num_envs is None else num_envs
+        self.max_steps: int | None = max_steps
+        self.autoreset: bool = autoreset
+        chosen: List[LevelData] = [levels[index % len(levels)] for index in range(self.num_envs)]
+        rows: int = max(len(level.tiles) for level in chosen)
+        cols: int = max(len(level.tiles[0]) for level in chosen)
+        enemies: int = max(len(level.enemies) for level in chosen)
+        self.shape: Tuple[int, int] = (rows, cols)
+
+        # starting state of every instance, copied in by reset
+        self._start_tiles: npt.NDArray[np.uint8] = np.full(
+            (self.num_envs, rows, cols), TILE_WALL, dtype=np.uint8)
+        self._start_player: npt.NDArray[np.int64] = np.zeros((self.num_envs, 2), dtype=np.int64)
+        self._start_enemies: npt.NDArray[np.int64] = np.zeros(
+            (self.num_envs, enemies, 3), dtype=np.int64)
+        self.enemy_mask: npt.NDArray[np.bool_] = np.zeros((self.num_envs, enemies), dtype=bool)
+        for index, level in enumerate(chosen):
+            tiles: npt.NDArray[np.uint8] = np.array(level.tiles, dtype=np.uint8)
+            for (row, col), state in level.doors.items():
+                # doors that start unlocked are walked through like empty tiles
+                if state == DOOR_UNLOCKED and tiles[row, col] == TILE_DOOR:
+                    tiles[row, col] = TILE_EMPTY
+            self._start_tiles[index, :tiles.shape[0], :tiles.shape[1]] = tiles
+            self._start_player[index] = level.player
+            for slot, enemy in enumerate(level.enemies):
+                self._start_enemies[index, slot] = (enemy.row, enemy.col, enemy.velocity)
+                self.enemy_mask[index, slot] = True
+
+        self._envs: npt.NDArray[np.int64] = np.arange(self.num_envs)
+        self.tiles: npt.NDArray[np.uint8] = self._start_tiles.copy()
+        self.player: npt.NDArray[np.int64] = self._start_player.copy()
+        self.keys: npt.NDArray[np.int64] = np.zeros(self.num_envs, dtype=np.int64)
+        self.enemies: npt.NDArray[np.int64] = self._start_enemies.copy()
+        self.time: npt.NDArray[np.int64] = np.zeros(self.num_envs, dtype=np.int64)
+        self.steps: npt.NDArray[np.int64] = np.zeros(self.num_envs, dtype=np.int64)
+        self._player_moved: npt.NDArray[np.int64] = np.zeros(self.num_envs, dtype=np.int64)
+        self._enemies_moved: npt.NDArray[np.int64] = np.zeros(self.num_envs, dtype=np.int64)
+
+    def reset(self) -> Tuple[Observation, Dict[str, Any]]:
+        """Puts every instance back at the start of its level"""
+        self._reset(np.ones(self.num_envs, dtype=bool))
+        return self.observation(), {}
+
+    def _reset(self, envs: npt.NDArray[np.bool_]) -> None:
+        """Restarts the selected instances"""
+        self.tiles[envs] = self._start_tiles[envs]
+        self.player[envs] = self._start_player[envs]
+        self.enemies[envs] = self._start_enemies[envs]
+        for array in (self.keys, self.time, self.steps, self._player_moved,
+                      self._enemies_moved):
+            array[envs] = 0
+
+    def step(self, actions: npt.ArrayLike) -> StepResult:
+        """Advances every instance by one logic step
+
+        Args:
+            actions (npt.ArrayLike): direction code of each instance
+
+        Returns:
+            StepResult: observation, reward, terminated, truncated and info
+            with the won and caught flags of the step
+        """
+        moves: npt.NDArray[np.int64] = np.asarray(actions, dtype=np.int64)
+        if moves.shape != (self.num_envs,):
+            raise ValueError(f"expected {self.num_envs} actions, got shape {moves.shape}")
+        self.time += STEP_MS
+        self.steps += 1
+        self._move_players(moves)
+        caught: npt.NDArray[np.bool_] = self._move_enemies()
+        won: npt.NDArray[np.bool_] = \
+            self.tiles[self._envs, self.player[:, 0], self.player[:, 1]] == TILE_GOAL
+        terminated: npt.NDArray[np.bool_] = won | caught
+        truncated: npt.NDArray[np.bool_] = np.zeros(self.num_envs, dtype=bool)
+        if self.max_steps is not None:
+            truncated = ~terminated & (self.steps >= self.max_steps)
+        reward: npt.NDArray[np.float32] = np.where(
+            caught, CAUGHT_REWARD, np.where(won, WIN_REWARD, 0.0)).astype(np.float32)
+        info: Dict[str, Any] = {"won": won, "caught": caught}
+        if self.autoreset and (terminated | truncated).any():
+            info["final_observation"] = self.observation()
+            self._reset(terminated | truncated)
+        return self.observation(), reward, terminated, truncated, info
+
+    def _move_players(self, moves: npt.NDArray[np.int64]) -> None:
+        """Player.update and Player._move for the whole batch"""
+        rows, cols = self.shape
+        ready: npt.NDArray[np.bool_] = \
+            (self.time - self._player_moved >= PLAYER_MOVE_DELAY) & (moves != NO_MOVE)
+        target: npt.NDArray[np.int64] = self.player + ACTION_DELTAS[moves]
+        ready &= (target[:, 0] >= 0) & (target[:, 0] < rows) & \
+            (target[:, 1] >= 0) & (target[:, 1] < cols)
+        envs: npt.NDArray[np.int64] = self._envs[ready]
+        target_row: npt.NDArray[np.int64] = target[ready, 0]
+        target_col: npt.NDArray[np.int64] = target[ready, 1]
+        tile: npt.NDArray[np.uint8] = self.tiles[envs, target_row, target_col]
+        # walking into a locked door with a key unlocks it (LockedDoorState)
+        unlock: npt.NDArray[np.bool_] = (tile == TILE_DOOR) & (self.keys[envs] > 0)
+        self.keys[envs[unlock]] -= 1
+        tile = np.where(unlock, TILE_UNLOCKED, tile).astype(np.uint8)
+        self.tiles[envs[unlock], target_row[unlock], target_col[unlock]] = TILE_UNLOCKED
+        key: npt.NDArray[np.bool_] = tile == TILE_KEY
+        self.keys[envs[key]] += 1
+        self.tiles[envs[key], target_row[key], target_col[key]] = TILE_EMPTY
+        moved: npt.NDArray[np.bool_] = (tile != TILE_WALL) & (tile != TILE_DOOR)
+        self.player[envs[moved], 0] = target_row[moved]
+        self.player[envs[moved], 1] = target_col[moved]
+        self._player_moved[envs[moved]] = self.time[envs[moved]]
+
+    def _move_enemies(self) -> npt.NDArray[np.bool_]:
+        """Enemy.update for the whole batch, returns which players were
+        caught. Enemies only check for the player on the steps they move."""
+        rows, _ = self.shape
+        due: npt.NDArray[np.bool_] = self.time - self._enemies_moved >= ENEMY_MOVE_DELAY
+        moving: npt.NDArray[np.bool_] = due[:, None] & self.enemy_mask
+        row: npt.NDArray[np.int64] = self.enemies[:, :, 0]
+        col: npt.NDArray[np.int64] = self.enemies[:, :, 1]
+        velocity: npt.NDArray[np.int64] = self.enemies[:, :, 2]
+        new_row: npt.NDArray[np.int64] = row + velocity
+        inside: npt.NDArray[np.bool_] = (new_row >= 0) & (new_row < rows)
+        next_tile: npt.NDArray[np.uint8] = self.tiles[
+            self._envs[:, None], np.clip(new_row, 0, rows - 1), col]
+        advance: npt.NDArray[np.bool_] = moving & inside & (next_tile != TILE_WALL)
+        bounce: npt.NDArray[np.bool_] = moving & ~advance
+        self.enemies[:, :, 0] = np.where(advance, new_row, row)
+        self.enemies[:, :, 2] = np.where(bounce, -velocity, velocity)
+        self._enemies_moved[due] = self.time[due]
+        on_player: npt.NDArray[np.bool_] = \
+            (self.enemies[:, :, 0] == self.player[:, None, 0]) & (col == self.player[:, None, 1])
+        caught: npt.NDArray[np.bool_] = np.asarray((moving & on_player).any(axis=1))
+        return caught
+
+    def observation(self) -> Observation:
+        """returns copies of the tiles, player cells, key counts and enemy
+        cells (padding enemies are at -1, -1)"""
+        enemies: npt.NDArray[np.int64] = np.where(
+            self.enemy_mask[:, :, None], self.enemies[:, :, :2], -1)
+        return {"tiles": self.tiles.copy(), "player": self.player.copy(),
+                "keys": self.keys.copy(), "enemies": enemies}
@@ -0,0 +1,261 @@
+"""Performance benchmarks of the game loop, rendering and menus. They run
+on SDL's dummy video driver, so no window opens and they work on CI. Each
+benchmark times batches of calls of one operation, long enough for the
+timer to be precise, the results are written as JSON and compared with a
+baseline: an operation whose median is more than the tolerance slower
+than the baseline is a regression. Timings only compare on the same
+machine, so baselines are stored locally and not committed, and a
+baseline recorded elsewhere is not compared with.
+
+    python benchmark.py --save-baseline                   # new baseline
+    python benchmark.py --output results.json             # compare
+"""
+
+from contextlib import redirect_stdout
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, Sequence
+import pygame
+from chips_core_escape import ChipsCoreEscape
+from GameObjects import Door, LockedDoorState, Player, TILE_DOOR, TILE_SIZE
+from game import Game, STEP_MS
+from game_clock import SimulatedClock
+from game_input import ScriptedInput
+from game_screens import MainMenu, InfoScreen
+from profiler import percentile
+
+Operation = Callable[[], None]
+BASELINE_PATH: str = "benchmarks/baseline.json"
+# slowdown of the median over the baseline flagged as a regression. Runs
+# of the same tree differ by up to about 50% on a busy machine, the
+# regressions worth catching here cost several times over.
+TOLERANCE: float = 1.0
+# window size of the menus, the game opens its own window
+MENU_SIZE: tuple[int, int] = (ChipsCoreEscape.DEFAULT_WIDTH, ChipsCoreEscape.DEFAULT_HEIGHT)
+# operation calls run before timing, and how long to time for
+WARMUP: int = 20
+MIN_TIME: float = 0.5
+MAX_CALLS: int = 1_000_000
+# seconds each timed batch of calls lasts at least
+BATCH_TIME: float = 0.002
+# results that must match the baseline for the timings to be comparable
+ENVIRONMENT: tuple[str, ...] = ("host", "machine", "processor", "python", "pygame")
+
+
+def _game() -> Game:
+    """returns a game drawn in its own window, one step per frame"""
+    return Game(clock=SimulatedClock(step=STEP_MS), input_source=ScriptedInput([pygame.K_RIGHT]))
+
+
+def bench_single_iteration() -> Operation:
+    """A frame of play: one logic step and the dirty rect draw"""
+    game: Game = _game()
+
+    def operation() -> None:
+        if game.game_over:
+            game.game_over = False
+            game.load_level(game.level_index)
+        game.single_iteration()
+    return operation
+
+
+def bench_draw() -> Operation:
+    """Game.draw of a frame where nothing moved"""
+    game: Game = _game()
+    game.draw()
+    return game.draw
+
+
+def bench_draw_full() -> Operation:
+    """Game.draw of a frame where the whole screen is redrawn"""
+    game: Game = _game()
+
+    def operation() -> None:
+        game.renderer.invalidate()
+        game.draw()
+    return operation
+
+
+def bench_load_level() -> Operation:
+    """Game.load_level, going through every level of the pack"""
+    game: Game = _game()
+    count: int = len(game.levels)
+    calls: List[int] = [0]
+
+    def operation() -> None:
+        calls[0] += 1
+        game.load_level(calls[0] % count)
+    return operation
+
+
+def bench_menu() -> Operation:
+    """MainMenu.draw_screen"""
+    return MainMenu(pygame.display.set_mode(MENU_SIZE)).draw_screen
+
+
+def bench_info() -> Operation:
+    """InfoScreen.draw_screen"""
+    return InfoScreen(pygame.display.set_mode(MENU_SIZE)).draw_screen
+
+
+def bench_door_unlock() -> Operation:
+    """LockedDoorState.handle opening a door with a key, the door is locked
+    again before every call"""
+    # the unlocked door image is loaded as in a game with a window
+    pygame.display.set_mode((TILE_SIZE, TILE_SIZE))
+    maze: List[List[int]] = [[TILE_DOOR]]
+    door: Door = Door((0, 0), LockedDoorState())
+    player: Player = Player((TILE_SIZE, 0))
+
+    def operation() -> None:
+        maze[0][0] = TILE_DOOR
+        player.key_count = 1
+        door.transition_to(LockedDoorState())
+        door.interact(player, maze)
+    return operation
+
+
+BENCHMARKS: Dict[str, Callable[[], Operation]] = {
+    "game.single_iteration": bench_single_iteration,
+    "game.draw": bench_draw,
+    "game.draw_full": bench_draw_full,
+    "game.load_level": bench_load_level,
+    "menu.draw_screen": bench_menu,
+    "info.draw_screen": bench_info,
+    "door.unlock": bench_door_unlock,
+}
+
+
+def measure(operation: Operation, min_time: float = MIN_TIME,
+            warmup: int = WARMUP) -> Dict[str, float]:
+    """Times batches of calls of operation for at least min_time seconds.
+    The warmup calls size the batches so each lasts about BATCH_TIME, a
+    single call of a fast operation is shorter than the timer's noise.
+
+    Returns:
+        Dict[str, float]: calls, calls per batch, calls per second, and
+        the mean, p50, p95 and p99 of a call in ms, over the batches
+    """
+    clock: Callable[[], float] = time.perf_counter
+    before: float = clock()
+    for _ in range(warmup):
+        operation()
+    per_call: float = (clock() - before) / max(warmup, 1)
+    batch: int = max(1, min(int(BATCH_TIME / per_call) if per_call > 0 else MAX_CALLS,
+                            MAX_CALLS))
+    samples: List[float] = []
+    started: float = clock()
+    while clock() - started < min_time and len(samples) * batch < MAX_CALLS:
+        before = clock()
+        for _ in range(batch):
+            operation()
+        samples.append((clock() - before) * 1000 / batch)
+    total: float = sum(samples)
+    samples.sort()
+    calls: int = len(samples) * batch
+    return {"calls": calls, "batch": batch, "per_second": len(samples) / (total / 1000),
+            "mean": total / len(samples), "p50": percentile(samples, 50),
+            "p95": percentile(samples, 95), "p99": percentile(samples, 99)}
+
+
+def run_benchmarks(names: Sequence[str] | None = None,
+                   min_time: float = MIN_TIME) -> Dict[str, Any]:
+    """Runs the named benchmarks, all by default, on the dummy video driver
+    unless SDL_VIDEODRIVER picks another. Each benchmark opens the window
+    it draws in.
+
+    Returns:
+        Dict[str, Any]: the environment and the measurements of each benchmark
+    """
+    driver: str | None = os.environ.get("SDL_VIDEODRIVER")
+    os.environ["SDL_VIDEODRIVER"] = driver or "dummy"
+    try:
+        pygame.init()
+        results: Dict[str, Dict[str, float]] = {}
+        # the game prints as keys are used
+        with redirect_stdout(io.StringIO()):
+            for name in names or list(BENCHMARKS):
+                results[name] = measure(BENCHMARKS[name](), min_time)
+    finally:
+        if driver is None:
+            del os.environ["SDL_VIDEODRIVER"]
+    return {"host": platform.node(), "machine": platform.machine(),
+            "processor": platform.processor(), "python": platform.python_version(),
+            "pygame": pygame.version.ver, "benchmarks": results}
+
+
+def environment_differences(results: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """returns the ENVIRONMENT entries that differ between results and a
+    baseline, the timings are only comparable when there are none"""
+    return [key for key in ENVIRONMENT if results.get(key) != baseline.get(key)]
+
+
+def find_regressions(results: Dict[str, Any], baseline: Dict[str, Any],
+                     tolerance: float = TOLERANCE) -> Dict[str, float]:
+    """returns the benchmarks whose median got more than tolerance slower
+    than the baseline, with the slowdown (0.5 is 50% slower)"""
+    regressions: Dict[str, float] = {}
+    for name, measured in results["benchmarks"].items():
+        reference: Dict[str, float] | None = baseline["benchmarks"].get(name)
+        if reference is None or reference["p50"] <= 0:
+            continue
+        slowdown: float = measured["p50"] / reference["p50"] - 1
+        if slowdown > tolerance:
+            regressions[name] = slowdown
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the benchmarks, writes the results and compares them with the
+    baseline. Returns 1 if any benchmark regressed."""
+    parser = argparse.ArgumentParser(description="Benchmark the game loop, rendering and menus")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--output", default=None, help="JSON file for the results")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="results to compare with")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store the results as the new baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="slowdown of the median flagged as a regression")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME,
+                        help="seconds each benchmark is timed for")
+    args = parser.parse_args(argv)
+    unknown: List[str] = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    results: Dict[str, Any] = run_benchmarks(args.names, args.min_time)
+    for name, measured in results["benchmarks"].items():
+        print(f"{name:<24} {measured['per_second']:>10.0f}/s  p50 {measured['p50']:.3f} ms  "
+              f"p99 {measured['p99']:.3f} ms")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(results, output_file, indent=2)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save-baseline to store one")
+        return 0
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        baseline: Dict[str, Any] = json.load(baseline_file)
+    differences: List[str] = environment_differences(results, baseline)
+    if differences:
+        print(f"WARNING: {args.baseline} was recorded with a different "
+              f"{', '.join(differences)}, not comparing. Run with --save-baseline "
+              "to store one for this machine")
+        return 0
+    regressions: Dict[str, float] = find_regressions(results, baseline, args.tolerance)
+    for name, slowdown in regressions.items():
+        print(f"REGRESSION {name}: {slowdown:.0%} slower than the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())  # pragma: no cover
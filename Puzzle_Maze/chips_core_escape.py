@@ -5,13 +5,16 @@ __author__ = "Jessica Story"
 __date__ = "5/13/25"
 __license__ = "MIT"
 
-from typing import Optional
+from typing import List, Optional
 import sys
 import pygame
 from game_states import MainMenuState, ChipsCoreEscapeEvents
 from screen_state import ScreenState
 from game_screens import MainMenu, InfoScreen
 from game import Game
+from profiler import Profiler
+from frame_scheduler import FrameScheduler
+from replay import SessionRecorder
 
 
 class ChipsCoreEscape:
@@ -37,6 +40,9 @@ class ChipsCoreEscape:
         self._menu: MainMenu = MainMenu(self._screen)
         self._info: InfoScreen = InfoScreen(self._screen)
         self._state: ScreenState = MainMenuState()
+        self._profiler: Profiler = Profiler.from_environment()
+        self._scheduler: FrameScheduler = FrameScheduler()
+        self._recorder: SessionRecorder | None = SessionRecorder.from_environment()
 
     def _set_screen(self) -> pygame.Surface:
         pygame.init()
@@ -57,12 +63,33 @@ class ChipsCoreEscape:
         """
         self._state.handle_event(self, event)
 
+    def _draw_frame(self) -> None:
+        """Draws the current state and shows it. A state that presents its
+        own frame, like the game, already updated the areas it drew, so
+        only the overlay is sent after it
+        """
+        self.display_screen()
+        dirty_rects: List[pygame.Rect] = []
+        if self._profiler.overlay:
+            overlay: pygame.Rect | None = self._profiler.draw_overlay(self._screen)
+            if overlay is not None:
+                dirty_rects.append(overlay)
+        if not self._state.PRESENTS_FRAME:
+            pygame.display.update()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+        self._scheduler.drew(self._state)
+
     def chips_core_escape(self) -> None:
-        """Performs entire program
+        """Performs entire program. Menus are only drawn again after input,
+        and while nothing happens the loop sleeps waiting for events
         """
         while True:
-            self.display_screen()
-            for event in pygame.event.get():
+            if self._scheduler.should_draw(self._state):
+                self._draw_frame()
+            events = pygame.event.get() or self._scheduler.wait_for_events(self._state)
+            for event in events:
+                self._scheduler.notify()
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -70,7 +97,14 @@ class ChipsCoreEscape:
                     self.handle_user(ChipsCoreEscapeEvents.USER_CLICK)
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.handle_user(ChipsCoreEscapeEvents.ESCAPE)
-            pygame.display.update()
+                if event.type == pygame.VIDEORESIZE:
+                    self._menu.invalidate_layout()
+                    self._info.invalidate_layout()
+                if event.type == pygame.MOUSEMOTION:
+                    # both menus follow the mouse, so switching screens
+                    # shows the right item hovered
+                    self._menu.handle_mouse_motion(event)
+                    self._info.handle_mouse_motion(event)
 
     @property
     def play(self) -> Game:
@@ -83,12 +117,17 @@ class ChipsCoreEscape:
 
     @play.setter
     def play(self, game_obj: Game) -> None:
-        """Setter for play attribute
+        """Setter for play attribute, the replaced game is closed and the new
+        one is recorded when PUZZLE_MAZE_RECORD is set
 
         Args:
             game_obj: new game object
         """
+        if game_obj is not self._play:
+            self._play.close()
         self._play = game_obj
+        if self._recorder is not None:
+            self._recorder.start(game_obj)
 
     @property
     def info(self) -> InfoScreen:
@@ -6,6 +6,7 @@ __date__ = "5/13/25"
 __license__ = "MIT"
 
 from abc import ABC, abstractmethod
+from typing import List
 import pygame
 
 
@@ -275,3 +276,18 @@ class Drawable(ABC):
             object
         """
         self._data = data
+
+
+def union_rects(*rects: pygame.Rect | None) -> pygame.Rect | None:
+    """Returns the smallest rect covering the given rects
+
+    Args:
+        rects (pygame.Rect | None): rects to cover, None ones are skipped
+
+    Returns:
+        pygame.Rect | None: the covering rect, None if no rect was given
+    """
+    present: List[pygame.Rect] = [rect for rect in rects if rect is not None]
+    if not present:
+        return None
+    return present[0].unionall(present[1:])
@@ -5,11 +5,17 @@ __author__ = "Jessica Story"
 __date__ = "5/13/25"
 __license__ = "MIT"
 
+from collections import OrderedDict
+from typing import Tuple
 from typing_extensions import override
 import pygame
 from drawable import Drawable
 from text import Text
 from drawable_decorator import DrawableDecorator
+from text_cache import TextCache, TextKey
+
+# render key of the outline and the center it was placed at
+OutlineMemo = Tuple[TextKey, Tuple[float, float]]
 
 
 class Outline(DrawableDecorator):
@@ -30,19 +36,11 @@ class Outline(DrawableDecorator):
         super().__init__(drawable)
         self._outline_color: str = outline_color
         self._outline_size: float = outline_size
-        self._font: pygame.font.Font = pygame.font.Font(
-            self.drawable.image_dir, int(
-                self.original_size + self._outline_size
-            )
-        )
-        self._surface: pygame.Surface = self._font.render(
-            self.drawable.data, True, self._outline_color)
-
-        self._rect: pygame.Rect = self._surface.get_rect(
-            center=(
-                self.drawable.x_pos, self.drawable.y_pos
-            )
-        )
+        self._surface: pygame.Surface
+        self._rect: pygame.Rect
+        # what the surface was rendered with and where it was placed
+        self._memo: OutlineMemo | None = None
+        self._refresh()
 
     @override
     def draw(self) -> None:
@@ -65,25 +63,40 @@ class Outline(DrawableDecorator):
         """
         self.drawable.resize_screen()
         self.drawable._adjust_to_changes()
+        self._refresh()
 
-        self._font = pygame.font.Font(
-            self.drawable.image_dir, int(
-                self.original_size + self._outline_size
-            )
-        )
-        self.surface = self._font.render(self.drawable.data, True,
-                                         self._outline_color)
-        self.rect = self.surface.get_rect(
-            center=(
-                self.drawable.x_pos, self.drawable.y_pos
-            )
-        )
+    def _refresh(self) -> None:
+        """Renders the outline again if its text, size or color changed and
+        places it again if the screen size moved the text. Hovering changes
+        neither, so a hovered item draws the memoized surface.
+        """
+        key: TextKey = self._outline_key()
+        center: Tuple[float, float] = (self.drawable.x_pos, self.drawable.y_pos)
+        if self._memo == (key, center):
+            return
+        if self._memo is None or self._memo[0] != key:
+            self._surface = TextCache.get_instance().render(*key)
+        self._rect = self._surface.get_rect(center=center)
+        self._memo = (key, center)
+
+    def invalidate(self) -> None:
+        """Makes the next adjustment render and place the outline again
+        """
+        self._memo = None
+
+    def _outline_key(self) -> TextKey:
+        """returns the font, size, text and color the outline is rendered
+        with"""
+        return (self.drawable.image_dir, int(self.original_size + self._outline_size),
+                self.drawable.data, self._outline_color, True)
 
 
 class Button(DrawableDecorator):
     """Decorator for Drawable objects. Creates
         a button behind the object.
     """
+    # scaled copies of the button image kept for recent window sizes
+    SCALED_VARIANTS: int = 4
 
     def __init__(self, drawable: Drawable, image_dir: str) -> None:
         """Constructor for the Button Class
@@ -94,11 +107,21 @@ class Button(DrawableDecorator):
         """
         super().__init__(drawable)
         self._button_image_dir: str = image_dir
-        self._surface: pygame.Surface = pygame.image.load(
+        # the decoded image, every size is scaled from it so scaling
+        # never compounds
+        self._image: pygame.Surface = pygame.image.load(
             self._button_image_dir)
-
-        self._button_width: float = self._surface.get_size()[0]
-        self._button_height: float = self._surface.get_size()[1]
+        self._surface: pygame.Surface = self._image
+
+        self._image_width: float = self._image.get_size()[0]
+        self._image_height: float = self._image.get_size()[1]
+        self._button_width: float = self._image_width
+        self._button_height: float = self._image_height
+        # screen size the image size is meant for, and the one the button
+        # was last laid out for
+        self._base_screen: Tuple[int, int] = self.drawable.screen.get_size()
+        self._layout_screen: Tuple[int, int] = self._base_screen
+        self._scaled: OrderedDict[Tuple[int, int], pygame.Surface] = OrderedDict()
         self._rect: pygame.Rect = self._surface.get_rect(
             center=(
                 self.drawable.x_pos, self.drawable.y_pos))
@@ -121,20 +144,39 @@ class Button(DrawableDecorator):
     def _adjust_to_changes(self) -> None:
         """Implementation of the _adjust_to_changes function from base class
         """
-        screen_width, screen_height = self.drawable.screen.get_size()
-        change_in_screen_width, change_in_screen_height = (
-            screen_width / self.drawable.screen_width,
-            screen_height / self.drawable.screen_height
-        )
-        self._button_width = change_in_screen_width * self._button_width
-        self._button_height = change_in_screen_height * self._button_height
+        screen_size: Tuple[int, int] = self.drawable.screen.get_size()
+        if screen_size != self._layout_screen:
+            # only sized again when the window was resized
+            self._layout_screen = screen_size
+            self._button_width = \
+                self._image_width * screen_size[0] / self._base_screen[0]
+            self._button_height = \
+                self._image_height * screen_size[1] / self._base_screen[1]
+            self._surface = self._scaled_image(
+                (int(self._button_width), int(self._button_height)))
         self.drawable.resize_screen()
 
-        self._surface = pygame.transform.scale(
-            self._surface,
-            (self._button_width, self._button_height))
         self._rect = self._surface.get_rect(
             center=(
                 self.drawable.x_pos, self.drawable.y_pos
             )
         )
+
+    def _scaled_image(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Returns the button image at size, scaling the original image
+        only if no recent layout used that size
+
+        Args:
+            size (Tuple[int, int]): width and height of the button
+        """
+        if size == self._image.get_size():
+            return self._image
+        scaled: pygame.Surface | None = self._scaled.get(size)
+        if scaled is None:
+            scaled = pygame.transform.scale(self._image, size)
+            self._scaled[size] = scaled
+            if len(self._scaled) > self.SCALED_VARIANTS:
+                self._scaled.popitem(last=False)
+        else:
+            self._scaled.move_to_end(size)
+        return scaled
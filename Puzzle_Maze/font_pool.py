@@ -0,0 +1,132 @@
+"""Process wide pool of open fonts. Every Text and Outline of the menus uses
+the same font file at a handful of sizes, so they share one
+pygame.font.Font per (path, size) from here instead of parsing the file
+each time they open it. The least recently used fonts are closed once the
+pool holds more than its capacity, or more than max_bytes. pygame.quit
+closes every font, so the shared pool is dropped with it."""
+
+from collections import OrderedDict
+import os
+from typing import Dict, Optional, Tuple
+import pygame
+
+FontKey = Tuple[str, int]
+# open fonts kept, the menus use about a dozen sizes
+DEFAULT_CAPACITY: int = 32
+
+
+class FontPool:
+    """Singleton LRU pool of fonts keyed by path and integer size, with hit
+    and miss counters and an estimate of the memory it holds"""
+    _instance: Optional['FontPool'] = None
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, max_bytes: int | None = None) -> None:
+        """Constructor for FontPool
+
+        Args:
+            capacity (int): fonts kept open before the least recently used
+            one is dropped
+            max_bytes (int | None): memory the open fonts may use, unbounded
+            by default
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity: int = capacity
+        self.max_bytes: int | None = max_bytes
+        self._fonts: OrderedDict[FontKey, pygame.font.Font] = OrderedDict()
+        self._file_sizes: Dict[str, int] = {}
+        self._memory: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def get(self, path: str, size: float) -> pygame.font.Font:
+        """Returns the font at path opened at size, opening it on first use
+
+        Args:
+            path (str): path of the font file
+            size (float): font size, truncated like pygame.font.Font does
+        """
+        key: FontKey = (path, int(size))
+        font: pygame.font.Font | None = self._fonts.get(key)
+        if font is not None:
+            self._hits += 1
+            self._fonts.move_to_end(key)
+            return font
+        self._misses += 1
+        font = pygame.font.Font(path, key[1])
+        self._fonts[key] = font
+        self._memory += self._footprint(path)
+        self._evict()
+        return font
+
+    def _footprint(self, path: str) -> int:
+        """returns the memory an open font of path is counted as: FreeType
+        keeps the whole file in memory for every face it opens"""
+        if path not in self._file_sizes:
+            self._file_sizes[path] = os.path.getsize(path) if os.path.isfile(path) else 0
+        return self._file_sizes[path]
+
+    def _evict(self) -> None:
+        """Drops the least recently used fonts until the pool is within its
+        bounds, always keeping the font just opened"""
+        while len(self._fonts) > 1 and (
+                len(self._fonts) > self.capacity
+                or (self.max_bytes is not None and self._memory > self.max_bytes)):
+            (path, _), _ = self._fonts.popitem(last=False)
+            self._memory -= self._footprint(path)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Drops every font and resets the counters"""
+        self._fonts.clear()
+        self._memory = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fonts
+
+    @property
+    def memory_bytes(self) -> int:
+        """returns the estimated memory held by the open fonts"""
+        return self._memory
+
+    @property
+    def hits(self) -> int:
+        """returns how many requests were served by an open font"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """returns how many requests had to open a font"""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """returns how many fonts were dropped to stay within the bounds"""
+        return self._evictions
+
+    def stats(self) -> Dict[str, int]:
+        """returns the open fonts, memory and counters"""
+        return {"fonts": len(self._fonts), "memory_bytes": self._memory, "hits": self._hits,
+                "misses": self._misses, "evictions": self._evictions}
+
+    @classmethod
+    def get_instance(cls) -> 'FontPool':
+        """Returns the shared pool, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+            # rendering with a font after pygame.quit crashes, and pygame
+            # forgets its quit callbacks once called, so register each pool
+            pygame.register_quit(cls.reset_instance)
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Drops the shared pool, the next get_instance starts empty"""
+        cls._instance = None
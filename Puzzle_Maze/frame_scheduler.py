@@ -0,0 +1,103 @@
+"""Frame pacing for the main loop. Menus only change when the user does
+something, so instead of drawing as fast as possible the loop draws a
+frame after an event or a change of state, no faster than the MAX_FPS of
+the current state, and otherwise sleeps in pygame.event.wait until input
+arrives. States without a MAX_FPS, like playing, pace themselves and are
+drawn every iteration."""
+
+from typing import List
+import pygame
+from game_clock import GameClock, PygameClock
+from screen_state import ScreenState
+
+# longest sleep while nothing changed, the loop wakes this often at most
+IDLE_WAIT_MS: int = 1000
+
+
+class FrameScheduler:
+    """Decides when the main loop draws a frame and how long it may sleep
+    waiting for input"""
+
+    def __init__(self, clock: GameClock | None = None,
+                 idle_wait_ms: int = IDLE_WAIT_MS) -> None:
+        """Constructor for FrameScheduler
+
+        Args:
+            clock (GameClock | None): time source, real time by default
+            idle_wait_ms (int): longest sleep while nothing changed
+        """
+        if idle_wait_ms < 1:
+            raise ValueError(f"idle_wait_ms must be positive, got {idle_wait_ms}")
+        self._clock: GameClock = clock if clock is not None else PygameClock()
+        self.idle_wait_ms: int = idle_wait_ms
+        self._state: ScreenState | None = None
+        self._dirty: bool = True
+        self._next_frame: int = 0
+        self.frames: int = 0
+
+    def notify(self) -> None:
+        """Marks the screen as changed, for any input event
+        """
+        self._dirty = True
+
+    def should_draw(self, state: ScreenState) -> bool:
+        """Returns whether a frame is due in state
+
+        Args:
+            state (ScreenState): current state of the game
+        """
+        if state is not self._state:
+            # a new screen is shown at once, whatever the previous cap
+            self._state = state
+            self._dirty = True
+            self._next_frame = 0
+        if state.MAX_FPS is None:
+            return True
+        return self._dirty and self._clock.get_ticks() >= self._next_frame
+
+    def drew(self, state: ScreenState) -> None:
+        """Records a frame drawn in state
+
+        Args:
+            state (ScreenState): state the frame was drawn in
+        """
+        self.frames += 1
+        self._state = state
+        self._dirty = False
+        if state.MAX_FPS is not None:
+            self._next_frame = self._clock.get_ticks() + 1000 // state.MAX_FPS
+
+    def timeout(self, state: ScreenState) -> int | None:
+        """Returns how long the loop may sleep waiting for input, None when
+        it must not sleep
+
+        Args:
+            state (ScreenState): current state of the game
+        """
+        if state.MAX_FPS is None:
+            return None
+        if self._dirty:
+            return max(1, self._next_frame - self._clock.get_ticks())
+        return self.idle_wait_ms
+
+    def wait_for_events(self, state: ScreenState) -> List[pygame.event.Event]:
+        """Sleeps until an event arrives or the timeout of state passes
+
+        Args:
+            state (ScreenState): current state of the game
+
+        Returns:
+            List[pygame.event.Event]: the event that woke the loop, if any
+        """
+        timeout: int | None = self.timeout(state)
+        if timeout is None:
+            return []
+        event: pygame.event.Event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event]
+
+    @property
+    def dirty(self) -> bool:
+        """returns whether something changed since the last frame"""
+        return self._dirty
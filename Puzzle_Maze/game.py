@@ -1,23 +1,47 @@
-from typing import List, Dict, Tuple
+from collections import OrderedDict
+from typing import List, Dict, Sequence, Tuple, Union
 import pygame
 import sys
 import os
 from pygame.locals import QUIT
-from GameObjects import Player, Enemy, Door, TILE_SIZE, LockedDoorState
-from GameObjects import TILE_EMPTY, TILE_WALL, TILE_GOAL, TILE_KEY
+from GameObjects import GameObject, Player, Enemy, Door, TILE_SIZE, LockedDoorState
+from GameObjects import UnlockedDoorState
+from GameObjects import load_tile_image, index_doors, find_door
+from GameObjects import TILE_DOOR, TILE_EMPTY, TILE_UNLOCKED
+from maze_grid import MazeGrid, MazeLike
+from asset_cache import AssetCache
+from game_clock import GameClock, PygameClock, SimulatedClock
+from game_input import InputSource, KeyboardInput, ScriptedInput
+from renderer import DirtyRectRenderer
+from tile_layer import TileLayer
+from level_format import LevelData, LevelPack, DOOR_UNLOCKED
+from level_archive import LevelArchive, open_levels
 # Constants
 GRID_WIDTH: int = 12
 GRID_HEIGHT: int = 12
 WIDTH: int = TILE_SIZE * GRID_WIDTH
 HEIGHT: int = TILE_SIZE * GRID_HEIGHT
 FPS: int = 60
+# the game logic runs in fixed steps of STEP_MS, whatever the frame rate
+STEP_MS: int = 20
+# steps a frame may run to catch up, the rest of a long stall is dropped
+MAX_STEPS_PER_FRAME: int = 10
 ASSET_DIR: str = "assets"
+LEVEL_DIR: str = "levels"
+DEFAULT_LEVEL_PACK: str = os.path.join(LEVEL_DIR, "default.jsonl")
+# tile layers of recently visited levels kept, each is a screen sized surface
+TILE_LAYER_CAPACITY: int = 4
+
+# levels as a pack read from disk, or a list of levels or bare tiles
+LevelSource = Sequence[Union[LevelData, List[List[int]]]]
 
 # Tile management
 
 
 class TileSet:
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False) -> None:
+        # a headless game's tiles are blank, no image is decoded
+        self.headless: bool = headless
         self.tiles: List[str] = ['empty', 'wall', 'goal', 'door', 'key', 'door_unlocked']
         self.images: Dict[str, pygame.Surface] = self._load_images()
 
@@ -27,12 +51,16 @@ class TileSet:
         def load_or_color(name: str, fallback_color: Tuple[int, int, int]) -> pygame.Surface:
             path: str = os.path.join(ASSET_DIR, f"{name}.png")
             if os.path.exists(path):
-                img: pygame.Surface = pygame.image.load(path).convert_alpha()
-                img = pygame.transform.scale(img, (TILE_SIZE, TILE_SIZE))
+                img: pygame.Surface = load_tile_image(path, self.headless)
                 if name in {"key", "goal", "door", "door_unlocked"}:
-                    base: pygame.Surface = images["empty"].copy()
-                    base.blit(img, (0, 0))
-                    return base
+                    def composite() -> pygame.Surface:
+                        base: pygame.Surface = images["empty"].copy()
+                        base.blit(img, (0, 0))
+                        return base
+                    # composited tiles are shared through the asset cache as well,
+                    # keyed apart from headless games whose tiles are blank
+                    return AssetCache.get_instance().get(("tile", name, self.headless),
+                                                         composite)
                 return img
             surf: pygame.Surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
             surf.fill(fallback_color)
@@ -60,142 +88,170 @@ class TileSet:
 
 
 class Game:
-    def __init__(self) -> None:
-        self.screen: pygame.Surface = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Tile Puzzle")
-        self.clock: pygame.time.Clock = pygame.time.Clock()
+    def __init__(self, headless: bool = False, clock: GameClock | None = None,
+                 input_source: InputSource | None = None,
+                 level_pack: str = DEFAULT_LEVEL_PACK,
+                 levels: LevelSource | None = None) -> None:
+        """A headless game never opens a window or sleeps: it draws nothing,
+        reads keys from a ScriptedInput and time from a SimulatedClock unless
+        others are passed in. Levels come from the level_pack file, either a
+        JSON Lines pack or a binary .pmla archive, unless the levels
+        themselves are passed in, then no file is opened."""
+        self.headless: bool = headless
+        if headless:
+            self.screen: pygame.Surface = pygame.Surface((WIDTH, HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            pygame.display.set_caption("Tile Puzzle")
+        if clock is None:
+            clock = SimulatedClock() if headless else PygameClock()
+        self.clock: GameClock = clock
+        if input_source is None:
+            input_source = ScriptedInput() if headless else KeyboardInput()
+        self.input_source: InputSource = input_source
+        self.game_over: bool = False
+        self.won: bool = False
 
-        self.tileset: TileSet = TileSet()
-        self.levels: List[List[List[int]]] = self.load_levels()
+        self.tileset: TileSet = TileSet(headless)
+        # levels are read one at a time from the pack when they are loaded,
+        # an archive stays mapped until the game is closed
+        self.level_pack: str = level_pack
+        self._level_file: LevelPack | LevelArchive | None = None
+        if levels is None:
+            self._level_file = open_levels(level_pack)
+            levels = self._level_file
+        self.levels: LevelSource = levels
         self.level_index: int = 0
 
         ###############################
         # added to hold a list of doors
         self.doors: List[Door] = []
+        # the same doors indexed by (row, col) for constant time lookups
+        self.door_index: Dict[Tuple[int, int], Door] = {}
         # if an object class is created for keys and goals as well, could
         # create an object array in the same way and simplify updates
         ###############################
         self.door_unlock_time: int | None = None
+        # simulated ms, advanced by STEP_MS per logic step, and the frame
+        # time not simulated yet
+        self.sim_time: int = 0
+        self.accumulator: int = 0
+        self.renderer: DirtyRectRenderer = DirtyRectRenderer()
+        # static tile layers of the last levels visited, least recently used
+        # first, so going back to a level does not render it again
+        self.tile_layers: OrderedDict[int, TileLayer] = OrderedDict()
         self.load_level(self.level_index)
 
     def load_levels(self) -> List[List[List[int]]]:
-        return [
-            [
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 0, 0, 0, 0, 0, 0, 0, 3, 0, 2, 1],
-                [1, 0, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1],
-                [1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 1],
-                [1, 0, 1, 0, 1, 0, 0, 1, 0, 0, 0, 1],
-                [1, 0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1],
-                [1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 1],
-                [1, 0, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1],
-                [1, 0, 0, 0, 4, 0, 0, 0, 0, 1, 0, 1],
-                [1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1],
-                [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1],
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-            ],
-            [
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 1],
-                [1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1],
-                [1, 0, 1, 0, 0, 1, 0, 1, 0, 0, 0, 1],
-                [1, 0, 1, 2, 0, 1, 0, 1, 0, 1, 1, 1],
-                [1, 0, 1, 1, 3, 1, 0, 1, 0, 0, 0, 1],
-                [1, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 1],
-                [1, 0, 1, 1, 1, 1, 0, 0, 0, 1, 0, 1],
-                [1, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1],
-                [1, 0, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1],
-                [1, 0, 4, 0, 0, 0, 0, 0, 0, 0, 4, 1],
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-            ],
-            [
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1],
-                [1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 0, 1],
-                [1, 0, 3, 4, 0, 0, 0, 0, 1, 0, 0, 1],
-                [1, 0, 1, 1, 1, 1, 1, 0, 1, 1, 0, 1],
-                [1, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1],
-                [1, 0, 1, 1, 1, 0, 1, 1, 0, 1, 0, 1],
-                [1, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 1],
-                [1, 0, 1, 0, 1, 1, 0, 0, 0, 1, 4, 1],
-                [1, 3, 1, 0, 0, 0, 0, 1, 0, 1, 0, 1],
-                [1, 2, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1],
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-            ]
-        ]
+        """Returns the tiles of every level in the game's level pack, or of
+        the levels it was made with. This reads the whole pack, the game
+        itself reads levels lazily through self.levels."""
+        if self._level_file is None:
+            return [level.tiles if isinstance(level, LevelData) else level
+                    for level in self.levels]
+        with open_levels(self.level_pack) as levels:
+            return [level.tiles for level in levels]
+
+    def close(self) -> None:
+        """Closes the level pack the game was made with, if it opened one"""
+        if self._level_file is not None:
+            self._level_file.close()
+
+    def __enter__(self) -> 'Game':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def maze(self) -> MazeGrid:
+        """returns the grid of the current level"""
+        return self._maze
+
+    @maze.setter
+    def maze(self, maze: MazeLike) -> None:
+        """Sets the grid of the current level, nested lists are copied
+        into a MazeGrid"""
+        self._maze: MazeGrid = MazeGrid.coerce(maze)
 
     def load_level(self, index: int) -> None:
-        self.maze: List[List[int]] = self.levels[index]
+        level: LevelData | List[List[int]] = self.levels[index]
+        if not isinstance(level, LevelData):
+            # bare tiles, as the levels used to be stored
+            level = LevelData(level)
+        # the grid is a copy, so the level itself is left untouched
+        self.maze = MazeGrid.from_rows(level.tiles)
         ###############################
         self.doors = []  # reset list of doors for the level
-        self.player: Player = Player((1 * TILE_SIZE, 1 * TILE_SIZE))
+        player_row, player_col = level.player
+        self.player: Player = Player((player_col * TILE_SIZE, player_row * TILE_SIZE),
+                                     headless=self.headless)
 
-        if index == 2:
-            self.enemies = [
-                Enemy((1 * TILE_SIZE, 10 * TILE_SIZE), velocity=-1),
-                Enemy((10 * TILE_SIZE, 1 * TILE_SIZE), velocity=1)
-            ]
-        else:
-            self.enemies = [
-                Enemy((6 * TILE_SIZE, 3 * TILE_SIZE), velocity=-1),
-                Enemy((1 * TILE_SIZE, 6 * TILE_SIZE), velocity=1)
-            ]
+        self.enemies = [
+            Enemy((spawn.col * TILE_SIZE, spawn.row * TILE_SIZE), velocity=spawn.velocity,
+                  headless=self.headless)
+            for spawn in level.enemies
+        ]
 
         ###############################
         # initialize the position of all the doors on the level:
-        for row in range(len(self.maze)):
-            for col in range(len(self.maze[0])):
-                if self.maze[row][col] == 3:
-                    door_pos: Tuple[int, int] = (col * TILE_SIZE, row * TILE_SIZE)
-                    door: Door = Door(door_pos, LockedDoorState())
-                    self.doors.append(door)
+        for row, col in self.maze.positions_of(TILE_DOOR):
+            door_pos: Tuple[int, int] = (col * TILE_SIZE, row * TILE_SIZE)
+            if level.door_state(row, col) == DOOR_UNLOCKED:
+                door: Door = Door(door_pos, UnlockedDoorState(), self.headless)
+                door.change_img(load_tile_image("assets/door_unlocked.png", self.headless))
+                # an open door is walked through like an empty tile
+                self.maze[row, col] = TILE_EMPTY
+            else:
+                door = Door(door_pos, LockedDoorState(), self.headless)
+            self.doors.append(door)
+        self.door_index = index_doors(self.doors)
 
         self.door_unlock_time = None
+        self.renderer.invalidate()
 
     def draw(self) -> None:
-        self.screen.fill((0, 0, 0))
-        for row in range(len(self.maze)):
-            for col in range(len(self.maze[row])):
-                tile_value: int = self.maze[row][col]
-                ###################################
-                # need to add in the empty tile image behind doors:
-                if tile_value in {TILE_WALL, TILE_GOAL, TILE_KEY}:
-                    tile_img: pygame.Surface = self.tileset.get_image(tile_value)
-                else:
-                    # filles in the empty and tilespots behind doors:
-                    tile_img = self.tileset.get_image(TILE_EMPTY)
-                # tile_img = self.tileset.images['door_unlocked']
-                # if tile_value == 5 else self.tileset.get_image(tile_value)
-                self.screen.blit(tile_img, (col * TILE_SIZE, row * TILE_SIZE))
-
-        #####################################
-        # draw all the doors after tiles and walls drawn
-        for door in self.doors:
-            door.draw(self.screen)
-        ####################################
-
-        # maybe in future add an array of all objects to be drawn on top of empty tiles
-
-        self.player.draw(self.screen)
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
-        pygame.display.flip()
+        """Draws the frame through the dirty rect renderer, only the areas
+        that changed are sent to the display"""
+        tile_layer: TileLayer = self.tile_layer
+        for rect in tile_layer.sync(self.maze):
+            self.renderer.mark_dirty(rect)
+        if self.renderer.background is not tile_layer.surface:
+            self.renderer.set_background(tile_layer.surface)
+
+        # doors are drawn after tiles and walls, then the player and enemies
+        objects: List[GameObject] = [*self.doors, self.player, *self.enemies]
+        dirty_rects: List[pygame.Rect] = self.renderer.render(self.screen, objects)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+
+    @property
+    def tile_layer(self) -> TileLayer:
+        """returns the cached tile layer of the current level, rendering it
+        the first time the level is drawn. Only the TILE_LAYER_CAPACITY
+        most recently drawn levels keep theirs."""
+        tile_layer: TileLayer | None = self.tile_layers.get(self.level_index)
+        if tile_layer is None:
+            tile_layer = TileLayer(self.tileset, self.maze)
+            self.tile_layers[self.level_index] = tile_layer
+            if len(self.tile_layers) > TILE_LAYER_CAPACITY:
+                self.tile_layers.popitem(last=False)
+        else:
+            self.tile_layers.move_to_end(self.level_index)
+        return tile_layer
 
     def update(self) -> None:
-        if self.door_unlock_time and pygame.time.get_ticks() - self.door_unlock_time > 300:
-            for r in range(len(self.maze)):
-                for c in range(len(self.maze[r])):
-                    if self.maze[r][c] == 5:
-                        self.maze[r][c] = 0
+        if self.door_unlock_time and self.sim_time - self.door_unlock_time > 300:
+            self.maze.replace(TILE_UNLOCKED, TILE_EMPTY)
             self.door_unlock_time = None
 
         row: int = self.player.rect.top // TILE_SIZE
         col: int = self.player.rect.left // TILE_SIZE
         tile_name: str = self.tileset.get_tile_name(self.maze[row][col])
         ######################################
-        for door in self.doors:
-            if self.player.collides_with(door):
-                door.interact(self.player, self.maze)
+        door: Door | None = find_door(self.door_index, row, col)
+        if door is not None:
+            door.interact(self.player, self.maze)
 
         if tile_name == 'goal':
             print("Level complete!")
@@ -204,6 +260,10 @@ class Game:
                 self.load_level(self.level_index)
             else:
                 print("You won all levels!")
+                self.won = True
+                self.game_over = True
+                if self.headless:
+                    return
                 pygame.quit()
                 sys.exit()
 
@@ -216,12 +276,56 @@ class Game:
             self.single_iteration()
 
     def single_iteration(self) -> None:
-        self.player.update(self.maze, self.doors)
+        """One frame: the time since the last frame is simulated in fixed
+        steps, then the frame is drawn once. A slow frame runs several steps
+        with the keys held now, a fast one may run none."""
+        self.accumulator += self.clock.tick(FPS)
+        steps: int = 0
+        while self.accumulator >= STEP_MS and not self.game_over:
+            if steps == MAX_STEPS_PER_FRAME:
+                self.accumulator = 0
+                break
+            self.step()
+            self.accumulator -= STEP_MS
+            steps += 1
+        if not self.headless:
+            self.draw()
+
+    def step(self) -> None:
+        """Advances the game logic by STEP_MS. Movement delays are measured
+        in simulated time, so the same inputs always give the same game."""
+        self.sim_time += STEP_MS
+        self.player.update(self.maze, self.door_index, self.input_source.get_pressed(),
+                           self.sim_time)
         for enemy in self.enemies:
-            enemy.update(self.maze, self.player)
+            enemy.update(self.maze, self.player, self.sim_time)
+            if enemy.caught_player and not self.game_over:
+                self.game_over = True
+                # ADDED to make return to main menu with player death
+                # Will return if player presses escape or dies, as an escape key click is mocked
+                # (a headless game has no event queue, it checks game_over instead)
+                if not self.headless:
+                    mock_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+                    pygame.event.post(mock_event)
         self.update()
-        self.draw()
-        self.clock.tick(FPS)
+
+    def run_steps(self, count: int) -> int:
+        """Runs up to count logic steps without a clock or drawing, as fast
+        as possible, stopping when the game is over. Returns the steps run."""
+        steps: int = 0
+        while not self.game_over and steps < count:
+            self.step()
+            steps += 1
+        return steps
+
+    def run_headless(self, max_iterations: int) -> int:
+        """Steps the game until it is over or max_iterations is reached,
+        returns the number of iterations run"""
+        iterations: int = 0
+        while not self.game_over and iterations < max_iterations:
+            self.single_iteration()
+            iterations += 1
+        return iterations
 
     @staticmethod
     def game_loop() -> None:
@@ -0,0 +1,59 @@
+"""Clock classes used by the game loop. The pygame clock follows real time,
+while the simulated clock only advances when it is ticked so a headless
+game can run as fast as the CPU allows."""
+
+from abc import ABC, abstractmethod
+import pygame
+
+
+class GameClock(ABC):
+    """Interface for the clock a Game reads time from"""
+
+    @abstractmethod
+    def get_ticks(self) -> int:
+        """returns the number of milliseconds since the clock started"""
+
+    @abstractmethod
+    def tick(self, framerate: int = 0) -> int:
+        """marks the end of a frame, returns the milliseconds since the
+        previous call"""
+
+
+class PygameClock(GameClock):
+    """Real time clock backed by pygame.time"""
+
+    def __init__(self) -> None:
+        self._clock: pygame.time.Clock = pygame.time.Clock()
+
+    def get_ticks(self) -> int:
+        return pygame.time.get_ticks()
+
+    def tick(self, framerate: int = 0) -> int:
+        """sleeps to cap the framerate, like pygame.time.Clock.tick"""
+        return self._clock.tick(framerate)
+
+
+class SimulatedClock(GameClock):
+    """Clock that never sleeps. Each tick advances the time by one frame of
+    the requested framerate (or by the step passed in at construction)."""
+
+    def __init__(self, start: int = 0, step: int | None = None) -> None:
+        self._ticks: int = start
+        self._step: int | None = step
+
+    def get_ticks(self) -> int:
+        return self._ticks
+
+    def tick(self, framerate: int = 0) -> int:
+        if self._step is not None:
+            elapsed = self._step
+        elif framerate > 0:
+            elapsed = 1000 // framerate
+        else:
+            elapsed = 0
+        self._ticks += elapsed
+        return elapsed
+
+    def advance(self, milliseconds: int) -> None:
+        """moves the clock forward without ending a frame"""
+        self._ticks += milliseconds
@@ -0,0 +1,70 @@
+"""Input sources for the player. The keyboard source reads pygame's key
+state, the scripted source is driven by code (bots, regression runs) and
+does not need a display."""
+
+from abc import ABC, abstractmethod
+from typing import FrozenSet, Iterable, Protocol
+import pygame
+
+
+class KeyState(Protocol):
+    """Anything indexable by a pygame key constant, such as the result of
+    pygame.key.get_pressed()"""
+
+    def __getitem__(self, key: int) -> bool:
+        ...
+
+
+class PressedKeys:
+    """Immutable set of pressed keys that can be indexed like
+    pygame.key.get_pressed()"""
+
+    def __init__(self, keys: Iterable[int] = ()) -> None:
+        self._keys: FrozenSet[int] = frozenset(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._keys
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PressedKeys) and self._keys == other._keys
+
+    def __hash__(self) -> int:
+        return hash(self._keys)
+
+    @property
+    def keys(self) -> FrozenSet[int]:
+        """returns the pressed key constants"""
+        return self._keys
+
+
+class InputSource(ABC):
+    """Interface for whatever tells the player which keys are held down"""
+
+    @abstractmethod
+    def get_pressed(self) -> KeyState:
+        """returns the current key state"""
+
+
+class KeyboardInput(InputSource):
+    """Reads the real keyboard through pygame"""
+
+    def get_pressed(self) -> KeyState:
+        return pygame.key.get_pressed()
+
+
+class ScriptedInput(InputSource):
+    """Input source whose pressed keys are set by code"""
+
+    def __init__(self, keys: Iterable[int] = ()) -> None:
+        self._pressed: PressedKeys = PressedKeys(keys)
+
+    def press(self, *keys: int) -> None:
+        """replaces the held keys with the given ones"""
+        self._pressed = PressedKeys(keys)
+
+    def release(self) -> None:
+        """releases every key"""
+        self._pressed = PressedKeys()
+
+    def get_pressed(self) -> KeyState:
+        return self._pressed
@@ -47,6 +47,9 @@ class MainMenu(Screen):
         self._menu_text: GameText = GameText(
             self._screen, "Chip's Core Escape", self.X_FACTOR, self.Y_FACTOR_MENU_TEXT,
             (self.screen_width * self.FACTOR_FOR_MAIN_TEXT_SIZE))
+        for widget in (self._menu_text, self._play_button, self._info_button,
+                       self._quit_button):
+            self.add_widget(widget)
 
     @override
     def adjust_to_screen(self) -> None:
@@ -59,15 +62,19 @@ class MainMenu(Screen):
         self._menu_text.text.size = self.screen_width * self.FACTOR_FOR_MAIN_TEXT_SIZE
 
     @override
-    def draw_screen(self) -> None:
-        """Draws the main menu screen for a single iteration
+    def draw_background(self) -> None:
+        """Draws the scaled background picture
         """
-        self.adjust_to_screen()
         self._screen.blit(self._scaled_picture, (0, 0))
-        self._menu_text.draw()
-        self._play_button.draw()
-        self._info_button.draw()
-        self._quit_button.draw()
+
+    @override
+    def draw_screen(self) -> None:
+        """Draws the main menu screen for a single iteration, the
+        background is only scaled again when the window size changed and
+        only the buttons that changed are drawn again
+        """
+        self.update_layout()
+        self._scene.draw()
 
     @property
     def background_picture(self) -> pygame.Surface:
@@ -179,6 +186,9 @@ class InfoScreen(Screen):
 
         self._back_button: GameButton = GameButton(
             screen, "Back", self.X_FACTOR, self.Y_FACTOR_BACK_BUTTON)
+        for widget in (self._main_text, self._body_text_line1, self._body_text_line2,
+                       self._body_text_line3, self._body_text_line4, self._back_button):
+            self.add_widget(widget)
 
     @override
     def adjust_to_screen(self) -> None:
@@ -188,19 +198,18 @@ class InfoScreen(Screen):
         self._main_text.text.size = self.screen_width * self.FACTOR_FOR_TEXT_SIZE
 
     @override
-    def draw_screen(self) -> None:
-        """Draws single iteration of the info screen
+    def draw_background(self) -> None:
+        """Fills the screen with the background color
         """
-        self.adjust_to_screen()
         self.screen.fill(self.BACKGROUND_COLOR)
-        self._main_text.draw()
-
-        self._body_text_line1.draw()
-        self._body_text_line2.draw()
-        self._body_text_line3.draw()
-        self._body_text_line4.draw()
 
-        self._back_button.draw()
+    @override
+    def draw_screen(self) -> None:
+        """Draws single iteration of the info screen, only the text
+        that changed is drawn again
+        """
+        self.update_layout()
+        self._scene.draw()
 
     @property
     def main_text(self) -> GameText:
@@ -27,6 +27,8 @@ class ChipsCoreEscapeEvents(Enum):
 class InfoState(ScreenState):
     """The concrete state class of info
     """
+    MAX_FPS: int | None = 30
+
     @override
     def display_screen(self, outer_class: Any) -> None:
         """Method to display screen in the info state
@@ -62,6 +64,8 @@ class InfoState(ScreenState):
 class MainMenuState(ScreenState):
     """The concrete state class of main menu
     """
+    MAX_FPS: int | None = 30
+
     @override
     def display_screen(self, outer_class: Any) -> None:
         """Method to display screen in the main menu state
@@ -109,6 +113,8 @@ class MainMenuState(ScreenState):
 class PlayState(ScreenState):
     """The concrete state class of play
     """
+    PRESENTS_FRAME: bool = True
+
     @override
     def display_screen(self, outer_class: Any) -> None:
         """Method to display screen in the play state
@@ -0,0 +1,119 @@
+"""Screen level hover detection. Instead of every widget asking pygame for
+the mouse position each frame, the screen hands MOUSEMOTION events to its
+HoverDispatcher, which finds the widget under the cursor through a grid of
+cells and tells widgets they are hovered or idle only when that changes."""
+
+from typing import Dict, List, Sequence, Tuple
+import pygame
+from interactive_text import InteractiveText
+
+Cell = Tuple[int, int]
+# side of a grid cell in pixels, about the height of a menu button
+DEFAULT_CELL_SIZE: int = 64
+
+
+class HoverDispatcher:
+    """Hit tests the mouse position against the widgets of a screen and
+    sends HOVER and IDLE events to the widgets it enters and leaves"""
+
+    def __init__(self, widgets: Sequence[InteractiveText] = (),
+                 cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        """Constructor for HoverDispatcher
+
+        Args:
+            widgets (Sequence[InteractiveText]): widgets in the order they
+            are drawn, later ones are on top
+            cell_size (int): side of a grid cell in pixels
+        """
+        if cell_size < 1:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size: int = cell_size
+        self._widgets: List[InteractiveText] = list(widgets)
+        # widgets overlapping each cell, built from the rects in _rects
+        self._cells: Dict[Cell, List[InteractiveText]] = {}
+        self._rects: Dict[int, pygame.Rect] = {}
+        self._stale: bool = True
+        self._hovered: InteractiveText | None = None
+
+    def add(self, widget: InteractiveText) -> None:
+        """Registers a widget drawn above the ones already registered
+
+        Args:
+            widget (InteractiveText): widget to hit test
+        """
+        self._widgets.append(widget)
+        self._stale = True
+
+    def invalidate(self) -> None:
+        """Builds the grid again from the widget rects on the next mouse
+        move, for when the layout moved them
+        """
+        self._stale = True
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Hit tests MOUSEMOTION events, other events are ignored
+
+        Args:
+            event (pygame.event.Event): event from the event queue
+        """
+        if event.type == pygame.MOUSEMOTION:
+            self.move_to(event.pos)
+
+    def move_to(self, position: Tuple[int, int]) -> None:
+        """Hovers the widget under position and makes the previously
+        hovered widget idle, if they differ
+
+        Args:
+            position (Tuple[int, int]): mouse position on the screen
+        """
+        widget: InteractiveText | None = self.widget_at(
+            (int(position[0]), int(position[1])))
+        if widget is self._hovered:
+            return
+        if self._hovered is not None:
+            self._hovered.set_hovered(False)
+        if widget is not None:
+            widget.set_hovered(True)
+        self._hovered = widget
+
+    def widget_at(self, position: Tuple[int, int]) -> InteractiveText | None:
+        """Returns the topmost widget whose rect contains position
+
+        Args:
+            position (Tuple[int, int]): point on the screen
+        """
+        if self._stale:
+            self._build()
+        cell: Cell = (position[0] // self.cell_size, position[1] // self.cell_size)
+        for widget in reversed(self._cells.get(cell, [])):
+            if self._rects[id(widget)].collidepoint(position):
+                return widget
+        return None
+
+    def _build(self) -> None:
+        """Files every widget under each cell its rect overlaps"""
+        self._cells = {}
+        self._rects = {}
+        for widget in self._widgets:
+            rect: pygame.Rect | None = widget.hit_rect
+            if rect is None or rect.width <= 0 or rect.height <= 0:
+                continue
+            self._rects[id(widget)] = pygame.Rect(rect)
+            for column in range(rect.left // self.cell_size,
+                                (rect.right - 1) // self.cell_size + 1):
+                for row in range(rect.top // self.cell_size,
+                                 (rect.bottom - 1) // self.cell_size + 1):
+                    self._cells.setdefault((column, row), []).append(widget)
+        self._stale = False
+
+    @property
+    def hovered(self) -> InteractiveText | None:
+        """returns the widget under the cursor, if any"""
+        return self._hovered
+
+    @property
+    def cell_count(self) -> int:
+        """returns how many cells of the grid hold a widget"""
+        if self._stale:
+            self._build()
+        return len(self._cells)
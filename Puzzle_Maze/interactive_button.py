@@ -8,9 +8,10 @@ __license__ = "MIT"
 import pygame
 from typing_extensions import override
 from drawable_decorators import Button
+from drawable import union_rects
 from interactive_text import InteractiveText
 from interactive_drawable_state import InteractiveDrawableState
-from interactive_button_states import ButtonEvents, IdleButton
+from interactive_button_states import ButtonEvents, HoverButton, IdleButton
 
 
 class InteractiveButton(InteractiveText):
@@ -41,7 +42,9 @@ class InteractiveButton(InteractiveText):
                          text_to_place, color, hover_color, outline_color,
                          outline_size)
         self._button = Button(self._text, button_image_dir)
-        self.state: InteractiveDrawableState = IdleButton(self._button)
+        self._idle_state = IdleButton(self._button)
+        self._hover_state = HoverButton(self._button)
+        self.state: InteractiveDrawableState = self._idle_state
 
     @property
     def button(self) -> Button:
@@ -53,15 +56,33 @@ class InteractiveButton(InteractiveText):
         """
         return self._button
 
+    @property
+    @override
+    def hit_rect(self) -> pygame.Rect | None:
+        """Getter for the area that reacts to the mouse
+
+        Returns:
+            rect (pygame.Rect | None): rect of the button
+        """
+        return self._button.rect
+
+    @property
     @override
-    def handle_mouse_position(self) -> None:
-        """Determines when text is in a hover and idle state
-           based on user's mouse position in relation to
-           instance variables
+    def bounds(self) -> pygame.Rect | None:
+        """Getter for the area the button draws on in either state
+
+        Returns:
+            rect (pygame.Rect | None): union of the rects of
+            the button, the text and its outline
+        """
+        return union_rects(self._button.rect, self._text.rect, self._outline.rect)
+
+    @override
+    def set_hovered(self, hovered: bool) -> None:
+        """Sends the hover or idle event, called by the screen's
+           HoverDispatcher when the mouse enters or leaves the button
+
+        Args:
+            hovered (bool): whether the mouse is over the button
         """
-        if self._button.rect is not None:
-            mouse_pos = pygame.mouse.get_pos()
-            if (self._button.rect.collidepoint(mouse_pos)):
-                super().handle_event(ButtonEvents.HOVER)
-            else:
-                super().handle_event(ButtonEvents.IDLE)
+        self.handle_event(ButtonEvents.HOVER if hovered else ButtonEvents.IDLE)
@@ -43,7 +43,7 @@ class IdleButton(InteractiveDrawableState):
         if event == ButtonEvents.HOVER:
             outer_class.button.drawable = outer_class.outline
             outer_class.text.color = outer_class.hover_color
-            outer_class.state = HoverButton(outer_class.button)
+            outer_class.state = outer_class.hover_state
 
 
 class HoverButton(InteractiveDrawableState):
@@ -69,4 +69,4 @@ class HoverButton(InteractiveDrawableState):
         if event == ButtonEvents.IDLE:
             outer_class.button.drawable = outer_class.text
             outer_class.text.color = outer_class.color
-            outer_class.state = IdleButton(outer_class.button)
+            outer_class.state = outer_class.idle_state
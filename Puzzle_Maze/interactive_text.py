@@ -8,8 +8,9 @@ __license__ = "MIT"
 import pygame
 from typing_extensions import override
 from interactive_drawable import InteractiveDrawable
-from interactive_text_states import IdleText, TextEvents
+from interactive_text_states import HoverText, IdleText, TextEvents
 from text import Text
+from drawable import union_rects
 from drawable_decorators import Outline
 from interactive_drawable_state import InteractiveDrawableState
 
@@ -44,7 +45,10 @@ class InteractiveText(InteractiveDrawable):
         self._hover_color: str = hover_color
         self._color: str = color
         self._outline = Outline(self._text, outline_color, outline_size)
-        self.state: InteractiveDrawableState = IdleText(self._text)
+        # built once, transitions switch between them
+        self._idle_state: InteractiveDrawableState = IdleText(self._text)
+        self._hover_state: InteractiveDrawableState = HoverText(self._outline)
+        self.state: InteractiveDrawableState = self._idle_state
 
     @property
     def text(self) -> Text:
@@ -65,6 +69,45 @@ class InteractiveText(InteractiveDrawable):
         """
         return self._outline
 
+    @property
+    def idle_state(self) -> InteractiveDrawableState:
+        """Getter for idle state variable
+
+        Returns:
+            _idle_state (InteractiveDrawableState): state used while
+            the mouse is elsewhere
+        """
+        return self._idle_state
+
+    @property
+    def hover_state(self) -> InteractiveDrawableState:
+        """Getter for hover state variable
+
+        Returns:
+            _hover_state (InteractiveDrawableState): state used while
+            the mouse is over the element
+        """
+        return self._hover_state
+
+    @property
+    def hit_rect(self) -> pygame.Rect | None:
+        """Getter for the area that reacts to the mouse
+
+        Returns:
+            rect (pygame.Rect | None): rect of the text
+        """
+        return self._text.rect
+
+    @property
+    def bounds(self) -> pygame.Rect | None:
+        """Getter for the area the element draws on in either state
+
+        Returns:
+            rect (pygame.Rect | None): union of the rects of
+            the text and its outline
+        """
+        return union_rects(self._text.rect, self._outline.rect)
+
     @property
     def hover_color(self) -> str:
         """Getter for hover color variable
@@ -84,20 +127,22 @@ class InteractiveText(InteractiveDrawable):
         """
         return self._color
 
-    @override
-    def draw(self) -> None:
-        self.handle_mouse_position()
-        super().draw()
+    def set_hovered(self, hovered: bool) -> None:
+        """Sends the hover or idle event, called by the screen's
+           HoverDispatcher when the mouse enters or leaves the element
+
+        Args:
+            hovered (bool): whether the mouse is over the element
+        """
+        self.handle_event(TextEvents.HOVER if hovered else TextEvents.IDLE)
 
     @override
     def handle_mouse_position(self) -> None:
         """Determines when text is in a hover and idle state
            based on user's mouse position in relation to
-           instance variables
+           instance variables. Drawing no longer polls the mouse,
+           screens hit test MOUSEMOTION events instead
         """
-        if self._text.rect is not None:
-            mouse_pos = pygame.mouse.get_pos()
-            if (self._text.rect.collidepoint(mouse_pos)):
-                super().handle_event(TextEvents.HOVER)
-            else:
-                super().handle_event(TextEvents.IDLE)
+        rect: pygame.Rect | None = self.hit_rect
+        if rect is not None:
+            self.set_hovered(bool(rect.collidepoint(pygame.mouse.get_pos())))
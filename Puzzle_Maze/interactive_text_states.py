@@ -42,7 +42,7 @@ class IdleText(InteractiveDrawableState):
         """
         if event == TextEvents.HOVER:
             outer_class.text.color = outer_class.hover_color
-            outer_class.state = HoverText(outer_class.outline)
+            outer_class.state = outer_class.hover_state
 
 
 class HoverText(InteractiveDrawableState):
@@ -67,4 +67,4 @@ class HoverText(InteractiveDrawableState):
         """
         if event == TextEvents.IDLE:
             outer_class.text.color = outer_class.color
-            outer_class.state = IdleText(outer_class.text)
+            outer_class.state = outer_class.idle_state
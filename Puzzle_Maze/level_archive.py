@@ -0,0 +1,214 @@
+"""Binary level archive. Levels are stored back to back with their tiles as
+one byte per cell, followed by an index of byte offsets. The archive is
+opened with mmap, so reading level N only touches level N's bytes.
+
+Layout (little endian):
+    header  "PMLA", u16 version, u16 reserved
+    levels  per level a record header (rows, cols, player row, player col,
+            enemy count, door count, name length, reserved as u16), the
+            utf-8 name, enemies (u16 row, u16 col, i8 velocity, pad),
+            doors (u16 row, u16 col, u8 state, pad) and rows * cols tiles
+    index   u64 offset of every level
+    footer  u64 level count, u64 index offset, "PMLA"
+"""
+
+from array import array
+import argparse
+import mmap
+import struct
+import sys
+from typing import BinaryIO, Iterable, Iterator, List, Sequence, Tuple, Union
+import numpy as np
+import numpy.typing as npt
+from level_format import (LevelData, LevelPack, EnemySpawn, DOOR_STATES)
+
+ARCHIVE_EXTENSION: str = ".pmla"
+MAGIC: bytes = b"PMLA"
+VERSION: int = 1
+
+_HEADER = struct.Struct("<4sHH")
+_RECORD = struct.Struct("<8H")
+_ENEMY = struct.Struct("<HHbx")
+_DOOR = struct.Struct("<HHBx")
+_OFFSET = struct.Struct("<Q")
+_FOOTER = struct.Struct("<QQ4s")
+
+
+def write_level_archive(path: str, levels: Iterable[LevelData]) -> int:
+    """Writes levels to a binary archive one at a time, returns how many
+    were written. Only the offsets are kept in memory while writing."""
+    offsets: array[int] = array("Q")
+    with open(path, "wb") as archive:
+        archive.write(_HEADER.pack(MAGIC, VERSION, 0))
+        for level in levels:
+            offsets.append(archive.tell())
+            _write_level(archive, level)
+        index_offset: int = archive.tell()
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        archive.write(offsets.tobytes())
+        archive.write(_FOOTER.pack(len(offsets), index_offset, MAGIC))
+    return len(offsets)
+
+
+def _write_level(archive: BinaryIO, level: LevelData) -> None:
+    """Writes the record of one level"""
+    tiles: npt.NDArray[np.uint8] = np.array(level.tiles, dtype=np.uint8)
+    if tiles.size == 0:
+        tiles = tiles.reshape(0, 0)
+    rows, cols = tiles.shape
+    name: bytes = level.name.encode("utf-8")
+    archive.write(_RECORD.pack(rows, cols, level.player[0], level.player[1],
+                               len(level.enemies), len(level.doors), len(name), 0))
+    archive.write(name)
+    for enemy in level.enemies:
+        archive.write(_ENEMY.pack(enemy.row, enemy.col, enemy.velocity))
+    for (row, col), state in sorted(level.doors.items()):
+        archive.write(_DOOR.pack(row, col, DOOR_STATES.index(state)))
+    archive.write(np.ascontiguousarray(tiles).tobytes())
+
+
+class LevelArchive(Sequence[LevelData]):
+    """Memory mapped binary level archive with random access by index"""
+
+    def __init__(self, path: str) -> None:
+        """Maps the archive and checks its header and footer
+
+        Args:
+            path (str): path of the archive
+        """
+        self._path: str = path
+        self._file: BinaryIO = open(path, "rb")
+        try:
+            self._map: mmap.mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as error:  # empty file
+            self._file.close()
+            raise ValueError(f"{path}: not a level archive") from error
+        if len(self._map) < _HEADER.size + _FOOTER.size:
+            self.close()
+            raise ValueError(f"{path}: not a level archive")
+        magic, version, _ = _HEADER.unpack_from(self._map, 0)
+        count, index_offset, end_magic = _FOOTER.unpack_from(
+            self._map, len(self._map) - _FOOTER.size)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: not a level archive")
+        if end_magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: no archive footer, the file is truncated")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: unsupported archive version {version}")
+        # the index of offsets ends right where the footer starts
+        size: int = len(self._map)
+        if index_offset < _HEADER.size or \
+                index_offset + count * _OFFSET.size != size - _FOOTER.size:
+            self.close()
+            raise ValueError(f"{path}: the index of {count} levels at byte {index_offset} "
+                             f"does not fit the {size} byte file, it is corrupt")
+        self._count: int = count
+        self._index_offset: int = index_offset
+
+    @property
+    def path(self) -> str:
+        """returns the path of the archive"""
+        return self._path
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> LevelData:  # type: ignore[override]
+        """Decodes only the requested level"""
+        offset, rows, cols = self._locate(index)
+        _, _, player_row, player_col, enemy_count, door_count, name_length, _ = \
+            _RECORD.unpack_from(self._map, offset)
+        position: int = offset + _RECORD.size
+        name: str = self._map[position:position + name_length].decode("utf-8")
+        position += name_length
+        enemies: List[EnemySpawn] = []
+        for _ in range(enemy_count):
+            row, col, velocity = _ENEMY.unpack_from(self._map, position)
+            enemies.append(EnemySpawn(row, col, velocity))
+            position += _ENEMY.size
+        doors = {}
+        for _ in range(door_count):
+            row, col, state = _DOOR.unpack_from(self._map, position)
+            if state >= len(DOOR_STATES):
+                raise ValueError(f"{self._path}: level {index} has a door in state {state}, "
+                                 "the archive is corrupt")
+            doors[(row, col)] = DOOR_STATES[state]
+            position += _DOOR.size
+        tiles: List[List[int]] = self._tiles_at(position, rows, cols).tolist()
+        return LevelData(tiles, (player_row, player_col), enemies, doors, name)
+
+    def __iter__(self) -> Iterator[LevelData]:
+        for index in range(self._count):
+            yield self[index]
+
+    def tiles(self, index: int) -> npt.NDArray[np.uint8]:
+        """returns the tiles of a level as a read only array over the mapped
+        file, without decoding the rest of the level. The archive cannot be
+        closed while such an array is alive."""
+        offset, rows, cols = self._locate(index)
+        _, _, _, _, enemy_count, door_count, name_length, _ = \
+            _RECORD.unpack_from(self._map, offset)
+        position: int = (offset + _RECORD.size + name_length +
+                         enemy_count * _ENEMY.size + door_count * _DOOR.size)
+        return self._tiles_at(position, rows, cols)
+
+    def _locate(self, index: int) -> Tuple[int, int, int]:
+        """returns the offset, rows and cols of a level"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"level {index} is out of range")
+        (offset,) = _OFFSET.unpack_from(self._map, self._index_offset + index * _OFFSET.size)
+        if not _HEADER.size <= offset <= self._index_offset - _RECORD.size:
+            raise ValueError(f"{self._path}: level {index} starts at byte {offset}, "
+                             "outside the level data, the archive is corrupt")
+        rows, cols = struct.unpack_from("<HH", self._map, offset)
+        return offset, rows, cols
+
+    def _tiles_at(self, position: int, rows: int, cols: int) -> npt.NDArray[np.uint8]:
+        """returns rows * cols tiles starting at position"""
+        if position + rows * cols > self._index_offset:
+            raise ValueError(f"{self._path}: a level at byte {position} runs into the "
+                             "index, the archive is corrupt")
+        tiles: npt.NDArray[np.uint8] = np.frombuffer(
+            self._map, dtype=np.uint8, count=rows * cols, offset=position)
+        return tiles.reshape(rows, cols)
+
+    def close(self) -> None:
+        """Unmaps and closes the archive"""
+        if hasattr(self, "_map") and not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'LevelArchive':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def open_levels(path: str) -> Union[LevelPack, LevelArchive]:
+    """Opens a level pack or a binary archive depending on its extension.
+    Close it, or use it as a context manager, to unmap an archive."""
+    if path.endswith(ARCHIVE_EXTENSION):
+        return LevelArchive(path)
+    return LevelPack(path)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Converts a level pack (or another archive) into a binary archive"""
+    parser = argparse.ArgumentParser(description="Build a binary level archive")
+    parser.add_argument("source", help="level pack (.jsonl) or archive to read")
+    parser.add_argument("archive", help=f"archive ({ARCHIVE_EXTENSION}) to write")
+    args = parser.parse_args(argv)
+    with open_levels(args.source) as levels:
+        count: int = write_level_archive(args.archive, levels)
+    print(f"Wrote {count} levels to {args.archive}")
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
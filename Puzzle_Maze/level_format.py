@@ -0,0 +1,202 @@
+"""Data driven level format. A level pack is a JSON Lines file, one level
+per line, holding the tiles, the player spawn, the enemy spawns with their
+velocities and the state of the doors. LevelPack reads the levels lazily,
+so a pack with thousands of levels loads in constant memory.
+
+Example line (tiles are one digit per cell, see the TILE_* constants):
+
+    {"name": "level 1", "tiles": ["111", "102", "111"], "player": [1, 1],
+     "enemies": [{"row": 1, "col": 1, "velocity": 1}],
+     "doors": [{"row": 1, "col": 2, "state": "unlocked"}]}
+"""
+
+from array import array
+import json
+from typing import Any, Dict, IO, Iterable, Iterator, List, Sequence, Tuple
+
+DOOR_LOCKED: str = "locked"
+DOOR_UNLOCKED: str = "unlocked"
+DOOR_STATES: Tuple[str, ...] = (DOOR_LOCKED, DOOR_UNLOCKED)
+DEFAULT_PLAYER_SPAWN: Tuple[int, int] = (1, 1)
+
+
+class EnemySpawn:
+    """Starting cell and vertical velocity of an enemy"""
+
+    def __init__(self, row: int, col: int, velocity: int = 1) -> None:
+        self.row = row
+        self.col = col
+        self.velocity = velocity
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EnemySpawn):
+            return NotImplemented
+        return (self.row, self.col, self.velocity) == (other.row, other.col, other.velocity)
+
+    def __repr__(self) -> str:
+        return f"EnemySpawn({self.row}, {self.col}, velocity={self.velocity})"
+
+
+class LevelData:
+    """Everything needed to build one level of the game"""
+
+    def __init__(self, tiles: Sequence[Sequence[int]],
+                 player: Tuple[int, int] = DEFAULT_PLAYER_SPAWN,
+                 enemies: Sequence[EnemySpawn] = (),
+                 doors: Dict[Tuple[int, int], str] | None = None,
+                 name: str = "") -> None:
+        """Constructor for LevelData
+
+        Args:
+            tiles (Sequence[Sequence[int]]): rows of TILE_* values
+            player (Tuple[int, int]): (row, col) the player starts on
+            enemies (Sequence[EnemySpawn]): enemies of the level
+            doors (Dict[Tuple[int, int], str]): state of doors by (row, col),
+            doors that are not listed are locked
+            name (str): optional name of the level
+        """
+        self.tiles: List[List[int]] = [list(row) for row in tiles]
+        self.player: Tuple[int, int] = player
+        self.enemies: List[EnemySpawn] = list(enemies)
+        self.doors: Dict[Tuple[int, int], str] = dict(doors or {})
+        self.name: str = name
+        for cell, state in self.doors.items():
+            if state not in DOOR_STATES:
+                raise ValueError(f"unknown door state {state!r} at {cell}")
+
+    def door_state(self, row: int, col: int) -> str:
+        """returns the state the door at the cell starts in"""
+        return self.doors.get((row, col), DOOR_LOCKED)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LevelData):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"LevelData(name={self.name!r}, size={len(self.tiles)}x" \
+            f"{len(self.tiles[0]) if self.tiles else 0})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """returns the level as JSON compatible data"""
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "tiles": ["".join(str(tile) for tile in row) for row in self.tiles],
+            "player": list(self.player),
+            "enemies": [{"row": enemy.row, "col": enemy.col, "velocity": enemy.velocity}
+                        for enemy in self.enemies],
+            "doors": [{"row": row, "col": col, "state": state}
+                      for (row, col), state in sorted(self.doors.items())],
+        }
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LevelData':
+        """Builds a level from data read from a level pack"""
+        try:
+            tiles: List[List[int]] = [[int(tile) for tile in row] for row in data["tiles"]]
+            row, col = data.get("player", DEFAULT_PLAYER_SPAWN)
+            enemies: List[EnemySpawn] = [
+                EnemySpawn(int(enemy["row"]), int(enemy["col"]), int(enemy.get("velocity", 1)))
+                for enemy in data.get("enemies", [])]
+            doors: Dict[Tuple[int, int], str] = {
+                (int(door["row"]), int(door["col"])): str(door.get("state", DOOR_LOCKED))
+                for door in data.get("doors", [])}
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"invalid level data: {error}") from error
+        if any(len(tile_row) != len(tiles[0]) for tile_row in tiles):
+            raise ValueError("level rows must all have the same length")
+        return cls(tiles, (int(row), int(col)), enemies, doors, str(data.get("name", "")))
+
+    def to_json(self) -> str:
+        """returns the level as one line of a level pack"""
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> 'LevelData':
+        """Parses one line of a level pack"""
+        data: Any = json.loads(line)
+        if not isinstance(data, dict):
+            raise ValueError("a level must be a JSON object")
+        return cls.from_dict(data)
+
+
+class LevelPack(Sequence[LevelData]):
+    """Level pack file read lazily. Only the byte offset of each level is
+    kept in memory, a level is parsed when it is indexed."""
+
+    def __init__(self, path: str) -> None:
+        """Scans the file once to find where each level starts
+
+        Args:
+            path (str): path of the JSON Lines level pack
+        """
+        self._path: str = path
+        self._offsets: array[int] = array("q")
+        with open(path, "rb") as pack:
+            offset: int = 0
+            for line in pack:
+                if line.strip() and not line.lstrip().startswith(b"#"):
+                    self._offsets.append(offset)
+                offset += len(line)
+
+    @property
+    def path(self) -> str:
+        """returns the path of the pack"""
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> LevelData:  # type: ignore[override]
+        """Reads and parses only the requested level"""
+        if index < 0:
+            index += len(self._offsets)
+        if not 0 <= index < len(self._offsets):
+            raise IndexError(f"level {index} is out of range")
+        with open(self._path, "rb") as pack:
+            pack.seek(self._offsets[index])
+            return self._parse(pack.readline(), index)
+
+    def __iter__(self) -> Iterator[LevelData]:
+        """Streams the levels one at a time"""
+        with open(self._path, "rb") as pack:
+            index: int = 0
+            for line in pack:
+                if line.strip() and not line.lstrip().startswith(b"#"):
+                    yield self._parse(line, index)
+                    index += 1
+
+    def close(self) -> None:
+        """Nothing to release, the file is only open while reading. Lets a
+        pack be closed like a LevelArchive."""
+
+    def __enter__(self) -> 'LevelPack':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _parse(self, line: bytes, index: int) -> LevelData:
+        """Parses a level, naming the pack and index in errors"""
+        try:
+            return LevelData.from_json(line.decode("utf-8"))
+        except ValueError as error:
+            raise ValueError(f"{self._path}: level {index}: {error}") from error
+
+
+def write_level_pack(path: str, levels: Iterable[LevelData]) -> int:
+    """Writes levels to a level pack one at a time, returns how many were
+    written"""
+    with open(path, "w", encoding="utf-8") as pack:
+        return write_levels(pack, levels)
+
+
+def write_levels(stream: IO[str], levels: Iterable[LevelData]) -> int:
+    """Writes levels as JSON Lines to an open text stream"""
+    count: int = 0
+    for level in levels:
+        stream.write(level.to_json())
+        stream.write("\n")
+        count += 1
+    return count
@@ -0,0 +1,280 @@
+"""Procedural level generator. A level is carved as a perfect maze with a
+depth first search, opened up with a few loops, then gets a goal far from
+the start, locked doors along the way with their keys before them and
+enemies patrolling vertical corridors. Every level is checked with the
+solver, enemies that make it unsolvable are dropped. Doors are placed
+before the loops, and no loop is knocked through that would go around one.
+
+Each level only depends on its seed, so a batch generated across a process
+pool is the same as one generated serially."""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import argparse
+import os
+import random
+from typing import Deque, Dict, Iterator, List, Sequence, Tuple
+from GameObjects import TILE_WALL, TILE_EMPTY, TILE_GOAL, TILE_DOOR, TILE_KEY
+from level_format import LevelData, EnemySpawn, write_level_pack
+from level_archive import ARCHIVE_EXTENSION, write_level_archive
+from solver import solve_level
+from game import GRID_WIDTH, GRID_HEIGHT
+
+Cell = Tuple[int, int]
+Tiles = List[List[int]]
+START: Cell = (1, 1)
+# shortest vertical corridor an enemy is put in
+MIN_LANE: int = 3
+
+
+class LevelGenerator:
+    """Settings of the generated levels, generate(seed) builds one level"""
+
+    def __init__(self, rows: int = GRID_HEIGHT, cols: int = GRID_WIDTH, doors: int = 1,
+                 enemies: int = 2, loops: float = 0.1) -> None:
+        """Constructor for LevelGenerator
+
+        Args:
+            rows (int): rows of the level, at least 5
+            cols (int): columns of the level, at least 5
+            doors (int): locked doors on the way to the goal, one key each
+            enemies (int): enemies to place, fewer if they block the level
+            loops (float): share of inner walls knocked down to add loops
+        """
+        if rows < 5 or cols < 5:
+            raise ValueError(f"levels must be at least 5x5, got {rows}x{cols}")
+        self.rows: int = rows
+        self.cols: int = cols
+        self.doors: int = doors
+        self.enemies: int = enemies
+        self.loops: float = loops
+
+    def generate(self, seed: int) -> LevelData:
+        """Builds the level for a seed, the same seed gives the same level"""
+        rng: random.Random = random.Random(seed)
+        tiles: Tiles = self._carve(rng)
+        distances, parents = _breadth_first(tiles, START)
+        goal_row, goal_col = max(distances, key=lambda cell: (distances[cell], cell))
+        tiles[goal_row][goal_col] = TILE_GOAL
+        path: List[Cell] = _path(parents, (goal_row, goal_col))
+        doors: List[Cell] = self._place_doors(tiles, rng, path)
+        self._add_loops(tiles, rng, _regions(tiles, path, doors))
+        level: LevelData = LevelData(tiles, START, self._enemies(tiles, rng),
+                                     name=f"generated {seed}")
+        while solve_level(level, avoid_enemies=True) is None:
+            if not level.enemies:
+                raise RuntimeError(f"generated level {seed} cannot be solved")
+            level.enemies.pop()
+        return level
+
+    def _carve(self, rng: random.Random) -> Tiles:
+        """Carves a perfect maze on the odd cells, every cell of it is on
+        the only way between the cells on either side"""
+        tiles: Tiles = [[TILE_WALL] * self.cols for _ in range(self.rows)]
+        tiles[START[0]][START[1]] = TILE_EMPTY
+        stack: List[Cell] = [START]
+        while stack:
+            row, col = stack[-1]
+            options: List[Cell] = [
+                (row + dy, col + dx) for dy, dx in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                if 0 < row + dy < self.rows - 1 and 0 < col + dx < self.cols - 1
+                and tiles[row + dy][col + dx] == TILE_WALL]
+            if not options:
+                stack.pop()
+                continue
+            next_row, next_col = rng.choice(options)
+            tiles[(row + next_row) // 2][(col + next_col) // 2] = TILE_EMPTY
+            tiles[next_row][next_col] = TILE_EMPTY
+            stack.append((next_row, next_col))
+        return tiles
+
+    def _add_loops(self, tiles: Tiles, rng: random.Random, regions: Dict[Cell, int]) -> None:
+        """Knocks down walls between two corridors to add loops. Only walls
+        with the same region on both sides are candidates, so no loop goes
+        around a door."""
+        inner_walls: List[Cell] = [
+            (row, col) for row in range(1, self.rows - 1) for col in range(1, self.cols - 1)
+            if tiles[row][col] == TILE_WALL and (row + col) % 2 == 1
+            and (_same_region(regions, (row - 1, col), (row + 1, col))
+                 or _same_region(regions, (row, col - 1), (row, col + 1)))]
+        for row, col in rng.sample(inner_walls, int(len(inner_walls) * self.loops)):
+            tiles[row][col] = TILE_EMPTY
+
+    def _place_doors(self, tiles: Tiles, rng: random.Random, path: List[Cell]) -> List[Cell]:
+        """Puts the doors evenly along the path to the goal, which in a
+        perfect maze cannot be gone around, and each key somewhere reachable
+        without going through its door or a later one
+
+        Returns:
+            List[Cell]: the doors in path order, fewer than asked for when
+            the path is shorter than the number of doors
+        """
+        corridor: List[Cell] = path[1:-1]
+        count: int = min(self.doors, len(corridor))
+        doors: List[Cell] = [corridor[len(corridor) * (index + 1) // (count + 1)]
+                             for index in range(count)]
+        for row, col in doors:
+            tiles[row][col] = TILE_DOOR
+        regions: Dict[Cell, int] = _regions(tiles, path, doors)
+        on_path: set[Cell] = set(path)
+        placed: List[Cell] = []
+        for index, (door_row, door_col) in enumerate(doors):
+            spots: List[Cell] = sorted(
+                cell for cell, region in regions.items() if region <= index
+                and tiles[cell[0]][cell[1]] == TILE_EMPTY and cell != START)
+            off_path: List[Cell] = [cell for cell in spots if cell not in on_path]
+            if spots:
+                key_row, key_col = rng.choice(off_path or spots)
+                tiles[key_row][key_col] = TILE_KEY
+                placed.append((door_row, door_col))
+            else:
+                tiles[door_row][door_col] = TILE_EMPTY
+        return placed
+
+    def _enemies(self, tiles: Tiles, rng: random.Random) -> List[EnemySpawn]:
+        """Picks vertical corridors (lanes) away from the start and puts an
+        enemy in each, heading up or down"""
+        lanes: List[List[Cell]] = [
+            lane for lane in _vertical_lanes(tiles)
+            if len(lane) >= MIN_LANE and START not in lane]
+        spawns: List[EnemySpawn] = []
+        for lane in rng.sample(lanes, min(self.enemies, len(lanes))):
+            row, col = rng.choice(lane)
+            spawns.append(EnemySpawn(row, col, rng.choice((-1, 1))))
+        return spawns
+
+
+def _breadth_first(tiles: Tiles, start: Cell, blocked: set[Cell] | None = None
+                   ) -> Tuple[Dict[Cell, int], Dict[Cell, Cell]]:
+    """returns the distance and parent of every cell reachable from start,
+    going around walls and the blocked cells. The border is all walls."""
+    blocked = blocked or set()
+    distances: Dict[Cell, int] = {start: 0}
+    parents: Dict[Cell, Cell] = {}
+    queue: Deque[Cell] = deque([start])
+    while queue:
+        row, col = queue.popleft()
+        for cell in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if tiles[cell[0]][cell[1]] != TILE_WALL and cell not in distances \
+                    and cell not in blocked:
+                distances[cell] = distances[(row, col)] + 1
+                parents[cell] = (row, col)
+                queue.append(cell)
+    return distances, parents
+
+
+def _regions(tiles: Tiles, path: List[Cell], doors: List[Cell]) -> Dict[Cell, int]:
+    """returns the region of every open cell that is not a door: 0 for the
+    cells reachable from the start without a door, i for the cells behind
+    the door i - 1 on the path"""
+    blocked: set[Cell] = set(doors)
+    position: Dict[Cell, int] = {cell: index for index, cell in enumerate(path)}
+    starts: List[Cell] = [START] + [path[position[door] + 1] for door in doors]
+    regions: Dict[Cell, int] = {}
+    for region, start in enumerate(starts):
+        if start in blocked or start in regions:
+            continue
+        for cell in _breadth_first(tiles, start, blocked)[0]:
+            regions[cell] = region
+    return regions
+
+
+def _same_region(regions: Dict[Cell, int], first: Cell, second: Cell) -> bool:
+    """returns whether both cells are open, not doors, and in one region"""
+    region: int | None = regions.get(first)
+    return region is not None and region == regions.get(second)
+
+
+def _path(parents: Dict[Cell, Cell], goal: Cell) -> List[Cell]:
+    """returns the cells from the search start to goal"""
+    path: List[Cell] = [goal]
+    while path[-1] in parents:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+
+def _vertical_lanes(tiles: Tiles) -> List[List[Cell]]:
+    """returns every run of non wall cells in a column, top to bottom"""
+    lanes: List[List[Cell]] = []
+    for col in range(len(tiles[0])):
+        lane: List[Cell] = []
+        for row, tile_row in enumerate(tiles):
+            if tile_row[col] == TILE_WALL:
+                if lane:
+                    lanes.append(lane)
+                lane = []
+            else:
+                lane.append((row, col))
+        if lane:
+            lanes.append(lane)
+    return lanes
+
+
+def generate_levels(generator: LevelGenerator, count: int, seed: int = 0,
+                    workers: int | None = None, chunk_size: int = 64,
+                    max_in_flight: int | None = None) -> Iterator[LevelData]:
+    """Generates levels seed, seed + 1, ... in order, across a process pool
+    unless workers is 1
+
+    Args:
+        generator (LevelGenerator): settings of the levels
+        count (int): number of levels
+        seed (int): seed of the first level
+        workers (int | None): processes to use, defaults to one per CPU
+        chunk_size (int): seeds sent to a process at a time
+        max_in_flight (int | None): chunks submitted and not yet yielded,
+        defaults to two per process
+    """
+    seeds: range = range(seed, seed + count)
+    if workers == 1:
+        yield from map(generator.generate, seeds)
+        return
+    workers = workers or os.cpu_count() or 1
+    chunks: Iterator[range] = (seeds[start:start + chunk_size]
+                               for start in range(0, count, chunk_size))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from _bounded_chunks(pool, generator, chunks, max_in_flight or workers * 2)
+
+
+def _bounded_chunks(pool: ProcessPoolExecutor, generator: LevelGenerator,
+                    chunks: Iterator[range], max_in_flight: int) -> Iterator[LevelData]:
+    """Executor.map submits every seed up front, this only submits the next
+    chunk once the levels of an earlier one are taken"""
+    pending: Deque[Future[List[LevelData]]] = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(_generate_chunk, generator, chunk))
+        if len(pending) >= max_in_flight:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _generate_chunk(generator: LevelGenerator, seeds: range) -> List[LevelData]:
+    """returns the levels of seeds, run in a worker process"""
+    return [generator.generate(seed) for seed in seeds]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Writes generated levels to a level pack or a binary archive"""
+    parser = argparse.ArgumentParser(description="Generate maze levels")
+    parser.add_argument("output", help=f"level pack (.jsonl) or archive ({ARCHIVE_EXTENSION})")
+    parser.add_argument("--count", type=int, default=100, help="number of levels")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first level")
+    parser.add_argument("--rows", type=int, default=GRID_HEIGHT)
+    parser.add_argument("--cols", type=int, default=GRID_WIDTH)
+    parser.add_argument("--doors", type=int, default=1, help="locked doors per level")
+    parser.add_argument("--enemies", type=int, default=2, help="enemies per level")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use")
+    args = parser.parse_args(argv)
+    generator: LevelGenerator = LevelGenerator(args.rows, args.cols, args.doors, args.enemies)
+    levels: Iterator[LevelData] = generate_levels(generator, args.count, args.seed, args.workers)
+    if args.output.endswith(ARCHIVE_EXTENSION):
+        count: int = write_level_archive(args.output, levels)
+    else:
+        count = write_level_pack(args.output, levels)
+    print(f"Wrote {count} levels to {args.output}")
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
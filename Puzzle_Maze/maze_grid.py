@@ -0,0 +1,153 @@
+"""Maze grid backed by a NumPy uint8 array. Whole grid queries such as
+finding or replacing a tile are vectorized, while indexing a row still
+gives something that reads and writes like the old List[List[int]]."""
+
+from typing import Iterator, List, Sequence, Tuple, Union, overload
+import numpy as np
+import numpy.typing as npt
+
+
+class MazeGrid:
+    """2D grid of tile values, one byte per cell"""
+
+    def __init__(self, cells: npt.ArrayLike) -> None:
+        """Copies the cells into a contiguous uint8 array
+
+        Args:
+            cells (npt.ArrayLike): 2D array or nested rows of tile values
+        """
+        array: npt.NDArray[np.uint8] = np.array(cells, dtype=np.uint8)
+        if array.size == 0:
+            array = array.reshape(0, 0)
+        if array.ndim != 2:
+            raise ValueError(f"maze must be 2 dimensional, got shape {array.shape}")
+        self._cells: npt.NDArray[np.uint8] = np.ascontiguousarray(array)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[int]]) -> 'MazeGrid':
+        """Builds a grid from a list of rows"""
+        return cls(rows)
+
+    @classmethod
+    def filled(cls, rows: int, cols: int, value: int) -> 'MazeGrid':
+        """Builds a grid where every cell holds value"""
+        return cls(np.full((rows, cols), value, dtype=np.uint8))
+
+    @classmethod
+    def coerce(cls, maze: 'MazeLike') -> 'MazeGrid':
+        """Returns maze itself if it is a grid, otherwise a grid copy of it"""
+        if isinstance(maze, MazeGrid):
+            return maze
+        return cls(maze)
+
+    @property
+    def cells(self) -> npt.NDArray[np.uint8]:
+        """returns the underlying array, writes to it change the grid"""
+        return self._cells
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """returns (rows, cols)"""
+        return (int(self._cells.shape[0]), int(self._cells.shape[1]))
+
+    @property
+    def rows(self) -> int:
+        """returns the number of rows"""
+        return int(self._cells.shape[0])
+
+    @property
+    def cols(self) -> int:
+        """returns the number of columns"""
+        return int(self._cells.shape[1])
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @overload
+    def __getitem__(self, index: int) -> npt.NDArray[np.uint8]:
+        ...
+
+    @overload
+    def __getitem__(self, index: Tuple[int, int]) -> int:
+        ...
+
+    def __getitem__(self, index: Union[int, Tuple[int, int]]
+                    ) -> Union[npt.NDArray[np.uint8], int]:
+        """grid[row] is a writable view of the row, so grid[row][col] works
+        like a list of lists. grid[row, col] returns the tile as an int."""
+        if isinstance(index, tuple):
+            return int(self._cells[index])
+        row: npt.NDArray[np.uint8] = self._cells[index]
+        return row
+
+    def __setitem__(self, index: Tuple[int, int], value: int) -> None:
+        self._cells[index] = value
+
+    def __iter__(self) -> Iterator[npt.NDArray[np.uint8]]:
+        return iter(self._cells)
+
+    def __eq__(self, other: object) -> bool:
+        """Grids compare equal to grids or nested lists with the same tiles"""
+        if isinstance(other, MazeGrid):
+            return np.array_equal(self._cells, other._cells)
+        if isinstance(other, (list, tuple)):
+            try:
+                return np.array_equal(self._cells, np.array(other))
+            except ValueError:
+                return False
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"MazeGrid({self.tolist()})"
+
+    def tolist(self) -> List[List[int]]:
+        """returns the tiles as a list of lists of ints"""
+        rows: List[List[int]] = self._cells.tolist()
+        return rows
+
+    def copy(self) -> 'MazeGrid':
+        """returns an independent copy of the grid"""
+        return MazeGrid(self._cells)
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        """checks if the cell is inside the grid"""
+        rows, cols = self.shape
+        return 0 <= row < rows and 0 <= col < cols
+
+    def mask(self, value: int) -> npt.NDArray[np.bool_]:
+        """returns a boolean array of the cells equal to value"""
+        matches: npt.NDArray[np.bool_] = self._cells == value
+        return matches
+
+    def count(self, value: int) -> int:
+        """returns how many cells are equal to value"""
+        return int(np.count_nonzero(self._cells == value))
+
+    def positions_of(self, value: int) -> List[Tuple[int, int]]:
+        """returns the (row, col) of every cell equal to value, row major"""
+        return [(int(row), int(col)) for row, col in np.argwhere(self._cells == value)]
+
+    def replace(self, old: int, new: int) -> int:
+        """Replaces every old tile with new, returns how many were replaced"""
+        mask: npt.NDArray[np.bool_] = self._cells == old
+        replaced: int = int(np.count_nonzero(mask))
+        if replaced:
+            self._cells[mask] = new
+        return replaced
+
+    def neighbor_mask(self, value: int) -> npt.NDArray[np.bool_]:
+        """returns a boolean array of the cells with at least one of their
+        four neighbors (up, down, left, right) equal to value"""
+        matches: npt.NDArray[np.bool_] = self._cells == value
+        result: npt.NDArray[np.bool_] = np.zeros_like(matches)
+        result[1:, :] |= matches[:-1, :]
+        result[:-1, :] |= matches[1:, :]
+        result[:, 1:] |= matches[:, :-1]
+        result[:, :-1] |= matches[:, 1:]
+        return result
+
+
+# Anything the game objects accept as a maze: a grid or the old nested lists
+MazeLike = Union[MazeGrid, List[List[int]]]
@@ -0,0 +1,197 @@
+"""Frame time profiler. While enabled, the methods of the hot paths (the
+player and enemy updates, the game update and draw, the menu screens) are
+replaced on their classes by wrappers that time every call, and the last
+WINDOW times of each phase give rolling p50/p95/p99. Disabling puts the
+original functions back, so a disabled profiler costs nothing.
+
+    PUZZLE_MAZE_PROFILE=1 python chips_core_escape.py             # overlay
+    PUZZLE_MAZE_PROFILE=frames.json python chips_core_escape.py   # and a dump
+"""
+
+from collections import deque
+import atexit
+import functools
+import json
+import math
+import os
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+import pygame
+from GameObjects import Player, Enemy
+from game import Game
+from game_screens import MainMenu, InfoScreen
+
+Target = Tuple[type, str]
+# calls kept per phase for the percentiles
+WINDOW: int = 600
+PERCENTILES: Tuple[int, ...] = (50, 95, 99)
+PROFILE_ENV: str = "PUZZLE_MAZE_PROFILE"
+DEFAULT_TARGETS: List[Target] = [
+    (Player, "update"), (Enemy, "update"), (Game, "update"), (Game, "draw"),
+    (Game, "single_iteration"), (MainMenu, "draw_screen"), (InfoScreen, "draw_screen")]
+OVERLAY_FONT_SIZE: int = 18
+OVERLAY_COLOR: Tuple[int, int, int] = (255, 255, 0)
+OVERLAY_BACKGROUND: Tuple[int, int, int] = (0, 0, 0)
+
+
+def phase_name(target: Target) -> str:
+    """returns the name a method is reported under, e.g. Player.update"""
+    cls, name = target
+    return f"{cls.__name__}.{name}"
+
+
+def percentile(ordered: Sequence[float], rank: float) -> float:
+    """returns the nearest rank percentile of sorted values"""
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(rank / 100 * len(ordered)) - 1, 0)]
+
+
+class Profiler:
+    """Singleton holding the rolling call times, in ms, of every phase"""
+    _instance: Optional['Profiler'] = None
+
+    def __init__(self, window: int = WINDOW) -> None:
+        """Constructor for Profiler
+
+        Args:
+            window (int): most recent calls kept per phase
+        """
+        self.window: int = window
+        self.overlay: bool = False
+        self._samples: Dict[str, Deque[float]] = {}
+        # original class attributes, None when the method was inherited
+        self._originals: Dict[Target, Any] = {}
+        self._font: pygame.font.Font | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """returns whether any method is being timed"""
+        return bool(self._originals)
+
+    def enable(self, targets: Sequence[Target] = tuple(DEFAULT_TARGETS),
+               overlay: bool = False) -> None:
+        """Starts timing the methods of targets, (class, method name) pairs
+
+        Args:
+            targets (Sequence[Target]): methods to time
+            overlay (bool): draw_overlay shows the timings
+        """
+        self.overlay = overlay
+        for target in targets:
+            if target in self._originals:
+                continue
+            cls, name = target
+            self._originals[target] = cls.__dict__.get(name)
+            setattr(cls, name, self._timed(phase_name(target), getattr(cls, name)))
+
+    def disable(self) -> None:
+        """Puts the original methods back, the samples are kept"""
+        for (cls, name), original in self._originals.items():
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self._originals.clear()
+        self.overlay = False
+
+    def _timed(self, phase: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """returns method wrapped to record how long each call takes"""
+        samples: Deque[float] = self._samples.setdefault(phase, deque(maxlen=self.window))
+        clock: Callable[[], float] = time.perf_counter
+
+        @functools.wraps(method)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started: float = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                samples.append((clock() - started) * 1000)
+        return timed
+
+    def record(self, phase: str, elapsed_ms: float) -> None:
+        """Adds a time measured elsewhere to a phase"""
+        self._samples.setdefault(phase, deque(maxlen=self.window)).append(elapsed_ms)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """returns the calls, mean, percentiles and maximum, in ms, of every
+        phase called within the window"""
+        stats: Dict[str, Dict[str, float]] = {}
+        for phase, samples in self._samples.items():
+            if not samples:
+                continue
+            ordered: List[float] = sorted(samples)
+            phase_stats: Dict[str, float] = {
+                "calls": len(ordered), "mean": sum(ordered) / len(ordered)}
+            for rank in PERCENTILES:
+                phase_stats[f"p{rank}"] = percentile(ordered, rank)
+            phase_stats["max"] = ordered[-1]
+            stats[phase] = phase_stats
+        return stats
+
+    def reset(self) -> None:
+        """Forgets every sample"""
+        for samples in self._samples.values():
+            samples.clear()
+
+    def dump(self, path: str) -> None:
+        """Writes the stats of every phase to a JSON file"""
+        with open(path, "w", encoding="utf-8") as dump_file:
+            json.dump({"window": self.window, "phases": self.stats()}, dump_file, indent=2)
+
+    def overlay_lines(self) -> List[str]:
+        """returns the text of the overlay, one line per phase"""
+        return [f"{phase:<24} p50 {stats['p50']:6.2f}  p95 {stats['p95']:6.2f}  "
+                f"p99 {stats['p99']:6.2f} ms"
+                for phase, stats in sorted(self.stats().items())]
+
+    def draw_overlay(self, surface: pygame.Surface) -> pygame.Rect | None:
+        """Draws the timings in the top left corner of surface, on an opaque
+        box so the text of the last frame never shows through
+
+        Returns:
+            pygame.Rect | None: the area drawn over, None before any timing
+        """
+        if self._font is None:
+            pygame.font.init()
+            self._font = pygame.font.Font(None, OVERLAY_FONT_SIZE)
+        lines: List[pygame.Surface] = [
+            self._font.render(line, True, OVERLAY_COLOR) for line in self.overlay_lines()]
+        if not lines:
+            return None
+        width: int = max(line.get_width() for line in lines)
+        height: int = sum(line.get_height() for line in lines)
+        box: pygame.Rect = pygame.Rect(0, 0, width + 8, height + 8)
+        surface.fill(OVERLAY_BACKGROUND, box)
+        top: int = 4
+        for line in lines:
+            surface.blit(line, (4, top))
+            top += line.get_height()
+        return box
+
+    @classmethod
+    def from_environment(cls) -> 'Profiler':
+        """Returns the shared profiler, enabled with the overlay when
+        PUZZLE_MAZE_PROFILE is set. A value ending in .json is also the
+        file the stats are dumped to when the program exits."""
+        profiler: Profiler = cls.get_instance()
+        setting: str = os.environ.get(PROFILE_ENV, "")
+        if setting and setting != "0":
+            profiler.enable(overlay=True)
+            if setting.endswith(".json"):
+                atexit.register(profiler.dump, setting)
+        return profiler
+
+    @classmethod
+    def get_instance(cls) -> 'Profiler':
+        """Returns the shared profiler, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Disables and drops the shared profiler"""
+        if cls._instance is not None:
+            cls._instance.disable()
+        cls._instance = None
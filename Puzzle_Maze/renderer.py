@@ -0,0 +1,88 @@
+"""Dirty rectangle renderer for the game screen. The static tile layer is
+kept as one background surface, and only the areas where a game object
+moved or changed its image are redrawn and sent to the display."""
+
+from typing import Dict, List, Sequence, Tuple
+import pygame
+from GameObjects import GameObject
+
+
+class DirtyRectRenderer:
+    """Redraws only the parts of the screen that changed since the last frame"""
+
+    def __init__(self) -> None:
+        self._background: pygame.Surface | None = None
+        self._screen: pygame.Surface | None = None
+        # last drawn rect and image of every object, to detect movement
+        self._drawn: Dict[GameObject, Tuple[pygame.Rect, pygame.Surface]] = {}
+        self._pending: List[pygame.Rect] = []
+        self._full_redraw: bool = True
+
+    @property
+    def background(self) -> pygame.Surface | None:
+        """returns the surface drawn behind the game objects"""
+        return self._background
+
+    def set_background(self, background: pygame.Surface) -> None:
+        """Replaces the background, the next frame is redrawn in full"""
+        self._background = background
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forces a full redraw on the next frame, used after a level change"""
+        self._full_redraw = True
+        self._pending = []
+
+    def mark_dirty(self, rect: pygame.Rect) -> None:
+        """Schedules an area to be redrawn on the next frame, for example a
+        tile of the background that was patched"""
+        self._pending.append(pygame.Rect(rect))
+
+    def render(self, screen: pygame.Surface,
+               objects: Sequence[GameObject]) -> List[pygame.Rect]:
+        """Draws the frame and returns the rects that need to be passed to
+        pygame.display.update"""
+        if self._background is None:
+            return []
+        if self._full_redraw or screen is not self._screen:
+            return self._render_full(screen, objects)
+
+        dirty: List[pygame.Rect] = self._pending
+        self._pending = []
+        drawn: Dict[GameObject, Tuple[pygame.Rect, pygame.Surface]] = {}
+        for game_object in objects:
+            rect: pygame.Rect = game_object.rect.copy()
+            previous = self._drawn.pop(game_object, None)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[0] != rect or previous[1] is not game_object.image:
+                dirty.append(previous[0])
+                dirty.append(rect)
+            drawn[game_object] = (rect, game_object.image)
+        # objects that are gone since the last frame leave their old area behind
+        dirty.extend(rect for rect, _ in self._drawn.values())
+        self._drawn = drawn
+
+        if not dirty:
+            return []
+        for rect in dirty:
+            screen.blit(self._background, rect, rect)
+        for game_object in objects:
+            if game_object.rect.collidelist(dirty) != -1:
+                game_object.draw(screen)
+        return dirty
+
+    def _render_full(self, screen: pygame.Surface,
+                     objects: Sequence[GameObject]) -> List[pygame.Rect]:
+        """Draws the whole background and every object"""
+        assert self._background is not None
+        self._screen = screen
+        self._full_redraw = False
+        self._pending = []
+        screen.fill((0, 0, 0))
+        screen.blit(self._background, (0, 0))
+        self._drawn = {}
+        for game_object in objects:
+            game_object.draw(screen)
+            self._drawn[game_object] = (game_object.rect.copy(), game_object.image)
+        return [pygame.Rect((0, 0), screen.get_size())]
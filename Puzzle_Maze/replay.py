@@ -0,0 +1,234 @@
+"""Recording and replay of game sessions. The recorder stores the direction
+Player.update reads on every logic step, run length encoded, along with
+the level pack, the level and the time the recording started. Since the
+game logic only depends on those, replaying the log headless through
+Game.single_iteration ends in the same state, many times faster than the
+session took.
+
+    log = record(game)          # play, then
+    log.save("session.json")
+    game = replay(InputLog.load("session.json"))
+
+Setting PUZZLE_MAZE_RECORD to a path records the games played in
+chips_core_escape, the latest one is written there when it is over.
+"""
+
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+import pygame
+from game import Game, STEP_MS
+from game_clock import SimulatedClock
+from game_input import InputSource, KeyState, PressedKeys
+
+LOG_VERSION: int = 1
+RECORD_ENV: str = "PUZZLE_MAZE_RECORD"
+# direction codes, in the order Player.update checks the keys
+NO_MOVE, UP, DOWN, LEFT, RIGHT = range(5)
+DIRECTION_KEYS: Dict[int, int] = {
+    UP: pygame.K_UP, DOWN: pygame.K_DOWN, LEFT: pygame.K_LEFT, RIGHT: pygame.K_RIGHT}
+
+
+def direction_code(keys: KeyState) -> int:
+    """returns the direction Player.update would take for a key state"""
+    for code, key in DIRECTION_KEYS.items():
+        if keys[key]:
+            return code
+    return NO_MOVE
+
+
+class InputLog:
+    """Inputs of a session, one direction code per logic step stored as
+    [code, count] runs"""
+
+    def __init__(self, level_pack: str, level_index: int = 0, start_time: int = 0) -> None:
+        """Constructor for InputLog
+
+        Args:
+            level_pack (str): level pack or archive the session was played on
+            level_index (int): level the recording started on
+            start_time (int): simulated ms when the recording started
+        """
+        self.level_pack: str = level_pack
+        self.level_index: int = level_index
+        self.start_time: int = start_time
+        self.runs: List[List[int]] = []
+        self._steps: int = 0
+
+    def append(self, code: int) -> None:
+        """Adds the direction of one step"""
+        if self.runs and self.runs[-1][0] == code:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([code, 1])
+        self._steps += 1
+
+    def __len__(self) -> int:
+        """returns the number of steps recorded"""
+        return self._steps
+
+    def __iter__(self) -> Iterator[int]:
+        """Yields the direction code of every step"""
+        for code, count in self.runs:
+            for _ in range(count):
+                yield code
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, InputLog):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """returns the log as JSON compatible data"""
+        return {"version": LOG_VERSION, "level_pack": self.level_pack,
+                "level_index": self.level_index, "start_time": self.start_time,
+                "step_ms": STEP_MS, "steps": self._steps,
+                "runs": [value for run in self.runs for value in run]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'InputLog':
+        """Builds a log from data written by to_dict"""
+        if data.get("version") != LOG_VERSION:
+            raise ValueError(f"unsupported input log version {data.get('version')!r}")
+        if data.get("step_ms") != STEP_MS:
+            raise ValueError(f"log was recorded with {data.get('step_ms')} ms steps, "
+                             f"the game runs {STEP_MS} ms steps")
+        log: InputLog = cls(str(data["level_pack"]), int(data["level_index"]),
+                            int(data["start_time"]))
+        values: List[int] = [int(value) for value in data["runs"]]
+        for code, count in zip(values[::2], values[1::2]):
+            log.runs.append([code, count])
+            log._steps += count
+        if log._steps != data["steps"]:
+            raise ValueError(f"log has {log._steps} steps, expected {data['steps']}")
+        return log
+
+    def save(self, path: str) -> None:
+        """Writes the log to a JSON file"""
+        with open(path, "w", encoding="utf-8") as log_file:
+            json.dump(self.to_dict(), log_file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> 'InputLog':
+        """Reads a log written by save"""
+        with open(path, encoding="utf-8") as log_file:
+            return cls.from_dict(json.load(log_file))
+
+
+class RecordingInput(InputSource):
+    """Passes another input source through, logging the direction of every
+    key state read. Game.step reads the keys once per step."""
+
+    def __init__(self, source: InputSource, log: InputLog) -> None:
+        self.source: InputSource = source
+        self.log: InputLog = log
+
+    def get_pressed(self) -> KeyState:
+        keys: KeyState = self.source.get_pressed()
+        self.log.append(direction_code(keys))
+        return keys
+
+
+class ReplayInput(InputSource):
+    """Plays the directions of a log back, one per key state read, then
+    holds no key"""
+
+    def __init__(self, log: InputLog) -> None:
+        self._codes: Iterator[int] = iter(log)
+        self._pressed: Dict[int, PressedKeys] = {
+            code: PressedKeys([key]) for code, key in DIRECTION_KEYS.items()}
+        self._pressed[NO_MOVE] = PressedKeys()
+
+    def get_pressed(self) -> KeyState:
+        return self._pressed[next(self._codes, NO_MOVE)]
+
+
+def record(game: Game) -> InputLog:
+    """Starts recording a game from its current level and time, returns the
+    log that fills up as the game runs. Start on a freshly loaded level,
+    the log does not hold the moves made before."""
+    log: InputLog = InputLog(game.level_pack, game.level_index, game.sim_time)
+    game.input_source = RecordingInput(game.input_source, log)
+    return log
+
+
+class SessionRecorder:
+    """Records the games of a session to one file. A game's log is written
+    when the next game starts or the program exits, so the file holds the
+    latest game."""
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.log: InputLog | None = None
+        atexit.register(self.save)
+
+    def start(self, game: Game) -> None:
+        """Saves the game recorded so far and records game instead"""
+        self.save()
+        self.log = record(game)
+
+    def save(self) -> None:
+        """Writes the current log, unless nothing was played yet"""
+        if self.log is not None and len(self.log):
+            self.log.save(self.path)
+
+    @classmethod
+    def from_environment(cls) -> Optional['SessionRecorder']:
+        """Returns a recorder writing to PUZZLE_MAZE_RECORD, None when it
+        is not set"""
+        path: str = os.environ.get(RECORD_ENV, "")
+        return cls(path) if path else None
+
+
+def replay(log: InputLog) -> Game:
+    """Replays a log in a headless game as fast as possible and returns the
+    game in the state the session ended in"""
+    # one step per frame, so the replay stops exactly where the log ends
+    game: Game = Game(headless=True, clock=SimulatedClock(step=STEP_MS),
+                      input_source=ReplayInput(log), level_pack=log.level_pack)
+    if log.level_index:
+        game.level_index = log.level_index
+        game.load_level(log.level_index)
+    game.sim_time = log.start_time
+    end_time: int = log.start_time + len(log) * STEP_MS
+    while game.sim_time < end_time and not game.game_over:
+        game.single_iteration()
+    return game
+
+
+def state_digest(game: Game) -> str:
+    """returns a hash of everything the game logic depends on, equal
+    digests mean the sessions ended the same way"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        "level": game.level_index, "time": game.sim_time,
+        "over": game.game_over, "won": game.won,
+        "player": [game.player.rect.topleft, game.player.key_count],
+        "enemies": [[enemy.rect.topleft, enemy.velocity] for enemy in game.enemies],
+    }).encode("utf-8"))
+    # opened doors and picked up keys show in the tiles
+    digest.update(game.maze.cells.tobytes())
+    return digest.hexdigest()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Replays a recorded session and prints how it ended"""
+    parser = argparse.ArgumentParser(description="Replay a recorded game session")
+    parser.add_argument("log", help="input log written by InputLog.save")
+    args = parser.parse_args(argv)
+    log: InputLog = InputLog.load(args.log)
+    started: float = time.perf_counter()
+    game: Game = replay(log)
+    elapsed: float = time.perf_counter() - started
+    print(f"Replayed {len(log)} steps ({len(log) * STEP_MS / 1000:.1f} s of play) "
+          f"in {elapsed:.2f} s")
+    print(f"level {game.level_index}, game over: {game.game_over}, won: {game.won}")
+    print(f"state {state_digest(game)}")
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
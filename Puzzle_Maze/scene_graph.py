@@ -0,0 +1,148 @@
+"""Retained drawing of a menu screen. The background and the widgets of a
+screen are composited once into a layer, and every frame after that is a
+single blit of the layer. A widget that changed since it was composited,
+for example one the mouse entered, is drawn again clipped to its own region
+and the layer is patched with just that region."""
+
+from typing import Callable, Dict, List, Tuple
+import pygame
+from drawable import union_rects
+from interactive_drawable_state import InteractiveDrawableState
+from interactive_text import InteractiveText
+
+
+class SceneNode:
+    """A widget of the scene with its dirty flag, the state it was
+    composited in and the region it covered"""
+
+    def __init__(self, widget: InteractiveText) -> None:
+        """Constructor for SceneNode
+
+        Args:
+            widget (InteractiveText): widget drawn by the node
+        """
+        self.widget: InteractiveText = widget
+        self.dirty: bool = True
+        self.state: InteractiveDrawableState | None = None
+        self.region: pygame.Rect | None = None
+
+    def changed(self) -> bool:
+        """returns whether the node was marked dirty or its widget switched
+        state since it was composited"""
+        return self.dirty or self.widget.state is not self.state
+
+    def composited(self) -> None:
+        """Records the widget as drawn in its current state and region"""
+        self.dirty = False
+        self.state = self.widget.state
+        self.region = self.widget.bounds
+
+
+class SceneGraph:
+    """Background and widgets of a screen in drawing order, composited into
+    a cached layer"""
+
+    def __init__(self, screen: pygame.Surface,
+                 draw_background: Callable[[], None]) -> None:
+        """Constructor for SceneGraph
+
+        Args:
+            screen (pygame.Surface): surface the scene is drawn on
+            draw_background (Callable[[], None]): draws what is behind the
+            widgets on the screen, it is called clipped to a region when
+            only that region is composited again
+        """
+        self._screen: pygame.Surface = screen
+        self._draw_background: Callable[[], None] = draw_background
+        self._nodes: List[SceneNode] = []
+        self._by_widget: Dict[int, SceneNode] = {}
+        # the composited scene and the screen size it was composited at
+        self._layer: pygame.Surface | None = None
+        self._layer_size: Tuple[int, int] | None = None
+        self.full_composites: int = 0
+        self.region_composites: int = 0
+
+    def add(self, widget: InteractiveText) -> SceneNode:
+        """Adds a widget drawn above the ones already in the scene
+
+        Args:
+            widget (InteractiveText): widget to draw
+        """
+        node: SceneNode = SceneNode(widget)
+        self._nodes.append(node)
+        self._by_widget[id(widget)] = node
+        self._layer = None
+        return node
+
+    def mark_dirty(self, widget: InteractiveText) -> None:
+        """Makes the next draw composite the region of widget again, for
+        changes that do not switch its state
+
+        Args:
+            widget (InteractiveText): widget that changed
+        """
+        node: SceneNode | None = self._by_widget.get(id(widget))
+        if node is not None:
+            node.dirty = True
+
+    def invalidate(self) -> None:
+        """Makes the next draw composite the whole scene again, for layout
+        changes
+        """
+        self._layer = None
+
+    def draw(self) -> None:
+        """Draws the scene on the screen, compositing only what changed
+        """
+        size: Tuple[int, int] = self._screen.get_size()
+        if self._layer is None or size != self._layer_size:
+            self._composite(size)
+            return
+        self._screen.blit(self._layer, (0, 0))
+        for node in self._nodes:
+            if node.changed():
+                self._composite_region(node)
+
+    def _composite(self, size: Tuple[int, int]) -> None:
+        """Draws the whole scene and keeps a copy of it as the layer"""
+        self._draw_background()
+        for node in self._nodes:
+            node.widget.draw()
+            node.composited()
+        self._layer = self._screen.copy()
+        self._layer_size = size
+        self.full_composites += 1
+
+    def _composite_region(self, node: SceneNode) -> None:
+        """Draws the region node covered before and covers now, with
+        everything overlapping it, and patches the layer with it"""
+        region: pygame.Rect | None = union_rects(node.region, node.widget.bounds)
+        if region is None or self._layer is None:
+            node.composited()
+            return
+        self._draw_clipped(node, region)
+        drawn: pygame.Rect | None = node.widget.bounds
+        if drawn is not None and not region.contains(drawn):
+            # drawing placed the widget somewhere it was not laid out yet,
+            # an outline shown for the first time after a resize
+            region = region.union(drawn)
+            self._draw_clipped(node, region)
+        node.composited()
+        self._layer.blit(self._screen, region, region)
+        self.region_composites += 1
+
+    def _draw_clipped(self, node: SceneNode, region: pygame.Rect) -> None:
+        """Draws the background, node and every other node overlapping
+        region, clipped to region"""
+        self._screen.set_clip(region)
+        self._draw_background()
+        for other in self._nodes:
+            if other is node or (other.region is not None
+                                 and other.region.colliderect(region)):
+                other.widget.draw()
+        self._screen.set_clip(None)
+
+    @property
+    def nodes(self) -> List[SceneNode]:
+        """returns the nodes in drawing order"""
+        return self._nodes
@@ -6,7 +6,11 @@ __date__ = "5/13/25"
 __license__ = "MIT"
 
 from abc import ABC, abstractmethod
+from typing import Tuple
 import pygame
+from hover_dispatcher import HoverDispatcher
+from interactive_text import InteractiveText
+from scene_graph import SceneGraph
 
 
 class Screen(ABC):
@@ -22,6 +26,13 @@ class Screen(ABC):
         self._screen: pygame.Surface = screen
         self._screen_width: float = self._screen.get_size()[0]
         self._screen_height: float = self._screen.get_size()[1]
+        # window size the layout was computed for, None to compute it again
+        self._layout_size: Tuple[int, int] | None = self._screen.get_size()
+        self._layout_version: int = 0
+        # widgets register themselves here to be hovered on MOUSEMOTION
+        self._hover: HoverDispatcher = HoverDispatcher()
+        # composited background and widgets, redrawn only where they change
+        self._scene: SceneGraph = SceneGraph(self._screen, self.draw_background)
 
     @abstractmethod
     def draw_screen(self) -> None:
@@ -33,6 +44,21 @@ class Screen(ABC):
         """Adjust variables to a size change
         """
 
+    def draw_background(self) -> None:
+        """Draws what is behind the widgets, nothing by default. The
+        scene calls it clipped to the region it draws again
+        """
+
+    def add_widget(self, widget: InteractiveText) -> None:
+        """Adds a widget above the ones already added, to be drawn
+        by the scene and hovered by the mouse
+
+        Args:
+            widget (InteractiveText): widget of the screen
+        """
+        self._scene.add(widget)
+        self._hover.add(widget)
+
     @property
     def screen(self) -> pygame.Surface:
         """Getter for screen variable
@@ -66,3 +92,64 @@ class Screen(ABC):
         """Resize size variables after screen change
         """
         self._screen_width, self._screen_height = self._screen.get_size()
+
+    def invalidate_layout(self) -> None:
+        """Makes the next update_layout compute the layout again, for
+        VIDEORESIZE events
+        """
+        self._layout_size = None
+
+    def update_layout(self) -> bool:
+        """Calls adjust_to_screen if the window size changed since the
+        layout was last computed
+
+        Returns:
+            bool: whether the layout was computed again
+        """
+        size: Tuple[int, int] = self._screen.get_size()
+        if size == self._layout_size:
+            return False
+        self._layout_size = size
+        self._layout_version += 1
+        self.adjust_to_screen()
+        self._hover.invalidate()
+        self._scene.invalidate()
+        return True
+
+    def handle_mouse_motion(self, event: pygame.event.Event) -> None:
+        """Hovers the widget under the mouse after a MOUSEMOTION event
+
+        Args:
+            event (pygame.event.Event): event from the event queue
+        """
+        self._hover.handle_event(event)
+
+    @property
+    def scene(self) -> SceneGraph:
+        """Getter for scene variable
+
+        Returns:
+            _scene (SceneGraph): the composited background
+            and widgets of the screen
+        """
+        return self._scene
+
+    @property
+    def hover(self) -> HoverDispatcher:
+        """Getter for hover variable
+
+        Returns:
+            _hover (HoverDispatcher): hit tests the widgets
+            of the screen against the mouse position
+        """
+        return self._hover
+
+    @property
+    def layout_version(self) -> int:
+        """Getter for layout version variable
+
+        Returns:
+            _layout_version (int): how many times the layout
+            was computed again since the screen was created
+        """
+        return self._layout_version
@@ -11,6 +11,13 @@ from typing import Any
 class ScreenState(ABC):
     """Base state class
     """
+    # frames per second the main loop draws at most, None for states
+    # that pace themselves
+    MAX_FPS: int | None = None
+    # True for states that send the areas they drew to the display
+    # themselves, the main loop then leaves the rest of the screen alone
+    PRESENTS_FRAME: bool = False
+
     @abstractmethod
     def display_screen(self, outer_class: Any) -> None:
         """Method to display screen dependent on current state
@@ -0,0 +1,445 @@
+"""A* solver for maze levels. It follows the same rules as Player._move:
+walls and locked doors block, walking onto a key picks it up, and walking
+into a locked door while holding a key uses the key and opens the door.
+The search runs over (cell, keys picked up, doors opened) states.
+
+Enemies patrol on a fixed schedule, so with an EnemySchedule the search also
+tracks the time. Time is counted in ticks of TICK_MS, the largest step both
+move delays are a multiple of, and a state is (cell, keys, doors, tick modulo
+the patrol period). Like Enemy.update, an enemy only catches the player on
+the ticks it moves."""
+
+from collections import deque
+import heapq
+import math
+from typing import Deque, Dict, FrozenSet, List, Sequence, Set, Tuple
+from GameObjects import TILE_WALL, TILE_GOAL, TILE_DOOR, TILE_KEY, TILE_EMPTY
+from GameObjects import PLAYER_MOVE_DELAY, ENEMY_MOVE_DELAY
+from maze_grid import MazeGrid, MazeLike
+from level_format import LevelData, EnemySpawn, DOOR_UNLOCKED
+
+Cell = Tuple[int, int]
+# flat cell index in the low bits, above it one bit per key picked up and one
+# per door opened. Packed into an int, which hashes faster than a tuple.
+SearchState = int
+
+UNREACHABLE: int = -1
+TICK_MS: int = math.gcd(PLAYER_MOVE_DELAY, ENEMY_MOVE_DELAY)
+PLAYER_TICKS: int = PLAYER_MOVE_DELAY // TICK_MS
+ENEMY_TICKS: int = ENEMY_MOVE_DELAY // TICK_MS
+# longest combined patrol period, in ticks, the schedule builds a table for
+MAX_PERIOD_TICKS: int = 1 << 16
+
+
+class Solution:
+    """Path found by the solver"""
+
+    def __init__(self, path: List[Cell], keys_collected: int, doors_opened: int) -> None:
+        """Constructor for Solution
+
+        Args:
+            path (List[Cell]): cells from the start to the goal, both included
+            keys_collected (int): number of keys picked up on the way
+            doors_opened (int): number of doors opened on the way
+        """
+        self.path: List[Cell] = path
+        self.keys_collected: int = keys_collected
+        self.doors_opened: int = doors_opened
+
+    @property
+    def length(self) -> int:
+        """returns the number of moves"""
+        return len(self.path) - 1
+
+    def moves(self) -> List[Tuple[int, int]]:
+        """returns the path as (dy, dx) steps, the same deltas
+        Player._move takes"""
+        return [(row - previous[0], col - previous[1])
+                for previous, (row, col) in zip(self.path, self.path[1:])]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(length={self.length}, " \
+            f"keys_collected={self.keys_collected}, doors_opened={self.doors_opened})"
+
+
+class TimedSolution(Solution):
+    """Path found while avoiding enemies, with the time of every move"""
+
+    def __init__(self, path: List[Cell], times: List[int],
+                 keys_collected: int, doors_opened: int) -> None:
+        """Constructor for TimedSolution
+
+        Args:
+            path (List[Cell]): cells from the start to the goal, both included
+            times (List[int]): ms after the level starts at which each cell of
+            the path is entered, 0 for the start
+            keys_collected (int): number of keys picked up on the way
+            doors_opened (int): number of doors opened on the way
+        """
+        super().__init__(path, keys_collected, doors_opened)
+        self.times: List[int] = times
+
+    @property
+    def arrival(self) -> int:
+        """returns the ms at which the goal is reached"""
+        return self.times[-1]
+
+
+class EnemySchedule:
+    """Lookup table of the cells enemies occupy when they move. Enemies only
+    bounce off walls and the maze edge, so every patrol is a cycle and the
+    table covers the least common multiple of their periods."""
+
+    def __init__(self, maze: MazeLike, enemies: Sequence[EnemySpawn]) -> None:
+        """Simulates each patrol once and merges them into one table
+
+        Args:
+            maze (MazeLike): maze the enemies patrol
+            enemies (Sequence[EnemySpawn]): spawn cell and velocity of each enemy
+        """
+        grid: MazeGrid = MazeGrid.coerce(maze)
+        self._cols: int = grid.cols
+        patrols: List[List[int]] = [self._patrol(grid, enemy) for enemy in enemies]
+        moves: int = math.lcm(*(len(patrol) for patrol in patrols)) if patrols else 1
+        if moves * ENEMY_TICKS > MAX_PERIOD_TICKS:
+            raise ValueError(f"enemy patrols repeat every {moves} moves, too long to tabulate")
+        self._period: int = moves * ENEMY_TICKS
+        no_enemies: FrozenSet[int] = frozenset()
+        self._occupied: List[FrozenSet[int]] = [no_enemies] * self._period
+        for move in range(moves):
+            self._occupied[move * ENEMY_TICKS] = frozenset(
+                patrol[move % len(patrol)] for patrol in patrols)
+
+    @staticmethod
+    def _patrol(grid: MazeGrid, enemy: EnemySpawn) -> List[int]:
+        """returns the flat cell of the enemy after 0, 1, 2... moves, until
+        its row and velocity repeat. Same rules as Enemy.update.
+
+        Raises:
+            ValueError: if the enemy spawns outside the maze, on a wall or
+            without moving
+        """
+        rows, cols = grid.shape
+        if not grid.in_bounds(enemy.row, enemy.col) or grid[enemy.row, enemy.col] == TILE_WALL:
+            raise ValueError(f"{enemy!r} is not on an open cell of the maze")
+        if enemy.velocity == 0:
+            raise ValueError(f"{enemy!r} does not move")
+        row, velocity = enemy.row, enemy.velocity
+        seen: Set[Tuple[int, int]] = set()
+        cells: List[int] = []
+        while (row, velocity) not in seen:
+            seen.add((row, velocity))
+            cells.append(row * cols + enemy.col)
+            new_row: int = row + velocity
+            if 0 <= new_row < rows and grid[new_row, enemy.col] != TILE_WALL:
+                row = new_row
+            else:
+                velocity = -velocity
+        return cells
+
+    @property
+    def period(self) -> int:
+        """returns the number of ticks after which the patrols repeat"""
+        return self._period
+
+    def occupied(self, tick: int) -> FrozenSet[int]:
+        """returns the flat cells where enemies catch the player on a tick,
+        empty on ticks the enemies do not move"""
+        if tick <= 0:
+            return frozenset()
+        return self._occupied[tick % self._period]
+
+    def cells_at(self, time: int) -> List[Cell]:
+        """returns the (row, col) cells enemies check for the player at a
+        time in ms, empty when they do not move then"""
+        if time % TICK_MS:
+            return []
+        return sorted(divmod(cell, self._cols) for cell in self.occupied(time // TICK_MS))
+
+
+class MazeSolver:
+    """Solver for one maze. The maze is analysed once, solve() can then be
+    called from any start cell."""
+
+    def __init__(self, maze: MazeLike) -> None:
+        grid: MazeGrid = MazeGrid.coerce(maze)
+        self._rows, self._cols = grid.shape
+        self._tiles: List[int] = grid.cells.ravel().tolist()
+        # per cell state bit of the key or door on it, 0 for every other cell.
+        # Keys take the low bits, doors the ones above them.
+        size: int = len(self._tiles)
+        self._cell_bits: int = max(size - 1, 1).bit_length()
+        keys: List[Cell] = grid.positions_of(TILE_KEY)
+        self._key_count: int = len(keys)
+        self._key_bits: List[int] = [0] * size
+        self._door_bits: List[int] = [0] * size
+        for bit, cell in enumerate(keys):
+            self._key_bits[self._flat(cell)] = 1 << (self._cell_bits + bit)
+        for bit, cell in enumerate(grid.positions_of(TILE_DOOR), self._key_count):
+            self._door_bits[self._flat(cell)] = 1 << (self._cell_bits + bit)
+        self._goal_distance: List[int] = self._distances_to_goal()
+        # only cells that can still lead to a goal are worth stepping on
+        self._moves: List[Tuple[int, ...]] = [
+            tuple(neighbor for neighbor in self._neighbors(cell)
+                  if self._goal_distance[neighbor] != UNREACHABLE)
+            if distance != UNREACHABLE else ()
+            for cell, distance in enumerate(self._goal_distance)]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """returns (rows, cols) of the maze"""
+        return (self._rows, self._cols)
+
+    def goal_distance(self, cell: Cell) -> int:
+        """returns the number of moves from the cell to the nearest goal
+        when doors are ignored, or UNREACHABLE"""
+        return self._goal_distance[self._flat(cell)]
+
+    def solve(self, start: Cell, keys: int = 0,
+              enemies: EnemySchedule | None = None) -> Solution | None:
+        """Finds a shortest path from start to a goal
+
+        Args:
+            start (Cell): (row, col) the player starts on
+            keys (int): keys the player already holds
+            enemies (EnemySchedule | None): patrols to avoid, the path is
+            then the one reaching the goal soonest
+
+        Returns:
+            Solution | None: the path, or None if no goal can be reached
+        """
+        start_index: int = self._flat(start)
+        if self._goal_distance[start_index] == UNREACHABLE:
+            return None
+        if enemies is not None:
+            return self._solve_with_enemies(start_index, keys, enemies)
+        cell_mask: int = (1 << self._cell_bits) - 1
+        key_mask: int = ((1 << self._key_count) - 1) << self._cell_bits
+        door_shift: int = self._cell_bits + self._key_count
+        start_state: SearchState = start_index
+        best: Dict[SearchState, int] = {start_state: 0}
+        parents: Dict[SearchState, SearchState] = {}
+        # ties on f are broken towards more moves, so the search dives along
+        # the distance field instead of fanning out across open floor
+        frontier: List[Tuple[int, int, SearchState]] = [
+            (self._goal_distance[start_index], 0, start_state)]
+
+        goal_distance, key_bits, door_bits = self._goal_distance, self._key_bits, self._door_bits
+        while frontier:
+            _, negative_moves, state = heapq.heappop(frontier)
+            moves: int = -negative_moves
+            if moves > best[state]:
+                continue
+            cell: int = state & cell_mask
+            if self._tiles[cell] == TILE_GOAL:
+                return self._solution(state, parents)
+            can_open: bool = \
+                keys + (state & key_mask).bit_count() > (state >> door_shift).bit_count()
+            base: int = state ^ cell
+            for neighbor in self._moves[cell]:
+                door_bit: int = door_bits[neighbor]
+                if door_bit and not state & door_bit:
+                    if not can_open:
+                        continue
+                    next_state: SearchState = base | door_bit | neighbor
+                else:
+                    next_state = base | key_bits[neighbor] | neighbor
+                if moves + 1 < best.get(next_state, moves + 2):
+                    best[next_state] = moves + 1
+                    parents[next_state] = state
+                    heapq.heappush(frontier, (
+                        moves + 1 + goal_distance[neighbor], -moves - 1, next_state))
+        return None
+
+    def _solve_with_enemies(self, start: int, keys: int,
+                            enemies: EnemySchedule) -> TimedSolution | None:
+        """Tries the shortest path first, walked as fast as the player can
+        move. No path reaches the goal sooner, so when no enemy catches the
+        player on it the time expanded search is not needed."""
+        fastest: Solution | None = self.solve(divmod(start, self._cols), keys)
+        if fastest is None:
+            return None
+        times: List[int] = [PLAYER_TICKS * move for move in range(1, fastest.length + 1)]
+        cells: List[int] = [row * self._cols + col for row, col in fastest.path]
+        caught: bool = any(cells[0] in enemies.occupied(tick) for tick in range(times[0]))
+        for cell, tick, last in zip(cells[1:], times, range(fastest.length - 1, -1, -1)):
+            end: int = tick + 1 if last == 0 else tick + PLAYER_TICKS
+            caught = caught or any(cell in enemies.occupied(later) for later in range(tick, end))
+        if not caught:
+            return TimedSolution(fastest.path, [0] + [tick * TICK_MS for tick in times],
+                                 fastest.keys_collected, fastest.doors_opened)
+        return self._solve_timed(start, keys, enemies)
+
+    def _solve_timed(self, start: int, keys: int,
+                     enemies: EnemySchedule) -> TimedSolution | None:
+        """A* over (state, tick) where the cost is the tick the goal is
+        reached. Each tick the player either waits or moves, a move makes it
+        wait PLAYER_TICKS before the next one. The player moves before the
+        enemies in a frame, so a move is checked against the enemies on its
+        own tick."""
+        period: int = enemies.period
+        cell_mask: int = (1 << self._cell_bits) - 1
+        # the first move is allowed once PLAYER_MOVE_DELAY has passed
+        tick: int = PLAYER_TICKS
+        if any(start in enemies.occupied(waited) for waited in range(tick)):
+            return None
+        first: int = start * period + tick % period
+        best: Dict[int, int] = {first: tick}
+        # state -> (previous state, tick of the move into it or -1 for a wait)
+        parents: Dict[int, Tuple[int, int]] = {}
+        frontier: List[Tuple[int, int, int]] = [(tick + self._timed_estimate(start), -tick, first)]
+        while frontier:
+            _, negative_tick, key = heapq.heappop(frontier)
+            tick = -negative_tick
+            if tick > best[key]:
+                continue
+            state: int = key // period
+            cell: int = state & cell_mask
+            if self._tiles[cell] == TILE_GOAL:
+                return self._timed_solution(key, period, parents)
+            for next_state, next_tick, moved in self._timed_steps(state, tick, keys, enemies):
+                next_key: int = next_state * period + next_tick % period
+                if next_tick < best.get(next_key, next_tick + 1):
+                    best[next_key] = next_tick
+                    parents[next_key] = (key, moved)
+                    heapq.heappush(frontier, (
+                        next_tick + self._timed_estimate(next_state & cell_mask),
+                        -next_tick, next_key))
+        return None
+
+    def _timed_steps(self, state: int, tick: int, keys: int,
+                     enemies: EnemySchedule) -> List[Tuple[int, int, int]]:
+        """returns (state, tick, move tick or -1) for waiting a tick and for
+        every move that is not caught. A move onto a goal ends the level on
+        its own tick."""
+        cell: int = state & ((1 << self._cell_bits) - 1)
+        steps: List[Tuple[int, int, int]] = []
+        if cell not in enemies.occupied(tick):
+            steps.append((state, tick + 1, -1))
+        for neighbor in self._moves[cell]:
+            entered: int | None = self._enter(state, neighbor, keys)
+            if entered is None or neighbor in enemies.occupied(tick):
+                continue
+            if self._tiles[neighbor] == TILE_GOAL:
+                steps.append((entered, tick, tick))
+            elif all(neighbor not in enemies.occupied(later)
+                     for later in range(tick + 1, tick + PLAYER_TICKS)):
+                steps.append((entered, tick + PLAYER_TICKS, tick))
+        return steps
+
+    def _enter(self, state: int, cell: int, keys: int) -> int | None:
+        """returns the state after walking onto cell, None if a locked door
+        blocks it. Same rules as the loop in solve."""
+        door_bit: int = self._door_bits[cell]
+        base: int = state & ~((1 << self._cell_bits) - 1)
+        if door_bit and not state & door_bit:
+            key_mask: int = ((1 << self._key_count) - 1) << self._cell_bits
+            held: int = keys + (state & key_mask).bit_count() - \
+                (state >> (self._cell_bits + self._key_count)).bit_count()
+            if held <= 0:
+                return None
+            return base | door_bit | cell
+        return base | self._key_bits[cell] | cell
+
+    def _timed_estimate(self, cell: int) -> int:
+        """returns a lower bound of the ticks left to reach a goal, the last
+        move ends the level on the tick it is made"""
+        return max(self._goal_distance[cell] - 1, 0) * PLAYER_TICKS
+
+    def _timed_solution(self, key: int, period: int,
+                        parents: Dict[int, Tuple[int, int]]) -> TimedSolution:
+        """Walks the parents back to the start, dropping the waits"""
+        cell_mask: int = (1 << self._cell_bits) - 1
+        keys_collected, doors_opened = self._counts(key // period)
+        path: List[Cell] = [divmod((key // period) & cell_mask, self._cols)]
+        times: List[int] = []
+        while key in parents:
+            key, moved = parents[key]
+            if moved >= 0:
+                times.append(moved * TICK_MS)
+                path.append(divmod((key // period) & cell_mask, self._cols))
+        times.append(0)
+        path.reverse()
+        times.reverse()
+        return TimedSolution(path, times, keys_collected, doors_opened)
+
+    def _neighbors(self, cell: int) -> List[int]:
+        """returns the flat indexes of the cells up, down, left and right"""
+        row, col = divmod(cell, self._cols)
+        neighbors: List[int] = []
+        if row > 0:
+            neighbors.append(cell - self._cols)
+        if row < self._rows - 1:
+            neighbors.append(cell + self._cols)
+        if col > 0:
+            neighbors.append(cell - 1)
+        if col < self._cols - 1:
+            neighbors.append(cell + 1)
+        return neighbors
+
+    def _distances_to_goal(self) -> List[int]:
+        """Breadth first search from every goal over the non wall cells.
+        Ignoring doors keeps it a lower bound, so it is the A* heuristic."""
+        distances: List[int] = [UNREACHABLE] * len(self._tiles)
+        queue: Deque[int] = deque()
+        for cell, tile in enumerate(self._tiles):
+            if tile == TILE_GOAL:
+                distances[cell] = 0
+                queue.append(cell)
+        while queue:
+            cell = queue.popleft()
+            for neighbor in self._neighbors(cell):
+                if distances[neighbor] == UNREACHABLE and self._tiles[neighbor] != TILE_WALL:
+                    distances[neighbor] = distances[cell] + 1
+                    queue.append(neighbor)
+        return distances
+
+    def _solution(self, state: SearchState,
+                  parents: Dict[SearchState, SearchState]) -> Solution:
+        """Walks the parents back to the start"""
+        cell_mask: int = (1 << self._cell_bits) - 1
+        keys_collected, doors_opened = self._counts(state)
+        path: List[Cell] = [divmod(state & cell_mask, self._cols)]
+        while state in parents:
+            state = parents[state]
+            path.append(divmod(state & cell_mask, self._cols))
+        path.reverse()
+        return Solution(path, keys_collected, doors_opened)
+
+    def _counts(self, state: int) -> Tuple[int, int]:
+        """returns how many keys were picked up and doors opened in a state"""
+        masks: int = state >> self._cell_bits
+        picked: int = masks & ((1 << self._key_count) - 1)
+        return picked.bit_count(), (masks >> self._key_count).bit_count()
+
+    def _flat(self, cell: Cell) -> int:
+        """returns the flat index of a (row, col) cell"""
+        row, col = cell
+        if not (0 <= row < self._rows and 0 <= col < self._cols):
+            raise ValueError(f"cell {cell} is outside the maze")
+        return row * self._cols + col
+
+
+def level_grid(level: LevelData) -> MazeGrid:
+    """returns the maze of a level as Game.load_level builds it, with doors
+    that start unlocked turned into empty tiles"""
+    grid: MazeGrid = MazeGrid.from_rows(level.tiles)
+    for (row, col), state in level.doors.items():
+        if state == DOOR_UNLOCKED and grid[row, col] == TILE_DOOR:
+            grid[row, col] = TILE_EMPTY
+    return grid
+
+
+def solve_level(level: LevelData, avoid_enemies: bool = False) -> Solution | None:
+    """Solves a level from its player spawn, optionally avoiding its enemies"""
+    grid: MazeGrid = level_grid(level)
+    schedule: EnemySchedule | None = None
+    if avoid_enemies:
+        schedule = EnemySchedule(grid, level.enemies)
+    return MazeSolver(grid).solve(level.player, enemies=schedule)
+
+
+def solve_levels(levels: Sequence[LevelData],
+                 avoid_enemies: bool = False) -> List[Solution | None]:
+    """Solves every level, None marks the unsolvable ones"""
+    return [solve_level(level, avoid_enemies) for level in levels]
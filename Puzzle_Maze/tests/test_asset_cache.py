@@ -0,0 +1,64 @@
+"""Testing with unittest for asset_cache module
+"""
+
+from unittest.mock import patch, MagicMock
+import unittest
+import pygame
+from asset_cache import AssetCache
+
+
+class TestAssetCache(unittest.TestCase):
+    """Unittesting AssetCache class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        AssetCache.reset_instance()
+        self._cache: AssetCache = AssetCache.get_instance()
+
+    def tearDown(self) -> None:
+        """Tear down method
+        """
+        AssetCache.reset_instance()
+
+    def test_singleton(self) -> None:
+        """Tests that get_instance returns the shared cache
+        """
+        self.assertIs(self._cache, AssetCache.get_instance())
+
+    def test_load_image_decodes_once(self) -> None:
+        """Tests that an image is decoded once and scaled once per size
+        """
+        with patch('pygame.image.load', wraps=pygame.image.load) as mock_load, \
+                patch('pygame.transform.scale', wraps=pygame.transform.scale) as mock_scale:
+            small = self._cache.load_image("assets/key.png", (8, 8))
+            again = self._cache.load_image("assets/key.png", (8, 8))
+            large = self._cache.load_image("assets/key.png", (16, 16))
+        self.assertIs(small, again)
+        self.assertEqual(large.get_size(), (16, 16))
+        mock_load.assert_called_once_with("assets/key.png")
+        self.assertEqual(mock_scale.call_count, 2)
+        self.assertEqual(self._cache.hits, 1)
+        self.assertEqual(self._cache.misses, 2)
+        self.assertEqual(len(self._cache), 2)
+
+    def test_get_uses_factory_once(self) -> None:
+        """Tests that derived surfaces are built once
+        """
+        factory = MagicMock(return_value=pygame.Surface((1, 1)))
+        first = self._cache.get("key", factory)
+        second = self._cache.get("key", factory)
+        self.assertIs(first, second)
+        factory.assert_called_once()
+
+    def test_clear(self) -> None:
+        """Tests that clear empties the cache and counters
+        """
+        self._cache.load_image("assets/key.png")
+        self._cache.clear()
+        self.assertEqual(len(self._cache), 0)
+        self.assertEqual(self._cache.misses, 0)
+        self.assertEqual(self._cache.hits, 0)
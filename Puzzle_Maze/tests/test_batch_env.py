@@ -0,0 +1,128 @@
+"""Testing with unittest for batch_env module
+"""
+
+from typing import Dict, List
+import os
+import random
+import tempfile
+import unittest
+import numpy as np
+import pygame
+from GameObjects import TILE_SIZE, TILE_DOOR, TILE_EMPTY
+from game import Game
+from game_input import ScriptedInput
+from level_format import LevelData, LevelPack, EnemySpawn, DOOR_UNLOCKED, write_level_pack
+from maze_generator import LevelGenerator
+from replay import DIRECTION_KEYS, NO_MOVE, UP, DOWN, RIGHT
+from batch_env import BatchMazeEnv, WIN_REWARD, CAUGHT_REWARD
+from game import DEFAULT_LEVEL_PACK
+
+
+class TestBatchMazeEnv(unittest.TestCase):
+    """Unittesting BatchMazeEnv class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        pygame.init()
+        self._directory = tempfile.TemporaryDirectory()
+        self._levels: List[LevelData] = list(LevelPack(DEFAULT_LEVEL_PACK)) + [
+            LevelGenerator(doors=2, enemies=3).generate(seed) for seed in range(5)]
+
+    def tearDown(self) -> None:
+        """Tear down method
+        """
+        self._directory.cleanup()
+
+    def _game(self, level: LevelData, keys: ScriptedInput) -> Game:
+        """returns a headless game playing only this level"""
+        path: str = os.path.join(self._directory.name, f"{id(level)}.jsonl")
+        write_level_pack(path, [level])
+        return Game(headless=True, input_source=keys, level_pack=path)
+
+    def test_matches_game_objects(self) -> None:
+        """Tests every step matches Player, Enemy and Game on the same inputs
+        """
+        env: BatchMazeEnv = BatchMazeEnv(self._levels, autoreset=False)
+        env.reset()
+        keys: List[ScriptedInput] = [ScriptedInput() for _ in self._levels]
+        games: List[Game] = [self._game(level, key) for level, key in zip(self._levels, keys)]
+        rng: random.Random = random.Random(4)
+        done: np.ndarray = np.zeros(len(games), dtype=bool)
+        for step in range(1500):
+            actions: List[int] = [rng.choice([NO_MOVE, UP, DOWN, RIGHT, RIGHT, DOWN])
+                                  for _ in games]
+            _, _, terminated, _, info = env.step(actions)
+            for index, game in enumerate(games):
+                if done[index]:
+                    continue
+                if actions[index] == NO_MOVE:
+                    keys[index].release()
+                else:
+                    keys[index].press(DIRECTION_KEYS[actions[index]])
+                game.step()
+                self.assertEqual(
+                    (env.player[index, 1] * TILE_SIZE, env.player[index, 0] * TILE_SIZE),
+                    game.player.rect.topleft, f"player of level {index}, step {step}")
+                self.assertEqual(env.keys[index], game.player.key_count)
+                self.assertEqual(
+                    [(int(row) * TILE_SIZE, int(velocity)) for row, _, velocity
+                     in env.enemies[index][env.enemy_mask[index]]],
+                    [(enemy.rect.top, enemy.velocity) for enemy in game.enemies])
+                self.assertEqual(bool(info["caught"][index]),
+                                 any(enemy.caught_player for enemy in game.enemies))
+                self.assertEqual(bool(info["won"][index]), game.won)
+                rows, cols = game.maze.shape
+                np.testing.assert_array_equal(env.tiles[index, :rows, :cols], game.maze.cells)
+                done[index] = terminated[index]
+        self.assertTrue(done.any())
+
+    def test_rewards_and_autoreset(self) -> None:
+        """Tests finished instances are scored and restarted
+        """
+        tiles: List[List[int]] = [[1, 1, 1, 1],
+                                  [1, 0, 2, 1],
+                                  [1, 0, 0, 1],
+                                  [1, 1, 1, 1]]
+        env: BatchMazeEnv = BatchMazeEnv(
+            [LevelData(tiles), LevelData(tiles, enemies=[EnemySpawn(2, 1, -1)])])
+        observation, _ = env.reset()
+        self.assertEqual(observation["enemies"].shape, (2, 1, 2))
+        self.assertEqual(observation["enemies"][0, 0].tolist(), [-1, -1])
+        rewards: Dict[int, float] = {}
+        for _ in range(25):
+            observation, reward, terminated, _, info = env.step([RIGHT, NO_MOVE])
+            for index in np.flatnonzero(terminated):
+                rewards[int(index)] = float(reward[index])
+                self.assertEqual(info["final_observation"]["player"][index].tolist(),
+                                 [[1, 2], [1, 1]][index])
+        self.assertEqual(rewards, {0: WIN_REWARD, 1: CAUGHT_REWARD})
+        self.assertEqual(observation["player"].tolist(), [[1, 1], [1, 1]])
+
+    def test_truncation_and_padding(self) -> None:
+        """Tests levels of different sizes share a batch and time out
+        """
+        small: List[List[int]] = [[1, 1, 1], [1, 0, 1], [1, 1, 1]]
+        large: List[List[int]] = [[1] * 5, [1, 0, 3, 2, 1], [1] * 5, [1] * 5]
+        env: BatchMazeEnv = BatchMazeEnv(
+            [LevelData(small), LevelData(large, doors={(1, 2): DOOR_UNLOCKED})],
+            num_envs=4, max_steps=10)
+        observation, _ = env.reset()
+        self.assertEqual(observation["tiles"].shape, (4, 4, 5))
+        self.assertEqual(observation["tiles"][1, 1, 2], TILE_EMPTY)
+        self.assertEqual(observation["tiles"][0, 1, 2], 1)
+        truncated: np.ndarray = np.zeros(4, dtype=bool)
+        for _ in range(10):
+            _, _, _, truncated, _ = env.step([NO_MOVE] * 4)
+        self.assertTrue(truncated.all())
+        self.assertNotEqual(TILE_DOOR, observation["tiles"][3, 1, 2])
+
+    def test_wrong_action_count(self) -> None:
+        """Tests one action per instance is required
+        """
+        env: BatchMazeEnv = BatchMazeEnv(self._levels[:2])
+        with self.assertRaises(ValueError):
+            env.step([UP])
+        with self.assertRaises(ValueError):
+            BatchMazeEnv([])
@@ -0,0 +1,112 @@
+"""Testing with unittest for benchmark module
+"""
+
+from typing import Any, Dict
+from io import StringIO
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import pygame
+from benchmark import (BENCHMARKS, MENU_SIZE, bench_menu, bench_draw, measure, run_benchmarks,
+                       find_regressions, environment_differences, main)
+
+
+def _results(**medians: float) -> Dict[str, Any]:
+    """returns results with the given p50 of each benchmark"""
+    return {"benchmarks": {name.replace("_", "."): {"p50": p50}
+                           for name, p50 in medians.items()}}
+
+
+class TestBenchmark(unittest.TestCase):
+    """Unittesting benchmark module
+    """
+
+    def test_measure(self) -> None:
+        """Tests the measurements of an operation
+        """
+        calls = []
+        stats = measure(lambda: calls.append(1), min_time=0.01, warmup=5)
+        self.assertEqual(len(calls), stats["calls"] + 5)
+        self.assertLessEqual(stats["p50"], stats["p95"])
+        self.assertLessEqual(stats["p95"], stats["p99"])
+        self.assertGreater(stats["per_second"], 0)
+        self.assertGreater(stats["batch"], 1)
+        self.assertEqual(stats["calls"] % stats["batch"], 0)
+
+    def test_every_benchmark_runs(self) -> None:
+        """Tests every benchmark runs on the dummy driver
+        """
+        results: Dict[str, Any] = run_benchmarks(min_time=0.01)
+        self.assertEqual(set(results["benchmarks"]), set(BENCHMARKS))
+        self.assertIn("python", results)
+
+    def test_own_display(self) -> None:
+        """Tests menus are drawn at the menu size after the game opened its
+        window, and the video driver setting is left as it was
+        """
+        with patch.dict(os.environ):
+            os.environ.pop("SDL_VIDEODRIVER", None)
+            run_benchmarks(["door.unlock"], min_time=0.01)
+            self.assertNotIn("SDL_VIDEODRIVER", os.environ)
+        bench_draw()
+        bench_menu()
+        self.assertEqual(pygame.display.get_surface().get_size(), MENU_SIZE)
+
+    def test_find_regressions(self) -> None:
+        """Tests only medians slower than the tolerance are flagged
+        """
+        baseline: Dict[str, Any] = _results(game_draw=1.0, door_unlock=1.0, menu_draw=0.0)
+        results: Dict[str, Any] = _results(game_draw=1.2, door_unlock=2.0, menu_draw=5.0,
+                                           new_one=9.0)
+        regressions: Dict[str, float] = find_regressions(results, baseline, tolerance=0.3)
+        self.assertEqual(list(regressions), ["door.unlock"])
+        self.assertAlmostEqual(regressions["door.unlock"], 1.0)
+
+    def test_main_compares_with_baseline(self) -> None:
+        """Tests the command line saves a baseline, then flags a regression
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            baseline: str = os.path.join(directory, "baseline.json")
+            output: str = os.path.join(directory, "results.json")
+            arguments = ["door.unlock", "--min-time", "0.01", "--baseline", baseline]
+            with patch('sys.stdout', new_callable=StringIO) as printed:
+                self.assertEqual(main(arguments + ["--save-baseline"]), 0)
+                with open(baseline, encoding="utf-8") as baseline_file:
+                    stored = json.load(baseline_file)
+                stored["benchmarks"]["door.unlock"]["p50"] /= 100
+                with open(baseline, "w", encoding="utf-8") as baseline_file:
+                    json.dump(stored, baseline_file)
+                self.assertEqual(main(arguments + ["--output", output]), 1)
+            self.assertIn("REGRESSION door.unlock", printed.getvalue())
+            with open(output, encoding="utf-8") as output_file:
+                self.assertEqual(list(json.load(output_file)["benchmarks"]), ["door.unlock"])
+
+    def test_other_machine_not_compared(self) -> None:
+        """Tests a baseline recorded on another machine or Python is not
+        compared with, and does not fail the run
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            baseline: str = os.path.join(directory, "baseline.json")
+            arguments = ["door.unlock", "--min-time", "0.01", "--baseline", baseline]
+            with patch('sys.stdout', new_callable=StringIO) as printed:
+                main(arguments + ["--save-baseline"])
+                with open(baseline, encoding="utf-8") as baseline_file:
+                    stored = json.load(baseline_file)
+                self.assertEqual(environment_differences(stored, stored), [])
+                stored["host"] = "elsewhere"
+                stored["python"] = "2.7"
+                stored["benchmarks"]["door.unlock"]["p50"] /= 100
+                with open(baseline, "w", encoding="utf-8") as baseline_file:
+                    json.dump(stored, baseline_file)
+                self.assertEqual(main(arguments), 0)
+            self.assertIn("different host, python", printed.getvalue())
+            self.assertNotIn("REGRESSION", printed.getvalue())
+
+    def test_unknown_benchmark(self) -> None:
+        """Tests a benchmark name that does not exist is rejected
+        """
+        with patch('sys.stderr', new_callable=StringIO):
+            with self.assertRaises(SystemExit):
+                main(["nope"])
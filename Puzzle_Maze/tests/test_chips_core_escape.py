@@ -5,12 +5,15 @@ __author__ = "Jessica Story"
 __date__ = "5/13/25"
 __license__ = "MIT"
 
-from unittest.mock import patch
+import itertools
+import os
+from unittest.mock import MagicMock, patch
 import unittest
 import pygame
 from chips_core_escape import ChipsCoreEscape
 from game_states import MainMenuState, PlayState
 from game import Game
+from replay import RECORD_ENV
 
 
 class TestChipsCoreEscape(unittest.TestCase):
@@ -117,6 +120,56 @@ class TestChipsCoreEscape(unittest.TestCase):
                 game.chips_core_escape()
             mock_handle_event.assert_called()
 
+    @patch('pygame.time.get_ticks', side_effect=itertools.count(0, 100))
+    @patch('pygame.event.wait', return_value=pygame.event.Event(pygame.NOEVENT))
+    @patch('pygame.event.get')
+    def test_idle_menu_sleeps(self, mock_event_queue: unittest.mock.MagicMock,
+                              mock_wait: unittest.mock.MagicMock,
+                              mock_ticks: unittest.mock.MagicMock) -> None:
+        """Tests the menu is not drawn again while nothing happens, the
+            loop waits for events instead
+
+            Args:
+            mock_event_queue  (unittest.mock.MagicMock):
+            mocks an empty queue, then a click and pressing x
+            mock_wait  (unittest.mock.MagicMock):
+            mocks waiting without an event arriving
+            mock_ticks  (unittest.mock.MagicMock):
+            mocks time passing between frames
+        """
+        game: ChipsCoreEscape = ChipsCoreEscape()
+        with patch.object(game.state, 'display_screen', autospec=True) as mock_display_screen:
+
+            mock_event_queue.side_effect = [
+                [], [], [],
+                [pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0))],
+                [pygame.event.Event(pygame.QUIT)]
+            ]
+            with self.assertRaises(SystemExit):
+                game.chips_core_escape()
+            self.assertEqual(mock_display_screen.call_count, 2)
+            self.assertEqual(mock_wait.call_count, 3)
+
+    @patch('pygame.display.update')
+    def test_play_frame_updated_once(self, mock_update: unittest.mock.MagicMock) -> None:
+        """Tests a game frame only sends its dirty areas and the profiler
+            overlay to the display, while a menu frame sends the whole screen
+
+            Args:
+            mock_update  (unittest.mock.MagicMock):
+            mocks sending areas of the screen to the display
+        """
+        game: ChipsCoreEscape = ChipsCoreEscape()
+        game._profiler = MagicMock(overlay=True)
+        game._profiler.draw_overlay.return_value = pygame.Rect(0, 0, 80, 20)
+        game.state = PlayState()
+        game._draw_frame()
+        self.assertEqual(mock_update.call_args_list[-1].args, ([pygame.Rect(0, 0, 80, 20)],))
+        self.assertTrue(all(call.args for call in mock_update.call_args_list))
+        game.state = MainMenuState()
+        game._draw_frame()
+        self.assertEqual(mock_update.call_args_list[-1].args, ())
+
     @patch.object(ChipsCoreEscape, 'chips_core_escape')
     def test_main(self, mock_chips_core_escape: unittest.mock.MagicMock) -> None:
         """Tests main function
@@ -136,6 +189,22 @@ class TestChipsCoreEscape(unittest.TestCase):
         game.play = Game()
         self.assertIsNot(first_game_object, game.play)
 
+    @patch('atexit.register')
+    def test_recorded_game(self, mock_register: unittest.mock.MagicMock) -> None:
+        """Tests games are recorded when the environment variable is set
+
+            Args:
+            mock_register  (unittest.mock.MagicMock):
+            mocks registering the save of the recording at exit
+        """
+        with patch.dict(os.environ, {RECORD_ENV: "session.json"}):
+            game: ChipsCoreEscape = ChipsCoreEscape()
+        game.play = Game()
+        mock_register.assert_called_once()
+        self.assertIsNotNone(game._recorder)
+        assert game._recorder is not None
+        self.assertIsNotNone(game._recorder.log)
+
     def test_state_property(self) -> None:
         """Tests whether game starts out in main menu state
         """
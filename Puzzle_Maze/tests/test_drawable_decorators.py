@@ -12,6 +12,8 @@ from typing import Any, Dict
 import pygame
 from text import Text
 from drawable_decorators import Outline, Button
+from font_pool import FontPool
+from text_cache import TextCache
 
 
 class TestOutline(unittest.TestCase):
@@ -23,6 +25,8 @@ class TestOutline(unittest.TestCase):
         """
         pygame.init()
         pygame.font.init()
+        FontPool.reset_instance()
+        TextCache.reset_instance()
         self._mock_screen = MagicMock()
         self._mock_screen.get_size.return_value = (1024, 768)
         self._text_parameters: Dict[str, Any] = {
@@ -108,16 +112,88 @@ class TestOutline(unittest.TestCase):
 
             mock_resize_screen.assert_called_once()
             mock_text_adjust_changes.assert_called_once()
-            mock_font_class.assert_called_once_with(
-                text.image_dir, int(
-                    outline.original_size + self._outline_size))
-            mock_render.assert_called_once_with(text.data, True, self._outline_color)
+            mock_font_class.assert_not_called()
+            mock_render.assert_not_called()
+
+            # same font size, the open font renders the new text
+            text.data = "new text"
+            outline._adjust_to_changes()
+
+            mock_font_class.assert_not_called()
+            mock_font.render.assert_called_with("new text", True, self._outline_color)
+
+    @patch('pygame.font.Font')
+    def test_adjust_to_changes_rerenders_changes(
+            self, mock_font_obj: unittest.mock.MagicMock) -> None:
+        """Tests the outline is only rendered again when the text, size or
+        color it is drawn with changes
+
+        Args:
+            mock_font_obj (unittest.mock.MagicMock): Mocks
+            font object to avoid issues with rendering
+        """
+        mock_font = MagicMock()
+        mock_font_obj.return_value = mock_font
+        mock_font.render.return_value = self._mock_screen
+
+        text = Text(**self._text_parameters)
+        outline = Outline(text, self._outline_color, self._outline_size)
+        mock_font_obj.reset_mock()
+        mock_font.render.reset_mock()
+
+        outline._adjust_to_changes()
+        mock_font_obj.assert_not_called()
+        mock_font.render.assert_not_called()
+
+        text.size = 40
+        outline._adjust_to_changes()
+        mock_font_obj.assert_any_call(text.image_dir, int(40 + self._outline_size))
+        mock_font.render.assert_any_call(text.data, True, self._outline_color)
+
+    @patch('pygame.font.Font')
+    def test_outline_memoized(self, mock_font_obj: unittest.mock.MagicMock) -> None:
+        """Tests a hovered outline is neither rendered nor placed again until
+        the screen size changes
+
+        Args:
+            mock_font_obj (unittest.mock.MagicMock): Mocks
+            font object to avoid issues with rendering
+        """
+        mock_font = MagicMock()
+        mock_font_obj.return_value = mock_font
+        mock_surface = MagicMock()
+        mock_font.render.return_value = mock_surface
+
+        text = Text(**self._text_parameters)
+        outline = Outline(text, self._outline_color, self._outline_size)
+        renders: int = mock_font.render.call_count
+        placements: int = mock_surface.get_rect.call_count
+        rect = outline.rect
+
+        for _ in range(50):
+            outline.dynamically_draw()
+        self.assertEqual(mock_font.render.call_count, renders)
+        self.assertIs(outline.rect, rect)
+
+        self._mock_screen.get_size.return_value = (800, 600)
+        outline.dynamically_draw()
+        self.assertEqual(mock_font.render.call_count, renders)
+        self.assertGreater(mock_surface.get_rect.call_count, placements)
+
+        placements = mock_surface.get_rect.call_count
+        outline.invalidate()
+        outline._adjust_to_changes()
+        # the text cache still holds the outline, it is only placed again
+        self.assertEqual(mock_font.render.call_count, renders)
+        self.assertEqual(mock_surface.get_rect.call_count, placements + 2)
 
 
 class TestButton(unittest.TestCase):
     def setUp(self) -> None:
         """Set up function
         """
+        FontPool.reset_instance()
+        TextCache.reset_instance()
         self._mock_screen = MagicMock()
         self._mock_screen.get_size.return_value = (1024, 768)
         self._text_parameters: Dict[str, Any] = {
@@ -220,3 +296,46 @@ class TestButton(unittest.TestCase):
         with patch.object(button.drawable, 'resize_screen') as mock_resize_screen:
             button._adjust_to_changes()
             mock_resize_screen.assert_called()
+
+    @patch('pygame.font.Font')
+    def test_scaled_variants_reused(self, mock_font_obj: unittest.mock.MagicMock) -> None:
+        """Tests the button image is scaled from the original once per window
+        size, and a resize back gives the original image
+
+        Args:
+            mock_font_obj (unittest.mock.MagicMock): Mocks font
+            object to avoid issues with rendering
+        """
+        mock_font_obj.return_value.render.return_value = self._mock_screen
+        text = Text(**self._text_parameters)
+        button = Button(text, "assets/button.png")
+        original: pygame.Surface = button.surface
+        with patch('pygame.transform.scale', wraps=pygame.transform.scale) as mock_scale:
+            for _ in range(5):
+                for size in ((800, 600), (1280, 720), (1024, 768)):
+                    self._mock_screen.get_size.return_value = size
+                    button._adjust_to_changes()
+                    button._adjust_to_changes()
+            self.assertEqual(mock_scale.call_count, 2)
+            for call in mock_scale.call_args_list:
+                self.assertIs(call.args[0], original)
+        self.assertIs(button.surface, original)
+        self._mock_screen.get_size.return_value = (512, 384)
+        button._adjust_to_changes()
+        self.assertEqual(button.surface.get_size(),
+                         (original.get_width() // 2, original.get_height() // 2))
+
+    @patch('pygame.font.Font')
+    def test_scaled_variants_bounded(self, mock_font_obj: unittest.mock.MagicMock) -> None:
+        """Tests only the most recent scaled variants are kept
+
+        Args:
+            mock_font_obj (unittest.mock.MagicMock): Mocks font
+            object to avoid issues with rendering
+        """
+        mock_font_obj.return_value.render.return_value = self._mock_screen
+        button = Button(Text(**self._text_parameters), "assets/button.png")
+        for width in range(600, 1000, 50):
+            self._mock_screen.get_size.return_value = (width, 600)
+            button._adjust_to_changes()
+        self.assertEqual(len(button._scaled), Button.SCALED_VARIANTS)
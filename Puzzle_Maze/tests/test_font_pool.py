@@ -0,0 +1,98 @@
+"""Testing with unittest for font_pool module
+"""
+
+import os
+import unittest
+import pygame
+from font_pool import FontPool
+from game_screens import MainMenu, InfoScreen
+from text_cache import TextCache
+
+FONT: str = "assets/Cyberpunks.ttf"
+
+
+class TestFontPool(unittest.TestCase):
+    """Unittesting FontPool class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        pygame.init()
+        FontPool.reset_instance()
+        TextCache.reset_instance()
+        self._pool: FontPool = FontPool.get_instance()
+
+    def tearDown(self) -> None:
+        """Tear down method
+        """
+        FontPool.reset_instance()
+        TextCache.reset_instance()
+
+    def test_fonts_shared(self) -> None:
+        """Tests a path and size is opened once and shared
+        """
+        font: pygame.font.Font = self._pool.get(FONT, 30)
+        self.assertIs(self._pool.get(FONT, 30.9), font)
+        self.assertIsNot(self._pool.get(FONT, 31), font)
+        self.assertEqual(self._pool.stats(), {
+            "fonts": 2, "memory_bytes": 2 * os.path.getsize(FONT), "hits": 1, "misses": 2,
+            "evictions": 0})
+        self.assertIn((FONT, 31), self._pool)
+        self._pool.clear()
+        self.assertEqual((len(self._pool), self._pool.memory_bytes), (0, 0))
+
+    def test_bounded_by_count(self) -> None:
+        """Tests the least recently used font is dropped past the capacity
+        """
+        pool: FontPool = FontPool(capacity=2)
+        pool.get(FONT, 10)
+        pool.get(FONT, 20)
+        pool.get(FONT, 10)
+        pool.get(FONT, 30)
+        self.assertEqual(len(pool), 2)
+        self.assertNotIn((FONT, 20), pool)
+        self.assertEqual(pool.evictions, 1)
+        with self.assertRaises(ValueError):
+            FontPool(capacity=0)
+
+    def test_bounded_by_memory(self) -> None:
+        """Tests fonts are dropped to stay within max_bytes, keeping the
+        newest one
+        """
+        pool: FontPool = FontPool(max_bytes=os.path.getsize(FONT))
+        for size in (10, 20, 30):
+            pool.get(FONT, size)
+        self.assertEqual(len(pool), 1)
+        self.assertIn((FONT, 30), pool)
+        self.assertEqual(pool.memory_bytes, os.path.getsize(FONT))
+        tiny: FontPool = FontPool(max_bytes=1)
+        tiny.get(FONT, 10)
+        self.assertEqual(len(tiny), 1)
+
+    def test_screens_share_fonts(self) -> None:
+        """Tests drawing the menus again opens no font, after the first frame
+        sizes the button text
+        """
+        screen: pygame.Surface = pygame.Surface((1280, 720))
+        menu: MainMenu = MainMenu(screen)
+        info: InfoScreen = InfoScreen(screen)
+        menu.draw_screen()
+        info.draw_screen()
+        opened: int = self._pool.misses
+        for _ in range(5):
+            menu.draw_screen()
+            info.draw_screen()
+        self.assertEqual(self._pool.misses, opened)
+        self.assertLess(len(self._pool), 10)
+
+    def test_dropped_on_quit(self) -> None:
+        """Tests pygame.quit drops the shared pool every time, since its
+        fonts are closed
+        """
+        for _ in range(2):
+            pool: FontPool = FontPool.get_instance()
+            pool.get(FONT, 30)
+            pygame.quit()
+            self.assertIsNot(FontPool.get_instance(), pool)
+            pygame.init()
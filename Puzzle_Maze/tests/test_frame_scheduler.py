@@ -0,0 +1,76 @@
+"""Testing with unittest for frame_scheduler module
+"""
+
+import unittest
+from unittest.mock import patch
+import pygame
+from frame_scheduler import FrameScheduler
+from game_clock import SimulatedClock
+from game_states import MainMenuState, PlayState
+
+
+class TestFrameScheduler(unittest.TestCase):
+    """Unittesting FrameScheduler class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        self._clock: SimulatedClock = SimulatedClock()
+        self._scheduler: FrameScheduler = FrameScheduler(self._clock, idle_wait_ms=500)
+        self._menu: MainMenuState = MainMenuState()
+
+    def test_idle_menu_not_drawn(self) -> None:
+        """Tests a menu is drawn once and then only after input
+        """
+        self.assertTrue(self._scheduler.should_draw(self._menu))
+        self._scheduler.drew(self._menu)
+        for _ in range(10):
+            self._clock.advance(100)
+            self.assertFalse(self._scheduler.should_draw(self._menu))
+        self.assertEqual(self._scheduler.timeout(self._menu), 500)
+        self._scheduler.notify()
+        self.assertTrue(self._scheduler.should_draw(self._menu))
+        self.assertEqual(self._scheduler.frames, 1)
+
+    def test_frames_capped(self) -> None:
+        """Tests input faster than MAX_FPS is drawn at MAX_FPS
+        """
+        frame_ms: int = 1000 // MainMenuState.MAX_FPS if MainMenuState.MAX_FPS else 0
+        self._scheduler.drew(self._menu)
+        self._scheduler.notify()
+        self.assertFalse(self._scheduler.should_draw(self._menu))
+        self.assertEqual(self._scheduler.timeout(self._menu), frame_ms)
+        self._clock.advance(frame_ms)
+        self.assertTrue(self._scheduler.should_draw(self._menu))
+        self.assertEqual(self._scheduler.timeout(self._menu), 1)
+
+    def test_state_change_draws(self) -> None:
+        """Tests a new state is drawn at once, and playing is drawn every
+        iteration without sleeping
+        """
+        self._scheduler.drew(self._menu)
+        self._scheduler.notify()
+        self.assertTrue(self._scheduler.dirty)
+        self._scheduler.drew(self._menu)
+        play: PlayState = PlayState()
+        for _ in range(3):
+            self.assertTrue(self._scheduler.should_draw(play))
+            self._scheduler.drew(play)
+        self.assertIsNone(self._scheduler.timeout(play))
+        self.assertEqual(self._scheduler.wait_for_events(play), [])
+        self.assertTrue(self._scheduler.should_draw(MainMenuState()))
+        with self.assertRaises(ValueError):
+            FrameScheduler(idle_wait_ms=0)
+
+    def test_wait_for_events(self) -> None:
+        """Tests waiting returns the event that woke the loop, or nothing
+        when the timeout passed
+        """
+        self._scheduler.drew(self._menu)
+        click: pygame.event.Event = pygame.event.Event(pygame.MOUSEBUTTONDOWN)
+        with patch("pygame.event.wait", side_effect=[
+                pygame.event.Event(pygame.NOEVENT), click]) as mock_wait:
+            self.assertEqual(self._scheduler.wait_for_events(self._menu), [])
+            self.assertEqual(self._scheduler.wait_for_events(self._menu), [click])
+            mock_wait.assert_called_with(500)
@@ -8,11 +8,19 @@ __license__ = "MIT"
 from unittest.mock import patch, MagicMock
 from typing import List, Tuple
 import unittest
+import os
 import sys
+import tempfile
 from io import StringIO
 from hypothesis import given
 from hypothesis.strategies import integers, sampled_from
-from game import TileSet, Game
+from game import TileSet, Game, FPS, STEP_MS, MAX_STEPS_PER_FRAME, TILE_LAYER_CAPACITY
+from game_clock import SimulatedClock
+from asset_cache import AssetCache
+from maze_grid import MazeGrid
+from level_format import LevelData, LevelPack, EnemySpawn, DOOR_UNLOCKED, write_level_pack
+from GameObjects import LockedDoorState, UnlockedDoorState
+from game_input import ScriptedInput
 from GameObjects import Enemy
 import pygame
 
@@ -69,8 +77,14 @@ class TestGame(unittest.TestCase):
         """Setup method
         """
         pygame.init()
+        AssetCache.reset_instance()
         self._game: Game = Game()
 
+    def tearDown(self) -> None:
+        """Tear down method, drops images that may be mocked
+        """
+        AssetCache.reset_instance()
+
     @given(integers(min_value=0, max_value=2))
     def test_load_levels(self, index: int) -> None:
         """Tests load levels funtion of Game class
@@ -81,6 +95,15 @@ class TestGame(unittest.TestCase):
         returnValue: List[List[int]] = self._game.load_levels()
         self.assertEqual(returnValue[index], self.LEVELS[index])
 
+    def test_load_levels_from_own_pack(self) -> None:
+        """Tests load levels reads the pack the game was made with
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            pack: str = os.path.join(directory, "levels.jsonl")
+            write_level_pack(pack, [LevelData(self.LEVELS[2]), LevelData(self.LEVELS[0])])
+            game: Game = Game(headless=True, level_pack=pack)
+            self.assertEqual(game.load_levels(), [self.LEVELS[2], self.LEVELS[0]])
+
     @given(integers(min_value=0, max_value=2))
     def test_load_level(self, index: int) -> None:
         """Tests load level funtion of Game class
@@ -144,6 +167,36 @@ class TestGame(unittest.TestCase):
             self.assertEqual(enemy.velocity, expected_enemy.velocity)
             self.assertEqual(enemy.image, expected_enemy.image)
 
+    def test_load_level_copies_level(self) -> None:
+        """Tests that playing a level does not change the stored level
+        """
+        self._game.load_level(0)
+        self._game.maze[8][4] = 0
+        self.assertEqual(self._game.levels[0].tiles[8][4], 4)
+        self.assertIsInstance(self._game.maze, MazeGrid)
+
+    def test_load_level_from_level_data(self) -> None:
+        """Tests that spawns and door states come from the level data
+        """
+        self._game.levels = [LevelData(
+            [[1, 1, 1, 1], [1, 0, 3, 1], [1, 0, 3, 1], [1, 1, 1, 1]],
+            player=(2, 1), enemies=[EnemySpawn(1, 1, -1)],
+            doors={(2, 2): DOOR_UNLOCKED})]
+        self._game.load_level(0)
+        self.assertEqual(self._game.player.rect.topleft, (self.TILE_SIZE, 2 * self.TILE_SIZE))
+        self.assertEqual(len(self._game.enemies), 1)
+        self.assertEqual(self._game.enemies[0].velocity, -1)
+        self.assertEqual(self._game.enemies[0].rect.topleft, (self.TILE_SIZE, self.TILE_SIZE))
+        self.assertIsInstance(self._game.door_index[(1, 2)]._state, LockedDoorState)
+        self.assertIsInstance(self._game.door_index[(2, 2)]._state, UnlockedDoorState)
+        self.assertEqual(self._game.maze[2][2], 0)
+
+    def test_levels_read_lazily(self) -> None:
+        """Tests that the game reads levels from a pack
+        """
+        self.assertIsInstance(self._game.levels, LevelPack)
+        self.assertEqual(len(self._game.levels), len(self.LEVELS))
+
     def test_load_level_player(self) -> None:
         """Tests that the player is set correctly
            correctly. Test load level of Game class
@@ -169,24 +222,97 @@ class TestGame(unittest.TestCase):
         self._game.load_level(0)
         self.assertEqual(len(self._game.doors), expected_size)
         self.assertEqual(self._game.door_unlock_time, None)
+        self.assertEqual(sorted(self._game.door_index), [(1, 0), (1, 1), (1, 2)])
+        self.assertIs(self._game.door_index[(1, 2)], self._game.doors[2])
 
     def test_draw(self) -> None:
-        """Tests draw function of Game class
+        """Tests draw function of Game class. The first frame
+            draws the cached background and every object
         """
         mock_screen = MagicMock(spec=pygame.Surface)
+        mock_screen.get_size.return_value = (self.TILE_SIZE * 12, self.TILE_SIZE * 12)
         self._game.screen = mock_screen
         self._game.load_levels()
         self._game.load_level(0)
         self._game.draw()
 
-        tile_count: int = sum(len(row) for row in self._game.maze)
+        background_count: int = 1
         enemy_count: int = len(self._game.enemies)
         door_count: int = len(self._game.doors)
         player_count: int = 1
-        total_call_count: int = tile_count + enemy_count + door_count + player_count
+        total_call_count: int = background_count + enemy_count + door_count + player_count
 
         self.assertEqual(mock_screen.blit.call_count, total_call_count)
 
+    def test_draw_unchanged_frame(self) -> None:
+        """Tests that a frame where nothing moved blits nothing
+        """
+        mock_screen = MagicMock(spec=pygame.Surface)
+        mock_screen.get_size.return_value = (self.TILE_SIZE * 12, self.TILE_SIZE * 12)
+        self._game.screen = mock_screen
+        self._game.draw()
+        mock_screen.reset_mock()
+        with patch('pygame.display.update') as mock_update:
+            self._game.draw()
+        mock_screen.blit.assert_not_called()
+        mock_update.assert_not_called()
+
+    def test_draw_moved_player(self) -> None:
+        """Tests that only the old and new player areas are
+            redrawn after the player moves
+        """
+        self._game.draw()
+        old_rect: pygame.Rect = self._game.player.rect.copy()
+        self._game.player.move_to(2 * self.TILE_SIZE, self.TILE_SIZE)
+        with patch('pygame.display.update') as mock_update:
+            self._game.draw()
+        dirty_rects: List[pygame.Rect] = mock_update.call_args[0][0]
+        self.assertIn(old_rect, dirty_rects)
+        self.assertIn(self._game.player.rect, dirty_rects)
+        self.assertEqual(len(dirty_rects), 2)
+
+    def test_draw_patches_tile_layer(self) -> None:
+        """Tests that a changed tile is patched into the cached
+            layer and only its area is redrawn
+        """
+        self._game.draw()
+        background = self._game.renderer.background
+        self._game.maze[8][4] = 0
+        with patch('pygame.display.update') as mock_update:
+            self._game.draw()
+        self.assertIs(background, self._game.renderer.background)
+        mock_update.assert_called_once_with(
+            [pygame.Rect(4 * self.TILE_SIZE, 8 * self.TILE_SIZE, self.TILE_SIZE, self.TILE_SIZE)])
+
+    def test_tile_layer_cached_per_level(self) -> None:
+        """Tests that returning to a level reuses its tile layer
+        """
+        self._game.draw()
+        first_layer = self._game.tile_layer
+        self._game.level_index = 1
+        self._game.load_level(1)
+        self._game.draw()
+        self.assertIsNot(first_layer, self._game.tile_layer)
+        self._game.level_index = 0
+        self._game.load_level(0)
+        self.assertIs(first_layer, self._game.tile_layer)
+
+    def test_tile_layers_bounded(self) -> None:
+        """Tests that only the most recently drawn levels keep their tile
+        layer, however many levels are played
+        """
+        self._game.levels = [LevelData(self.LEVELS[index % 3]) for index in range(10)]
+        first_layer = self._game.tile_layer
+        for index in range(1, 10):
+            self._game.level_index = index
+            self._game.load_level(index)
+            self.assertIsNotNone(self._game.tile_layer)
+        self.assertEqual(list(self._game.tile_layers),
+                         list(range(10 - TILE_LAYER_CAPACITY, 10)))
+        self._game.level_index = 0
+        self._game.load_level(0)
+        self.assertIsNot(first_layer, self._game.tile_layer)
+
     @patch('sys.stdout', new_callable=StringIO)
     def test_update_level_complete(self, mock_stdout: StringIO) -> None:
         """Test update function of Game class. Verifies
@@ -258,6 +384,7 @@ class TestGame(unittest.TestCase):
         mock_player_update = MagicMock()
         mock_draw = MagicMock()
 
+        self._game.clock = SimulatedClock(step=STEP_MS)
         with patch.object(self._game, 'update', mock_game_update), \
                 patch.object(self._game.player, 'update', mock_player_update), \
                 patch.object(self._game.enemies[0], 'update', mock_enemy_update), \
@@ -349,3 +476,133 @@ class TestTileSet(unittest.TestCase):
         """
         with self.assertRaises(IndexError):
             self._tile_class.get_tile_name(tile)
+
+
+class TestHeadlessGame(unittest.TestCase):
+    """Unittesting Game in headless mode
+    """
+    TILE_SIZE: int = 64
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        pygame.init()
+
+    def test_headless_does_not_open_window(self) -> None:
+        """Tests that a headless game never calls set_mode
+        """
+        with patch('pygame.display.set_mode') as mock_set_mode:
+            game: Game = Game(headless=True)
+            game.run_headless(10)
+        mock_set_mode.assert_not_called()
+        self.assertIsInstance(game.clock, SimulatedClock)
+
+    def test_headless_decodes_no_images(self) -> None:
+        """Tests that a headless game gets blank tiles even with a window
+        open, and unlocks doors without loading images
+        """
+        pygame.display.set_mode((1, 1))
+        with patch.object(AssetCache, 'load_image') as mock_load_image:
+            game: Game = Game(headless=True)
+            game.levels = [LevelData([[1, 1, 1, 1], [1, 0, 3, 2], [1, 1, 1, 1]], (1, 1))]
+            game.load_level(0)
+            game.player.key_count = 1
+            game.doors[0].interact(game.player, game.maze)
+        mock_load_image.assert_not_called()
+        self.assertTrue(game.tileset.headless)
+        self.assertTrue(all(door.headless for door in game.doors))
+
+    def test_headless_skips_draw(self) -> None:
+        """Tests that single iteration does not draw in headless mode
+        """
+        game: Game = Game(headless=True)
+        with patch.object(game, 'draw') as mock_draw:
+            game.single_iteration()
+        mock_draw.assert_not_called()
+
+    def test_scripted_input_moves_player(self) -> None:
+        """Tests that the player follows the injected input
+            and the simulated clock
+        """
+        keys: ScriptedInput = ScriptedInput([pygame.K_DOWN])
+        game: Game = Game(headless=True, input_source=keys)
+        game.run_headless(FPS)
+        self.assertEqual(game.player.rect.left, self.TILE_SIZE)
+        self.assertGreater(game.player.rect.top, self.TILE_SIZE)
+        self.assertEqual(game.clock.get_ticks(), FPS * (1000 // FPS))
+
+    def test_headless_stops_when_caught(self) -> None:
+        """Tests that the headless loop ends when an enemy
+            catches the player
+        """
+        game: Game = Game(headless=True)
+        game.player.move_to(*game.enemies[0].rect.topleft)
+        iterations: int = game.run_headless(1000)
+        self.assertTrue(game.game_over)
+        self.assertFalse(game.won)
+        self.assertLess(iterations, 1000)
+
+    @patch('pygame.event.post')
+    def test_only_windowed_game_posts_escape(self, mock_post: unittest.mock.Mock) -> None:
+        """Tests that being caught posts one escape key press in a windowed
+        game, and none in a headless game even with a window open
+
+        Args:
+            mock_post (unittest.mock.Mock): mocks the event queue
+        """
+        pygame.display.set_mode((1, 1))
+        for headless in (True, False):
+            game: Game = Game(headless=headless, clock=SimulatedClock(),
+                              input_source=ScriptedInput())
+            game.player.move_to(*game.enemies[0].rect.topleft)
+            for _ in range(100):
+                game.step()
+            self.assertTrue(game.game_over)
+        mock_post.assert_called_once()
+        self.assertEqual(mock_post.call_args.args[0].key, pygame.K_ESCAPE)
+
+    def test_frame_time_runs_fixed_steps(self) -> None:
+        """Tests frame time is simulated in whole steps, keeping the rest
+        """
+        game: Game = Game(headless=True, clock=SimulatedClock(step=50))
+        game.single_iteration()
+        self.assertEqual(game.sim_time, 2 * STEP_MS)
+        self.assertEqual(game.accumulator, 10)
+        game.single_iteration()
+        self.assertEqual(game.sim_time, 5 * STEP_MS)
+        self.assertEqual(game.accumulator, 0)
+
+    def test_catch_up_is_capped(self) -> None:
+        """Tests a long stall runs at most MAX_STEPS_PER_FRAME steps
+        """
+        game: Game = Game(headless=True, clock=SimulatedClock(step=10000))
+        game.single_iteration()
+        self.assertEqual(game.sim_time, MAX_STEPS_PER_FRAME * STEP_MS)
+        self.assertEqual(game.accumulator, 0)
+
+    def test_same_inputs_same_game(self) -> None:
+        """Tests the game only depends on simulated time, not on the frame
+            rate it was run at
+        """
+        positions: List[Tuple[int, int]] = []
+        for frame_ms in (16, 40, 100):
+            keys: ScriptedInput = ScriptedInput([pygame.K_DOWN])
+            game: Game = Game(headless=True, clock=SimulatedClock(step=frame_ms),
+                              input_source=keys)
+            while game.sim_time < 1000:
+                game.single_iteration()
+            self.assertEqual(game.sim_time, 1000)
+            positions.append(game.player.rect.topleft)
+        self.assertEqual(len(set(positions)), 1)
+        self.assertEqual(positions[0], (self.TILE_SIZE, 6 * self.TILE_SIZE))
+
+    def test_run_steps_stops_when_caught(self) -> None:
+        """Tests stepping without a clock ends when the player is caught
+        """
+        game: Game = Game(headless=True)
+        game.player.move_to(*game.enemies[0].rect.topleft)
+        steps: int = game.run_steps(1000)
+        self.assertTrue(game.game_over)
+        self.assertLess(steps, 1000)
+        self.assertEqual(game.sim_time, steps * STEP_MS)
+        self.assertEqual(game.clock.get_ticks(), 0)
@@ -0,0 +1,73 @@
+"""Testing with unittest for game_clock and game_input modules
+"""
+
+from unittest.mock import patch
+import unittest
+import pygame
+from game_clock import PygameClock, SimulatedClock
+from game_input import PressedKeys, ScriptedInput, KeyboardInput
+
+
+class TestSimulatedClock(unittest.TestCase):
+    """Unittesting SimulatedClock class
+    """
+
+    def test_tick_uses_framerate(self) -> None:
+        """Tests that a tick advances time by one frame
+        """
+        clock: SimulatedClock = SimulatedClock()
+        self.assertEqual(clock.tick(50), 20)
+        self.assertEqual(clock.get_ticks(), 20)
+
+    def test_tick_uses_fixed_step(self) -> None:
+        """Tests that a fixed step overrides the framerate
+        """
+        clock: SimulatedClock = SimulatedClock(start=100, step=5)
+        clock.tick(60)
+        clock.advance(10)
+        self.assertEqual(clock.get_ticks(), 115)
+
+    def test_tick_without_framerate(self) -> None:
+        """Tests that an uncapped tick does not move time
+        """
+        clock: SimulatedClock = SimulatedClock()
+        self.assertEqual(clock.tick(), 0)
+
+
+class TestPygameClock(unittest.TestCase):
+    """Unittesting PygameClock class
+    """
+
+    def test_get_ticks(self) -> None:
+        """Tests that ticks come from pygame.time
+        """
+        with patch('pygame.time.get_ticks', return_value=1234):
+            self.assertEqual(PygameClock().get_ticks(), 1234)
+
+
+class TestInputSources(unittest.TestCase):
+    """Unittesting input source classes
+    """
+
+    def test_scripted_input(self) -> None:
+        """Tests pressing and releasing keys
+        """
+        keys: ScriptedInput = ScriptedInput()
+        self.assertFalse(keys.get_pressed()[pygame.K_UP])
+        keys.press(pygame.K_UP)
+        self.assertTrue(keys.get_pressed()[pygame.K_UP])
+        self.assertFalse(keys.get_pressed()[pygame.K_DOWN])
+        keys.release()
+        self.assertFalse(keys.get_pressed()[pygame.K_UP])
+
+    def test_pressed_keys_equality(self) -> None:
+        """Tests that pressed keys compare by content
+        """
+        self.assertEqual(PressedKeys([1, 2]), PressedKeys([2, 1]))
+        self.assertEqual(PressedKeys([1]).keys, frozenset([1]))
+
+    def test_keyboard_input(self) -> None:
+        """Tests that keyboard input reads pygame's key state
+        """
+        with patch('pygame.key.get_pressed', return_value=PressedKeys([5])):
+            self.assertTrue(KeyboardInput().get_pressed()[5])
@@ -2,6 +2,7 @@ import unittest
 import pygame
 from unittest import mock
 from hypothesis import given, strategies as st
+from asset_cache import AssetCache
 
 from GameObjects import (
     GameObject,
@@ -18,7 +19,9 @@ from GameObjects import (
     TILE_GOAL,
     TILE_DOOR,
     TILE_KEY,
-    TILE_UNLOCKED
+    TILE_UNLOCKED,
+    index_doors,
+    find_door
 )
 
 
@@ -156,6 +159,39 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(p2.key_count, 0)
         self.assertEqual(door_maze[2][0], TILE_UNLOCKED)
 
+    def test_open_through_door_index(self):
+        door_maze = [[TILE_EMPTY, TILE_DOOR, TILE_EMPTY]]
+        p = Player((0, 0), image=self.surface)
+        p.key_count = 1
+        door = Door((TILE_SIZE, 0), LockedDoorState())
+        with mock.patch('pygame.key.get_pressed', return_value=Pressed(pygame.K_RIGHT)), \
+                mock.patch('pygame.time.get_ticks', return_value=PLAYER_MOVE_DELAY + 1):
+            p.update(door_maze, index_doors([door]))
+        self.assertEqual(p.key_count, 0)
+        self.assertEqual(p.rect.topleft, (TILE_SIZE, 0))
+        self.assertIsInstance(door._state, UnlockedDoorState)
+
+
+class TestDoorLookup(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.doors = [Door((col * TILE_SIZE, row * TILE_SIZE), LockedDoorState())
+                      for row, col in [(0, 3), (2, 1), (4, 4)]]
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_index_doors(self):
+        index = index_doors(self.doors)
+        self.assertEqual(sorted(index), [(0, 3), (2, 1), (4, 4)])
+        self.assertIs(index[(2, 1)], self.doors[1])
+
+    @given(row=st.integers(0, 5), col=st.integers(0, 5))
+    def test_index_matches_scan(self, row, col):
+        self.assertIs(find_door(index_doors(self.doors), row, col),
+                      find_door(self.doors, row, col))
+
 
 class TestDoorStates(unittest.TestCase):
     def setUp(self):
@@ -252,8 +288,12 @@ class TestDefaultImageLoading(unittest.TestCase):
     def setUp(self):
         pygame.init()
         pygame.display.set_mode((1, 1))
+        # start from an empty cache so the default images are really loaded
+        AssetCache.reset_instance()
 
     def tearDown(self):
+        # do not leak mocked images to other tests
+        AssetCache.reset_instance()
         pygame.quit()
 
     @mock.patch('pygame.image.load')
@@ -281,3 +321,23 @@ class TestDefaultImageLoading(unittest.TestCase):
         # verify scaling size
         posargs = mock_scale.call_args[0]
         self.assertEqual(posargs[1], (TILE_SIZE, TILE_SIZE))
+
+    def test_images_shared_through_cache(self):
+        # Ensure a second object reuses the decoded and scaled image
+        first = Enemy((0, 0))
+        second = Enemy((TILE_SIZE, 0))
+        self.assertIs(first.image, second.image)
+        self.assertEqual(AssetCache.get_instance().misses, 1)
+        self.assertEqual(AssetCache.get_instance().hits, 1)
+
+    def test_door_unlock_reuses_cached_image(self):
+        # Ensure unlocking two doors loads the unlocked image once
+        maze = [[TILE_DOOR, TILE_DOOR]]
+        player = Player((0, 0), image=DummySurface())
+        player.key_count = 2
+        doors = [Door((0, 0), LockedDoorState()), Door((TILE_SIZE, 0), LockedDoorState())]
+        with mock.patch('pygame.image.load', wraps=pygame.image.load) as mock_load:
+            for door in doors:
+                door.interact(player, maze)
+        mock_load.assert_called_once_with("assets/door_unlocked.png")
+        self.assertIs(doors[0].image, doors[1].image)
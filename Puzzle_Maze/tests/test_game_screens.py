@@ -167,6 +167,35 @@ class TestMainMenu(unittest.TestCase):
         text: str = menu.quit_button.button.data
         self.assertIn("Quit", text)
 
+    def test_steady_frames_do_not_scale(self) -> None:
+        """Tests the background and buttons are only scaled again after the
+        window is resized
+        """
+        menu = MainMenu(self._mock_screen)
+        menu.draw_screen()
+        with patch('pygame.transform.scale', wraps=pygame.transform.scale) as mock_scale:
+            for _ in range(10):
+                menu.draw_screen()
+            mock_scale.assert_not_called()
+            self.assertEqual(menu.layout_version, 0)
+
+            self._mock_screen.get_size.return_value = self._valid_screen_size2
+            menu.draw_screen()
+            # the background and the three buttons
+            self.assertEqual(mock_scale.call_count, 4)
+            self.assertEqual(menu.layout_version, 1)
+            self.assertEqual(menu.screen_width, self._valid_screen_size2[0])
+
+    def test_invalidate_layout(self) -> None:
+        """Tests a resize event makes the next frame compute the layout
+        """
+        menu = MainMenu(self._mock_screen)
+        menu.invalidate_layout()
+        with patch.object(menu, 'adjust_to_screen') as mock_adjust:
+            self.assertTrue(menu.update_layout())
+            self.assertFalse(menu.update_layout())
+            mock_adjust.assert_called_once()
+
 
 class TestInfoScreen(unittest.TestCase):
     """Tests class for the Info Screen class
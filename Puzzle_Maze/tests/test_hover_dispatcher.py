@@ -0,0 +1,95 @@
+"""Testing with unittest for hover_dispatcher module
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+import pygame
+from game_screens import MainMenu
+from hover_dispatcher import HoverDispatcher
+from interactive_text import InteractiveText
+
+
+def fake_widget(rect: pygame.Rect) -> MagicMock:
+    """returns a widget double covering rect"""
+    widget: MagicMock = MagicMock(spec=InteractiveText)
+    widget.hit_rect = rect
+    return widget
+
+
+class TestHoverDispatcher(unittest.TestCase):
+    """Unittesting HoverDispatcher class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        pygame.init()
+        self._screen: pygame.Surface = pygame.Surface((1280, 720))
+
+    def test_hover_follows_motion(self) -> None:
+        """Tests moving onto a button hovers it and moving away makes it
+        idle again, reusing the same state objects
+        """
+        menu: MainMenu = MainMenu(self._screen)
+        menu.draw_screen()
+        play = menu.play_button
+        assert play.button.rect is not None
+        menu.handle_mouse_motion(pygame.event.Event(
+            pygame.MOUSEMOTION, pos=play.button.rect.center))
+        self.assertIs(play.state, play.hover_state)
+        self.assertIs(play.button.drawable, play.outline)
+        self.assertIs(menu.hover.hovered, play)
+        menu.handle_mouse_motion(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1)))
+        self.assertIs(play.state, play.idle_state)
+        self.assertIs(play.text.color, play.color)
+        self.assertIsNone(menu.hover.hovered)
+
+    def test_drawing_does_not_poll_mouse(self) -> None:
+        """Tests drawing a screen never asks pygame for the mouse position
+        """
+        menu: MainMenu = MainMenu(self._screen)
+        with patch("pygame.mouse.get_pos") as mock_get_pos:
+            for _ in range(5):
+                menu.draw_screen()
+        mock_get_pos.assert_not_called()
+
+    def test_events_only_on_change(self) -> None:
+        """Tests widgets are told about entering and leaving once
+        """
+        widget: MagicMock = fake_widget(pygame.Rect(100, 100, 200, 50))
+        dispatcher: HoverDispatcher = HoverDispatcher([widget])
+        for x_pos in range(110, 290, 10):
+            dispatcher.move_to((x_pos, 120))
+        dispatcher.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        dispatcher.move_to((10, 10))
+        dispatcher.move_to((20, 10))
+        self.assertEqual([call.args for call in widget.set_hovered.call_args_list],
+                         [(True,), (False,)])
+
+    def test_topmost_widget_wins(self) -> None:
+        """Tests the grid finds the widget drawn last where widgets overlap
+        """
+        below: MagicMock = fake_widget(pygame.Rect(0, 0, 200, 200))
+        above: MagicMock = fake_widget(pygame.Rect(150, 150, 100, 100))
+        empty: MagicMock = fake_widget(pygame.Rect(0, 0, 0, 0))
+        dispatcher: HoverDispatcher = HoverDispatcher([below, above, empty], cell_size=100)
+        self.assertIs(dispatcher.widget_at((160, 160)), above)
+        self.assertIs(dispatcher.widget_at((50, 50)), below)
+        self.assertIsNone(dispatcher.widget_at((260, 260)))
+        self.assertEqual(dispatcher.cell_count, 7)
+        with self.assertRaises(ValueError):
+            HoverDispatcher(cell_size=0)
+
+    def test_invalidate_rebuilds_grid(self) -> None:
+        """Tests moved widgets are only found where they are after
+        invalidate
+        """
+        widget: MagicMock = fake_widget(pygame.Rect(0, 0, 50, 50))
+        dispatcher: HoverDispatcher = HoverDispatcher()
+        dispatcher.add(widget)
+        self.assertIs(dispatcher.widget_at((10, 10)), widget)
+        widget.hit_rect = pygame.Rect(500, 500, 50, 50)
+        self.assertIs(dispatcher.widget_at((10, 10)), widget)
+        dispatcher.invalidate()
+        self.assertIsNone(dispatcher.widget_at((10, 10)))
+        self.assertIs(dispatcher.widget_at((510, 510)), widget)
@@ -0,0 +1,154 @@
+"""Testing with unittest for level_archive module
+"""
+
+from typing import List
+import os
+import tempfile
+import unittest
+import numpy as np
+from level_format import LevelData, LevelPack, EnemySpawn, DOOR_UNLOCKED
+from level_archive import LevelArchive, write_level_archive, open_levels, main
+from game import Game
+
+
+class TestLevelArchive(unittest.TestCase):
+    """Unittesting LevelArchive class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        self._directory = tempfile.TemporaryDirectory()
+        self._path: str = os.path.join(self._directory.name, "pack.pmla")
+        self._levels: List[LevelData] = [
+            LevelData([[1, 1, 1], [1, index % 6, 3], [1, 3, 1]], player=(1, 1),
+                      enemies=[EnemySpawn(1, 1, -1), EnemySpawn(2, 2, 1)],
+                      doors={(1, 2): DOOR_UNLOCKED}, name=f"level {index}")
+            for index in range(100)]
+        write_level_archive(self._path, self._levels)
+
+    def tearDown(self) -> None:
+        """Tear down method
+        """
+        self._directory.cleanup()
+
+    def test_random_access(self) -> None:
+        """Tests reading levels by index
+        """
+        with LevelArchive(self._path) as archive:
+            self.assertEqual(len(archive), 100)
+            self.assertEqual(archive[73], self._levels[73])
+            self.assertEqual(archive[-1], self._levels[-1])
+            with self.assertRaises(IndexError):
+                archive[100]
+
+    def test_iterate(self) -> None:
+        """Tests streaming every level
+        """
+        with LevelArchive(self._path) as archive:
+            self.assertEqual(list(archive), self._levels)
+
+    def test_tiles_view(self) -> None:
+        """Tests reading only the tiles of a level
+        """
+        with LevelArchive(self._path) as archive:
+            tiles = archive.tiles(5)
+            self.assertTrue(np.array_equal(tiles, np.array(self._levels[5].tiles)))
+            self.assertFalse(tiles.flags.writeable)
+            del tiles
+
+    def test_large_level(self) -> None:
+        """Tests a level larger than the 12x12 ones
+        """
+        level: LevelData = LevelData(np.ones((300, 200), dtype=np.uint8).tolist())
+        write_level_archive(self._path, [level])
+        with LevelArchive(self._path) as archive:
+            self.assertEqual(archive.tiles(0).shape, (300, 200))
+
+    def test_rejects_other_files(self) -> None:
+        """Tests that files that are not archives raise ValueError
+        """
+        for content in [b"", b"not an archive at all, just some text here"]:
+            with open(self._path, "wb") as archive:
+                archive.write(content)
+            with self.assertRaises(ValueError):
+                LevelArchive(self._path)
+
+    def test_open_levels_by_extension(self) -> None:
+        """Tests choosing the reader from the file extension
+        """
+        with open_levels(self._path) as levels:
+            self.assertIsInstance(levels, LevelArchive)
+        with open_levels("levels/default.jsonl") as pack:
+            self.assertIsInstance(pack, LevelPack)
+
+    def test_rejects_truncated_files(self) -> None:
+        """Tests that an archive cut short or with a broken index raises a
+        ValueError saying so, and leaves no file open
+        """
+        with open(self._path, "rb") as archive:
+            data: bytes = archive.read()
+        footer: int = len(data) - 20
+        for content, message in [(data[:len(data) // 2], "truncated"),
+                                 (data[:footer - 8] + data[footer:], "corrupt"),
+                                 (data[:footer] + (10 ** 6).to_bytes(8, "little")
+                                  + data[footer + 8:], "corrupt")]:
+            with open(self._path, "wb") as archive:
+                archive.write(content)
+            with self.assertRaisesRegex(ValueError, message):
+                LevelArchive(self._path)
+
+    def test_rejects_bad_offsets(self) -> None:
+        """Tests that an index pointing outside the level data raises a
+        ValueError when the level is read
+        """
+        with open(self._path, "r+b") as archive:
+            data: bytes = archive.read()
+            index_offset: int = int.from_bytes(data[-12:-4], "little")
+            archive.seek(index_offset)
+            archive.write(len(data).to_bytes(8, "little"))
+        with LevelArchive(self._path) as archive:
+            with self.assertRaisesRegex(ValueError, "level 0 starts at byte"):
+                archive[0]
+            self.assertEqual(archive[1], self._levels[1])
+
+    def test_rejects_bad_door_state(self) -> None:
+        """Tests that a door state byte out of range raises the corrupt
+        archive ValueError
+        """
+        level: LevelData = self._levels[0]
+        write_level_archive(self._path, [level])
+        # the state byte of the only door follows the header, record, name
+        # and enemies
+        position: int = 8 + 16 + len(level.name.encode("utf-8")) + 6 * len(level.enemies) + 4
+        with open(self._path, "r+b") as archive:
+            archive.seek(position)
+            archive.write(bytes([200]))
+        with LevelArchive(self._path) as archive:
+            with self.assertRaisesRegex(ValueError, "door in state 200, the archive is corrupt"):
+                archive[0]
+
+    def test_closed_with_game(self) -> None:
+        """Tests that closing a game unmaps the archive it played
+        """
+        with Game(headless=True, level_pack=self._path) as game:
+            archive = game.levels
+            assert isinstance(archive, LevelArchive)
+            self.assertEqual(game.load_levels()[3], self._levels[3].tiles)
+        with self.assertRaises(ValueError):
+            archive[0]
+
+    def test_convert_pack(self) -> None:
+        """Tests converting the default pack into an archive
+        """
+        main(["levels/default.jsonl", self._path])
+        with LevelArchive(self._path) as archive:
+            self.assertEqual(list(archive), list(LevelPack("levels/default.jsonl")))
+
+    def test_game_loads_archive(self) -> None:
+        """Tests that a game can play levels from an archive
+        """
+        game: Game = Game(headless=True, level_pack=self._path)
+        game.load_level(42)
+        self.assertEqual(game.maze, [[1, 1, 1], [1, 0, 0], [1, 3, 1]])
+        self.assertEqual(len(game.enemies), 2)
@@ -0,0 +1,119 @@
+"""Testing with unittest for level_format module
+"""
+
+from typing import List
+import os
+import tempfile
+import unittest
+from hypothesis import given
+from hypothesis.strategies import integers, lists
+from level_format import (LevelData, LevelPack, EnemySpawn, write_level_pack,
+                          DOOR_LOCKED, DOOR_UNLOCKED)
+
+
+class TestLevelData(unittest.TestCase):
+    """Unittesting LevelData class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        self._level: LevelData = LevelData(
+            [[1, 1, 1], [1, 3, 2], [1, 3, 1]], player=(1, 1),
+            enemies=[EnemySpawn(2, 1, -1)], doors={(2, 1): DOOR_UNLOCKED}, name="test")
+
+    def test_json_round_trip(self) -> None:
+        """Tests that a level survives being written and read
+        """
+        self.assertEqual(LevelData.from_json(self._level.to_json()), self._level)
+
+    def test_door_state_defaults_to_locked(self) -> None:
+        """Tests door states
+        """
+        self.assertEqual(self._level.door_state(1, 1), DOOR_LOCKED)
+        self.assertEqual(self._level.door_state(2, 1), DOOR_UNLOCKED)
+
+    def test_defaults(self) -> None:
+        """Tests the defaults of a minimal level
+        """
+        level: LevelData = LevelData.from_json('{"tiles": ["10", "01"]}')
+        self.assertEqual(level.tiles, [[1, 0], [0, 1]])
+        self.assertEqual(level.player, (1, 1))
+        self.assertEqual(level.enemies, [])
+
+    def test_invalid_levels(self) -> None:
+        """Tests that malformed levels raise ValueError
+        """
+        for line in ['[]', '{"name": "no tiles"}', '{"tiles": ["10", "1"]}',
+                     '{"tiles": ["1x"]}', '{"tiles": ["1"], "doors": [{"row": 0}]}']:
+            with self.assertRaises(ValueError):
+                LevelData.from_json(line)
+        with self.assertRaises(ValueError):
+            LevelData([[3]], doors={(0, 0): "ajar"})
+
+    @given(lists(lists(integers(min_value=0, max_value=5), min_size=2, max_size=2),
+                 min_size=1, max_size=4))
+    def test_tiles_round_trip(self, tiles: List[List[int]]) -> None:
+        """Tests that any tiles survive the text format
+        """
+        self.assertEqual(LevelData.from_json(LevelData(tiles).to_json()).tiles, tiles)
+
+
+class TestLevelPack(unittest.TestCase):
+    """Unittesting LevelPack class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        self._directory = tempfile.TemporaryDirectory()
+        self._path: str = os.path.join(self._directory.name, "pack.jsonl")
+        self._levels: List[LevelData] = [
+            LevelData([[1, 1], [index % 6, 1]], name=f"level {index}") for index in range(50)]
+        write_level_pack(self._path, self._levels)
+
+    def tearDown(self) -> None:
+        """Tear down method
+        """
+        self._directory.cleanup()
+
+    def test_random_access(self) -> None:
+        """Tests indexing levels in any order
+        """
+        pack: LevelPack = LevelPack(self._path)
+        self.assertEqual(len(pack), 50)
+        self.assertEqual(pack[37], self._levels[37])
+        self.assertEqual(pack[-1], self._levels[-1])
+        self.assertEqual(pack[0], self._levels[0])
+        with self.assertRaises(IndexError):
+            pack[50]
+
+    def test_streaming(self) -> None:
+        """Tests iterating the pack in order
+        """
+        self.assertEqual(list(LevelPack(self._path)), self._levels)
+
+    def test_skips_blank_and_comment_lines(self) -> None:
+        """Tests that blank lines and comments are not levels
+        """
+        with open(self._path, "a", encoding="utf-8") as pack:
+            pack.write("\n# generated by hand\n")
+            pack.write(LevelData([[2]]).to_json() + "\n")
+        pack_levels: LevelPack = LevelPack(self._path)
+        self.assertEqual(len(pack_levels), 51)
+        self.assertEqual(pack_levels[50].tiles, [[2]])
+
+    def test_error_names_level(self) -> None:
+        """Tests that a broken level reports where it is
+        """
+        with open(self._path, "a", encoding="utf-8") as pack:
+            pack.write("{broken\n")
+        with self.assertRaisesRegex(ValueError, "level 50"):
+            LevelPack(self._path)[50]
+
+    def test_default_pack(self) -> None:
+        """Tests that the shipped pack holds the original levels
+        """
+        pack: LevelPack = LevelPack("levels/default.jsonl")
+        self.assertEqual(len(pack), 3)
+        self.assertEqual(pack[2].enemies, [EnemySpawn(10, 1, -1), EnemySpawn(1, 10, 1)])
@@ -0,0 +1,144 @@
+"""Testing with unittest for maze_generator module
+"""
+
+from itertools import islice
+from typing import List
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from GameObjects import TILE_WALL, TILE_GOAL, TILE_DOOR, TILE_KEY, TILE_UNLOCKED
+from level_format import LevelData, LevelPack
+from level_archive import LevelArchive
+from maze_generator import LevelGenerator, generate_levels, main
+from solver import Solution, solve_level
+
+
+class TestLevelGenerator(unittest.TestCase):
+    """Unittesting LevelGenerator class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        self._generator: LevelGenerator = LevelGenerator(doors=2, enemies=3)
+        self._levels: List[LevelData] = [self._generator.generate(seed) for seed in range(50)]
+
+    def test_same_seed_same_level(self) -> None:
+        """Tests a level only depends on its seed
+        """
+        self.assertEqual(self._generator.generate(7), self._levels[7])
+        self.assertNotEqual(self._levels[7], self._levels[8])
+
+    def test_level_shape(self) -> None:
+        """Tests the size, the walled border and the tile values
+        """
+        for level in self._levels:
+            self.assertEqual(len(level.tiles), self._generator.rows)
+            self.assertTrue(all(len(row) == self._generator.cols for row in level.tiles))
+            self.assertTrue(all(tile == TILE_WALL for tile in level.tiles[0]))
+            self.assertTrue(all(row[0] == TILE_WALL for row in level.tiles))
+            self.assertTrue(all(0 <= tile < TILE_UNLOCKED for row in level.tiles for tile in row))
+            self.assertEqual(sum(row.count(TILE_GOAL) for row in level.tiles), 1)
+            self.assertEqual(level.player, (1, 1))
+
+    def test_doors_have_keys(self) -> None:
+        """Tests every level has the doors asked for and every door needs
+        its key, so the solver opens all of them
+        """
+        for level in self._levels:
+            self.assertEqual(sum(row.count(TILE_DOOR) for row in level.tiles), 2)
+            self.assertEqual(sum(row.count(TILE_KEY) for row in level.tiles), 2)
+            solution: Solution | None = solve_level(level)
+            assert solution is not None
+            self.assertEqual(solution.doors_opened, 2)
+
+    def test_no_room_for_doors(self) -> None:
+        """Tests asking for more doors than a level has room for gives fewer
+        instead of failing
+        """
+        level: LevelData = LevelGenerator(rows=5, cols=5, doors=4, enemies=0).generate(0)
+        doors: int = sum(row.count(TILE_DOOR) for row in level.tiles)
+        self.assertTrue(0 < doors < 4)
+        self.assertEqual(sum(row.count(TILE_KEY) for row in level.tiles), doors)
+
+    def test_large_levels_get_every_door(self) -> None:
+        """Tests big levels with loops get every door asked for, and none
+        of the loops goes around a door
+        """
+        generator: LevelGenerator = LevelGenerator(rows=101, cols=101, doors=4, enemies=0)
+        for seed in range(3):
+            level: LevelData = generator.generate(seed)
+            self.assertEqual(sum(row.count(TILE_DOOR) for row in level.tiles), 4)
+            self.assertEqual(sum(row.count(TILE_KEY) for row in level.tiles), 4)
+            solution: Solution | None = solve_level(level)
+            assert solution is not None
+            self.assertEqual(solution.doors_opened, 4)
+        perfect: LevelData = LevelGenerator(rows=101, cols=101, doors=4, enemies=0,
+                                            loops=0).generate(0)
+        self.assertGreater(sum(row.count(TILE_WALL) for row in perfect.tiles),
+                           sum(row.count(TILE_WALL) for row in level.tiles))
+
+    def test_solvable_around_enemies(self) -> None:
+        """Tests every level can be finished without being caught
+        """
+        for level in self._levels:
+            self.assertIsNotNone(solve_level(level, avoid_enemies=True))
+
+    def test_enemies_in_lanes(self) -> None:
+        """Tests enemies spawn on open cells with room to patrol
+        """
+        for level in self._levels:
+            self.assertLessEqual(len(level.enemies), 3)
+            for enemy in level.enemies:
+                self.assertNotEqual(level.tiles[enemy.row][enemy.col], TILE_WALL)
+                self.assertIn(enemy.velocity, (-1, 1))
+                open_cells: int = sum(1 for row in (enemy.row - 1, enemy.row + 1)
+                                      if level.tiles[row][enemy.col] != TILE_WALL)
+                self.assertGreater(open_cells, 0)
+        self.assertTrue(any(level.enemies for level in self._levels))
+
+    def test_too_small(self) -> None:
+        """Tests levels smaller than 5x5 are rejected
+        """
+        with self.assertRaises(ValueError):
+            LevelGenerator(rows=4)
+
+
+class TestGenerateLevels(unittest.TestCase):
+    """Unittesting generate_levels and main functions
+    """
+
+    def test_pool_matches_serial(self) -> None:
+        """Tests a batch generated across processes is the same as in order
+        """
+        generator: LevelGenerator = LevelGenerator()
+        serial: List[LevelData] = list(generate_levels(generator, 12, seed=100, workers=1))
+        pooled: List[LevelData] = list(generate_levels(generator, 12, seed=100, workers=2,
+                                                       chunk_size=5))
+        self.assertEqual(pooled, serial)
+        self.assertEqual(serial[0], generator.generate(100))
+
+    def test_seeds_submitted_as_needed(self) -> None:
+        """Tests only a few chunks are queued ahead, so a huge batch can be
+        started and read from
+        """
+        generator: LevelGenerator = LevelGenerator(rows=7, cols=7, enemies=0)
+        levels = generate_levels(generator, 10 ** 9, workers=2, chunk_size=1)
+        self.assertEqual(list(islice(levels, 3)), [generator.generate(seed) for seed in range(3)])
+        levels.close()
+
+    def test_main_writes_pack_and_archive(self) -> None:
+        """Tests the command line writes either format
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            pack: str = os.path.join(directory, "generated.jsonl")
+            archive: str = os.path.join(directory, "generated.pmla")
+            with patch('sys.stdout', new_callable=StringIO) as output:
+                main([pack, "--count", "5", "--seed", "3", "--workers", "1"])
+                main([archive, "--count", "5", "--seed", "3", "--workers", "1"])
+            self.assertIn("Wrote 5 levels", output.getvalue())
+            with LevelArchive(archive) as levels:
+                self.assertEqual(list(levels), list(LevelPack(pack)))
+            self.assertEqual(LevelPack(pack)[0], LevelGenerator().generate(3))
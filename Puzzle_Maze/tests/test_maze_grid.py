@@ -0,0 +1,96 @@
+"""Testing with unittest for maze_grid module
+"""
+
+from typing import List
+import unittest
+import numpy as np
+from hypothesis import given
+from hypothesis.strategies import integers, lists
+from maze_grid import MazeGrid
+from GameObjects import TILE_EMPTY, TILE_WALL, TILE_KEY, TILE_UNLOCKED
+
+
+class TestMazeGrid(unittest.TestCase):
+    """Unittesting MazeGrid class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        self._rows: List[List[int]] = [
+            [1, 1, 1, 1],
+            [1, 0, 4, 1],
+            [1, 5, 5, 1],
+        ]
+        self._grid: MazeGrid = MazeGrid.from_rows(self._rows)
+
+    def test_list_like_access(self) -> None:
+        """Tests reading and writing through grid[row][col]
+        """
+        self.assertEqual(len(self._grid), 3)
+        self.assertEqual(len(self._grid[0]), 4)
+        self.assertEqual(self._grid[1][2], TILE_KEY)
+        self._grid[1][2] = TILE_EMPTY
+        self.assertEqual(self._grid[1, 2], TILE_EMPTY)
+        self._grid[0, 0] = TILE_EMPTY
+        self.assertEqual(self._grid[0][0], TILE_EMPTY)
+
+    def test_copies_rows(self) -> None:
+        """Tests that the grid does not write into its source rows
+        """
+        self._grid[1][1] = TILE_WALL
+        self.assertEqual(self._rows[1][1], TILE_EMPTY)
+
+    def test_equality(self) -> None:
+        """Tests comparing grids with grids and nested lists
+        """
+        self.assertEqual(self._grid, self._rows)
+        self.assertEqual(self._grid, self._grid.copy())
+        self.assertNotEqual(self._grid, [[1, 1]])
+        self.assertNotEqual(self._grid, [[1], [1, 2]])
+        self.assertEqual(self._grid.tolist(), self._rows)
+
+    def test_queries(self) -> None:
+        """Tests the vectorized queries
+        """
+        self.assertEqual(self._grid.count(TILE_UNLOCKED), 2)
+        self.assertEqual(self._grid.positions_of(TILE_UNLOCKED), [(2, 1), (2, 2)])
+        self.assertTrue(self._grid.mask(TILE_KEY)[1, 2])
+        self.assertTrue(self._grid.in_bounds(2, 3))
+        self.assertFalse(self._grid.in_bounds(3, 0))
+
+    def test_replace(self) -> None:
+        """Tests replacing one tile value with another
+        """
+        self.assertEqual(self._grid.replace(TILE_UNLOCKED, TILE_EMPTY), 2)
+        self.assertEqual(self._grid.count(TILE_UNLOCKED), 0)
+        self.assertEqual(self._grid.replace(TILE_UNLOCKED, TILE_EMPTY), 0)
+
+    def test_neighbor_mask(self) -> None:
+        """Tests finding the cells next to a tile value
+        """
+        mask = self._grid.neighbor_mask(TILE_KEY)
+        expected = np.zeros((3, 4), dtype=bool)
+        expected[0, 2] = expected[1, 1] = expected[1, 3] = expected[2, 2] = True
+        self.assertTrue(np.array_equal(mask, expected))
+
+    def test_invalid_shape(self) -> None:
+        """Tests that a grid must be two dimensional
+        """
+        with self.assertRaises(ValueError):
+            MazeGrid([1, 2, 3])
+
+    def test_large_grid(self) -> None:
+        """Tests that a large grid stays one byte per cell
+        """
+        grid: MazeGrid = MazeGrid.filled(1000, 1000, TILE_WALL)
+        grid[500][500] = TILE_KEY
+        self.assertEqual(grid.cells.nbytes, 1000 * 1000)
+        self.assertEqual(grid.positions_of(TILE_KEY), [(500, 500)])
+
+    @given(lists(lists(integers(min_value=0, max_value=5), min_size=3, max_size=3),
+                 min_size=1, max_size=5))
+    def test_round_trip(self, rows: List[List[int]]) -> None:
+        """Tests that rows survive a trip through the grid
+        """
+        self.assertEqual(MazeGrid.from_rows(rows).tolist(), rows)
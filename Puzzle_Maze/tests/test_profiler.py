@@ -0,0 +1,121 @@
+"""Testing with unittest for profiler module
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import pygame
+from GameObjects import GameObject, Enemy
+from game import Game
+from game_screens import MainMenu
+from profiler import Profiler, DEFAULT_TARGETS, PROFILE_ENV, percentile, phase_name
+
+
+class TestProfiler(unittest.TestCase):
+    """Unittesting Profiler class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        pygame.init()
+        Profiler.reset_instance()
+        self._profiler: Profiler = Profiler.get_instance()
+
+    def tearDown(self) -> None:
+        """Tear down method
+        """
+        Profiler.reset_instance()
+
+    def test_disabled_leaves_methods_alone(self) -> None:
+        """Tests nothing is wrapped until the profiler is enabled
+        """
+        originals = [cls.__dict__[name] for cls, name in DEFAULT_TARGETS]
+        self.assertFalse(self._profiler.enabled)
+        Game(headless=True).run_steps(50)
+        self.assertEqual(self._profiler.stats(), {})
+        self._profiler.enable()
+        self._profiler.disable()
+        self.assertEqual([cls.__dict__[name] for cls, name in DEFAULT_TARGETS], originals)
+
+    def test_phases_are_timed(self) -> None:
+        """Tests every update of a running game is recorded under its phase
+        """
+        self._profiler.enable()
+        self.assertTrue(self._profiler.enabled)
+        game: Game = Game(headless=True)
+        game.run_steps(40)
+        stats = self._profiler.stats()
+        self.assertEqual(stats["Player.update"]["calls"], 40)
+        self.assertEqual(stats["Game.update"]["calls"], 40)
+        self.assertEqual(stats["Enemy.update"]["calls"], 40 * len(game.enemies))
+        for rank in ("p50", "p95", "p99"):
+            self.assertLessEqual(stats["Player.update"][rank], stats["Player.update"]["max"])
+
+    def test_inherited_method_restored(self) -> None:
+        """Tests timing a method a class inherits leaves the class as it was
+        """
+        self._profiler.enable([(Enemy, "draw")])
+        self.assertIn("draw", Enemy.__dict__)
+        self._profiler.disable()
+        self.assertNotIn("draw", Enemy.__dict__)
+        self.assertIs(Enemy.draw, GameObject.draw)
+
+    def test_rolling_window(self) -> None:
+        """Tests only the latest calls count towards the percentiles
+        """
+        profiler: Profiler = Profiler(window=100)
+        for elapsed in range(1, 201):
+            profiler.record("phase", float(elapsed))
+        stats = profiler.stats()["phase"]
+        self.assertEqual(stats["calls"], 100)
+        self.assertEqual((stats["p50"], stats["p95"], stats["p99"]), (150.0, 195.0, 199.0))
+        profiler.reset()
+        self.assertEqual(profiler.stats(), {})
+
+    def test_percentile(self) -> None:
+        """Tests the nearest rank percentile
+        """
+        self.assertEqual(percentile([], 50), 0.0)
+        self.assertEqual(percentile([3.0], 99), 3.0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0], 50), 2.0)
+        self.assertEqual(phase_name((MainMenu, "draw_screen")), "MainMenu.draw_screen")
+
+    def test_dump(self) -> None:
+        """Tests the stats are written to a JSON file
+        """
+        self._profiler.record("Game.draw", 2.5)
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "frames.json")
+            self._profiler.dump(path)
+            with open(path, encoding="utf-8") as dump_file:
+                data = json.load(dump_file)
+        self.assertEqual(data["phases"]["Game.draw"]["p99"], 2.5)
+
+    def test_overlay(self) -> None:
+        """Tests the overlay draws a line per phase in the corner
+        """
+        surface: pygame.Surface = pygame.Surface((400, 200))
+        surface.fill((0, 0, 255))
+        self.assertIsNone(self._profiler.draw_overlay(surface))
+        self.assertEqual(surface.get_at((2, 2)), pygame.Color(0, 0, 255))
+        self._profiler.record("Game.draw", 1.0)
+        self._profiler.record("Player.update", 0.1)
+        self.assertEqual(len(self._profiler.overlay_lines()), 2)
+        box: pygame.Rect | None = self._profiler.draw_overlay(surface)
+        assert box is not None
+        self.assertEqual(box.topleft, (0, 0))
+        self.assertEqual(surface.get_at((2, 2)), pygame.Color(0, 0, 0))
+        self.assertEqual(surface.get_at((399, 199)), pygame.Color(0, 0, 255))
+
+    def test_from_environment(self) -> None:
+        """Tests the environment variable turns the profiler and overlay on
+        """
+        with patch.dict(os.environ, {PROFILE_ENV: ""}):
+            self.assertFalse(Profiler.from_environment().enabled)
+        with patch.dict(os.environ, {PROFILE_ENV: "1"}):
+            profiler: Profiler = Profiler.from_environment()
+        self.assertTrue(profiler.enabled)
+        self.assertTrue(profiler.overlay)
@@ -0,0 +1,204 @@
+"""Testing with unittest for replay module
+"""
+
+from typing import List
+from io import StringIO
+import os
+import random
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import pygame
+from game import Game, STEP_MS
+from game_input import PressedKeys, ScriptedInput
+from level_format import LevelData, EnemySpawn, write_level_pack
+from replay import (InputLog, RecordingInput, ReplayInput, SessionRecorder, direction_code,
+                    record, replay, state_digest, main, NO_MOVE, UP, DOWN, LEFT, RECORD_ENV)
+
+DIRECTIONS: List[int] = [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+
+
+def play_randomly(game: Game, keys: ScriptedInput, steps: int, seed: int) -> None:
+    """Holds random directions for a few steps at a time"""
+    rng: random.Random = random.Random(seed)
+    for step in range(steps):
+        if step % 7 == 0:
+            if rng.random() < 0.8:
+                keys.press(rng.choice(DIRECTIONS))
+            else:
+                keys.release()
+        game.step()
+        if game.game_over:
+            return
+
+
+class TestInputLog(unittest.TestCase):
+    """Unittesting InputLog class
+    """
+
+    def test_run_length_encoding(self) -> None:
+        """Tests repeated directions are stored as one run
+        """
+        log: InputLog = InputLog("pack.jsonl")
+        for code in [UP, UP, UP, NO_MOVE, LEFT, LEFT]:
+            log.append(code)
+        self.assertEqual(log.runs, [[UP, 3], [NO_MOVE, 1], [LEFT, 2]])
+        self.assertEqual(len(log), 6)
+        self.assertEqual(list(log), [UP, UP, UP, NO_MOVE, LEFT, LEFT])
+
+    def test_save_and_load(self) -> None:
+        """Tests a log reads back the same from a file
+        """
+        log: InputLog = InputLog("pack.jsonl", level_index=2, start_time=400)
+        for code in [DOWN, DOWN, NO_MOVE]:
+            log.append(code)
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "session.json")
+            log.save(path)
+            self.assertEqual(InputLog.load(path), log)
+
+    def test_invalid_logs(self) -> None:
+        """Tests logs from another version or step size are rejected
+        """
+        data = InputLog("pack.jsonl").to_dict()
+        for key, value in (("version", 99), ("step_ms", STEP_MS + 1), ("steps", 5)):
+            with self.subTest(key=key):
+                with self.assertRaises(ValueError):
+                    InputLog.from_dict({**data, key: value})
+
+
+class TestInputSources(unittest.TestCase):
+    """Unittesting RecordingInput and ReplayInput classes
+    """
+
+    def test_direction_priority(self) -> None:
+        """Tests the direction matches the order Player.update checks keys
+        """
+        self.assertEqual(direction_code(PressedKeys([pygame.K_LEFT, pygame.K_DOWN])), DOWN)
+        self.assertEqual(direction_code(PressedKeys([pygame.K_SPACE])), NO_MOVE)
+
+    def test_record_then_replay(self) -> None:
+        """Tests recorded directions are played back in order, then nothing
+        """
+        log: InputLog = InputLog("pack.jsonl")
+        keys: ScriptedInput = ScriptedInput([pygame.K_UP])
+        recorder: RecordingInput = RecordingInput(keys, log)
+        self.assertEqual(recorder.get_pressed(), PressedKeys([pygame.K_UP]))
+        keys.press(pygame.K_LEFT, pygame.K_RIGHT)
+        recorder.get_pressed()
+        self.assertEqual(list(log), [UP, LEFT])
+        player: ReplayInput = ReplayInput(log)
+        self.assertTrue(player.get_pressed()[pygame.K_UP])
+        self.assertTrue(player.get_pressed()[pygame.K_LEFT])
+        self.assertEqual(player.get_pressed(), PressedKeys())
+
+
+class TestReplay(unittest.TestCase):
+    """Unittesting record, replay and state_digest functions
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        pygame.init()
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        """Tear down method
+        """
+        self._directory.cleanup()
+
+    def test_replay_ends_in_same_state(self) -> None:
+        """Tests a replayed session on the default levels ends the same way
+        """
+        for seed in range(5):
+            keys: ScriptedInput = ScriptedInput()
+            game: Game = Game(headless=True, input_source=keys)
+            log: InputLog = record(game)
+            play_randomly(game, keys, 3000, seed)
+            self.assertEqual(state_digest(replay(log)), state_digest(game))
+
+    def test_replay_from_later_level(self) -> None:
+        """Tests a recording started on another level and time
+        """
+        keys: ScriptedInput = ScriptedInput()
+        game: Game = Game(headless=True, input_source=keys)
+        game.run_steps(37)
+        game.level_index = 1
+        game.load_level(1)
+        log: InputLog = record(game)
+        play_randomly(game, keys, 500, 3)
+        replayed: Game = replay(log)
+        self.assertEqual(replayed.level_index, game.level_index)
+        self.assertEqual(state_digest(replayed), state_digest(game))
+
+    def test_long_session_replays_quickly(self) -> None:
+        """Tests 30 minutes of play replay in seconds to the same state
+        """
+        # two rooms, the enemies patrol the one the player is not in
+        tiles: List[List[int]] = [[1] * 8] + [[1, 0, 0, 0, 1, 0, 0, 1] for _ in range(6)] \
+            + [[1] * 8]
+        tiles[6][6] = 2
+        path: str = os.path.join(self._directory.name, "rooms.jsonl")
+        write_level_pack(path, [LevelData(tiles, (1, 1), [EnemySpawn(3, 5, 1)])])
+        keys: ScriptedInput = ScriptedInput()
+        game: Game = Game(headless=True, input_source=keys, level_pack=path)
+        log: InputLog = record(game)
+        play_randomly(game, keys, 30 * 60 * 1000 // STEP_MS, 1)
+        self.assertFalse(game.game_over)
+        log_path: str = os.path.join(self._directory.name, "session.json")
+        log.save(log_path)
+        self.assertLess(os.path.getsize(log_path), 100_000)
+        started: float = time.perf_counter()
+        replayed: Game = replay(InputLog.load(log_path))
+        self.assertLess(time.perf_counter() - started, 10)
+        self.assertEqual(replayed.sim_time, 30 * 60 * 1000)
+        self.assertEqual(state_digest(replayed), state_digest(game))
+
+    @patch('atexit.register')
+    def test_session_recorder(self, mock_register: unittest.mock.MagicMock) -> None:
+        """Tests the recorder saves a game when the next one starts and at
+        exit, and is only made when the environment variable is set
+
+        Args:
+            mock_register (unittest.mock.MagicMock): mocks registering the
+            save at exit
+        """
+        path: str = os.path.join(self._directory.name, "session.json")
+        with patch.dict(os.environ, {RECORD_ENV: ""}):
+            self.assertIsNone(SessionRecorder.from_environment())
+        with patch.dict(os.environ, {RECORD_ENV: path}):
+            recorder: SessionRecorder | None = SessionRecorder.from_environment()
+        assert recorder is not None
+        mock_register.assert_called_once_with(recorder.save)
+        first: Game = Game(headless=True, input_source=ScriptedInput([pygame.K_DOWN]))
+        recorder.start(first)
+        self.assertFalse(os.path.exists(path))
+        first.run_steps(20)
+        recorder.start(Game(headless=True))
+        self.assertEqual(state_digest(replay(InputLog.load(path))), state_digest(first))
+        recorder.save()
+        self.assertEqual(len(InputLog.load(path)), 20)
+
+    def test_digest_changes_with_state(self) -> None:
+        """Tests the digest tells different states apart
+        """
+        game: Game = Game(headless=True)
+        before: str = state_digest(game)
+        game.player.key_count += 1
+        self.assertNotEqual(state_digest(game), before)
+
+    def test_main_prints_result(self) -> None:
+        """Tests the command line replays a log file
+        """
+        keys: ScriptedInput = ScriptedInput([pygame.K_DOWN])
+        game: Game = Game(headless=True, input_source=keys)
+        log: InputLog = record(game)
+        game.run_steps(100)
+        path: str = os.path.join(self._directory.name, "session.json")
+        log.save(path)
+        with patch('sys.stdout', new_callable=StringIO) as output:
+            main([path])
+        self.assertIn("Replayed 100 steps", output.getvalue())
+        self.assertIn(state_digest(game), output.getvalue())
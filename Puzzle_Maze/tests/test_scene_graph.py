@@ -0,0 +1,102 @@
+"""Testing with unittest for scene_graph module
+"""
+
+import unittest
+from unittest.mock import MagicMock
+import pygame
+from game_screens import MainMenu, InfoScreen
+from screen import Screen
+from scene_graph import SceneGraph
+
+SIZE = (1024, 768)
+
+
+def hover(screen: Screen, position: tuple[int, int]) -> None:
+    """moves the mouse of screen to position"""
+    screen.handle_mouse_motion(pygame.event.Event(pygame.MOUSEMOTION, pos=position))
+
+
+def fresh_frame(screen: Screen) -> bytes:
+    """returns the pixels of screen composited from scratch"""
+    screen.scene.invalidate()
+    screen.draw_screen()
+    return pygame.image.tobytes(screen.screen, "RGB")
+
+
+class TestSceneGraph(unittest.TestCase):
+    """Unittesting SceneGraph class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        pygame.init()
+        self._surface: pygame.Surface = pygame.Surface(SIZE)
+
+    def test_static_frames_composite_once(self) -> None:
+        """Tests steady frames blit the layer without drawing widgets
+        """
+        menu: MainMenu = MainMenu(self._surface)
+        menu.draw_screen()
+        menu.play_button.draw = MagicMock()
+        for _ in range(10):
+            menu.draw_screen()
+        menu.play_button.draw.assert_not_called()
+        self.assertEqual((menu.scene.full_composites, menu.scene.region_composites), (1, 0))
+
+    def test_hover_composites_region(self) -> None:
+        """Tests hovering a button composites only its region, with the
+        same pixels as drawing the whole menu
+        """
+        menu: MainMenu = MainMenu(self._surface)
+        menu.draw_screen()
+        idle: bytes = pygame.image.tobytes(self._surface, "RGB")
+        assert menu.play_button.button.rect is not None
+        hover(menu, menu.play_button.button.rect.center)
+        menu.quit_button.draw = MagicMock()
+        menu.draw_screen()
+        menu.quit_button.draw.assert_not_called()
+        self.assertEqual(menu.scene.region_composites, 1)
+        hovered: bytes = pygame.image.tobytes(self._surface, "RGB")
+        self.assertNotEqual(hovered, idle)
+        del menu.quit_button.draw
+        self.assertEqual(fresh_frame(menu), hovered)
+        hover(menu, (0, 0))
+        menu.draw_screen()
+        self.assertEqual(pygame.image.tobytes(self._surface, "RGB"), idle)
+
+    def test_layer_restores_screen(self) -> None:
+        """Tests a frame drawn over the menu, like the game, is covered by
+        the next menu frame
+        """
+        info: InfoScreen = InfoScreen(self._surface)
+        info.draw_screen()
+        expected: bytes = pygame.image.tobytes(self._surface, "RGB")
+        self._surface.fill("Red")
+        info.draw_screen()
+        self.assertEqual(pygame.image.tobytes(self._surface, "RGB"), expected)
+        self.assertEqual(info.scene.full_composites, 1)
+
+    def test_mark_dirty(self) -> None:
+        """Tests a widget marked dirty is composited again, and a resized
+        screen composites everything
+        """
+        info: InfoScreen = InfoScreen(self._surface)
+        info.draw_screen()
+        info.scene.mark_dirty(info.back_button)
+        info.scene.mark_dirty(MagicMock())
+        info.draw_screen()
+        self.assertEqual(info.scene.region_composites, 1)
+        info.invalidate_layout()
+        info.draw_screen()
+        self.assertEqual(info.scene.full_composites, 2)
+
+    def test_empty_scene(self) -> None:
+        """Tests a scene without widgets draws its background once
+        """
+        background: MagicMock = MagicMock()
+        scene: SceneGraph = SceneGraph(self._surface, background)
+        scene.draw()
+        scene.draw()
+        background.assert_called_once()
+        self.assertEqual(scene.nodes, [])
@@ -0,0 +1,309 @@
+"""Testing with unittest for solver module
+"""
+
+from typing import Dict, List, Tuple
+import os
+import random
+import tempfile
+import time
+import unittest
+import pygame
+from GameObjects import TILE_WALL, TILE_EMPTY, TILE_GOAL, TILE_DOOR, TILE_KEY
+from level_format import LevelData, LevelPack, EnemySpawn, DOOR_UNLOCKED, write_level_pack
+from maze_grid import MazeGrid
+from solver import (MazeSolver, Solution, TimedSolution, EnemySchedule, UNREACHABLE,
+                    TICK_MS, ENEMY_TICKS, solve_level, solve_levels)
+from game import Game, DEFAULT_LEVEL_PACK, STEP_MS
+from game_input import ScriptedInput
+
+W, E, G, D, K = TILE_WALL, TILE_EMPTY, TILE_GOAL, TILE_DOOR, TILE_KEY
+# an enemy patrols column 3 across the corridor the player has to take
+CROSSING: List[List[int]] = [[W, W, W, W, W, W, W],
+                             [W, E, E, E, E, G, W],
+                             [W, W, W, E, W, W, W],
+                             [W, W, W, E, W, W, W],
+                             [W, W, W, W, W, W, W]]
+CROSSING_ENEMY: EnemySpawn = EnemySpawn(2, 3, -1)
+
+
+class TestMazeSolver(unittest.TestCase):
+    """Unittesting MazeSolver class
+    """
+
+    def test_open_corridor(self) -> None:
+        """Tests the shortest path in a maze without doors
+        """
+        maze: List[List[int]] = [[W, W, W, W, W],
+                                 [W, E, E, G, W],
+                                 [W, W, W, W, W]]
+        solution: Solution | None = MazeSolver(maze).solve((1, 1))
+        assert solution is not None
+        self.assertEqual(solution.path, [(1, 1), (1, 2), (1, 3)])
+        self.assertEqual(solution.length, 2)
+        self.assertEqual(solution.moves(), [(0, 1), (0, 1)])
+
+    def test_walled_off_goal(self) -> None:
+        """Tests None is returned when no goal can be reached
+        """
+        maze: List[List[int]] = [[W, W, W, W, W],
+                                 [W, E, W, G, W],
+                                 [W, W, W, W, W]]
+        self.assertIsNone(MazeSolver(maze).solve((1, 1)))
+        self.assertEqual(MazeSolver(maze).goal_distance((1, 1)), UNREACHABLE)
+
+    def test_door_needs_key(self) -> None:
+        """Tests a locked door without a key blocks the way
+        """
+        maze: List[List[int]] = [[W, W, W, W, W],
+                                 [W, E, D, G, W],
+                                 [W, W, W, W, W]]
+        solver: MazeSolver = MazeSolver(maze)
+        self.assertIsNone(solver.solve((1, 1)))
+        solution: Solution | None = solver.solve((1, 1), keys=1)
+        assert solution is not None
+        self.assertEqual(solution.doors_opened, 1)
+        self.assertEqual(solution.path, [(1, 1), (1, 2), (1, 3)])
+
+    def test_detour_for_key(self) -> None:
+        """Tests the solver fetches a key before going through the door
+        """
+        maze: List[List[int]] = [[W, W, W, W, W, W],
+                                 [W, K, E, E, W, W],
+                                 [W, W, W, D, W, W],
+                                 [W, W, W, G, W, W],
+                                 [W, W, W, W, W, W]]
+        solution: Solution | None = MazeSolver(maze).solve((1, 3))
+        assert solution is not None
+        self.assertEqual(solution.path,
+                         [(1, 3), (1, 2), (1, 1), (1, 2), (1, 3), (2, 3), (3, 3)])
+        self.assertEqual(solution.keys_collected, 1)
+        self.assertEqual(solution.doors_opened, 1)
+
+    def test_key_used_once(self) -> None:
+        """Tests one key does not open two doors
+        """
+        maze: List[List[int]] = [[W, W, W, W, W, W, W],
+                                 [W, K, E, D, D, G, W],
+                                 [W, W, W, W, W, W, W]]
+        self.assertIsNone(MazeSolver(maze).solve((1, 2)))
+        maze[1][2] = K
+        solution: Solution | None = MazeSolver(maze).solve((1, 1))
+        assert solution is not None
+        self.assertEqual(solution.doors_opened, 2)
+
+    def test_shorter_path_without_door(self) -> None:
+        """Tests the door is skipped when walking around is shorter
+        """
+        maze: List[List[int]] = [[W, W, W, W, W],
+                                 [W, E, D, E, W],
+                                 [W, E, E, G, W],
+                                 [W, W, W, W, W]]
+        solution: Solution | None = MazeSolver(maze).solve((1, 1), keys=1)
+        assert solution is not None
+        self.assertEqual(solution.length, 3)
+
+    def test_start_outside_maze(self) -> None:
+        """Tests a start cell outside the maze is rejected
+        """
+        with self.assertRaises(ValueError):
+            MazeSolver([[G]]).solve((3, 3))
+
+    def test_large_grid(self) -> None:
+        """Tests a 256x256 maze with keys and doors is solved quickly
+        """
+        grid: MazeGrid = _carve_maze(256, random.Random(7))
+        grid[253, 253] = TILE_GOAL
+        route: Solution | None = MazeSolver(grid).solve((1, 1))
+        assert route is not None
+        # lock ten doors along the only route, each with its key before it
+        cells: List[Tuple[int, int]] = route.path[1:-1]
+        for index in range(10):
+            grid[cells[len(cells) * (2 * index + 1) // 21]] = TILE_KEY
+            grid[cells[len(cells) * (2 * index + 2) // 21]] = TILE_DOOR
+        started: float = time.perf_counter()
+        solution: Solution | None = MazeSolver(grid).solve((1, 1))
+        elapsed: float = time.perf_counter() - started
+        assert solution is not None
+        self.assertEqual(solution.path, route.path)
+        self.assertEqual(solution.doors_opened, 10)
+        self.assertLess(elapsed, 1.0)
+
+
+def _carve_maze(size: int, rng: random.Random) -> MazeGrid:
+    """Carves a perfect maze with a depth first search, corridors on odd
+    cells"""
+    grid: MazeGrid = MazeGrid.filled(size, size, TILE_WALL)
+    grid[1, 1] = TILE_EMPTY
+    stack: List[Tuple[int, int]] = [(1, 1)]
+    while stack:
+        row, col = stack[-1]
+        options: List[Tuple[int, int]] = [
+            (row + dy, col + dx) for dy, dx in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < row + dy < size - 1 and 0 < col + dx < size - 1
+            and grid[row + dy, col + dx] == TILE_WALL]
+        if not options:
+            stack.pop()
+            continue
+        next_row, next_col = rng.choice(options)
+        grid[(row + next_row) // 2, (col + next_col) // 2] = TILE_EMPTY
+        grid[next_row, next_col] = TILE_EMPTY
+        stack.append((next_row, next_col))
+    return grid
+
+
+class TestSolveLevel(unittest.TestCase):
+    """Unittesting solve_level and solve_levels functions
+    """
+
+    def test_default_levels_solvable(self) -> None:
+        """Tests every level shipped with the game can be finished
+        """
+        solutions: List[Solution | None] = solve_levels(list(LevelPack(DEFAULT_LEVEL_PACK)))
+        self.assertTrue(solutions)
+        for solution in solutions:
+            self.assertIsNotNone(solution)
+
+    def test_unlocked_door(self) -> None:
+        """Tests doors that start unlocked do not need a key
+        """
+        tiles: List[List[int]] = [[W, W, W, W, W],
+                                  [W, E, D, G, W],
+                                  [W, W, W, W, W]]
+        self.assertIsNone(solve_level(LevelData(tiles)))
+        solution: Solution | None = solve_level(LevelData(tiles, doors={(1, 2): DOOR_UNLOCKED}))
+        assert solution is not None
+        self.assertEqual(solution.doors_opened, 0)
+
+
+class TestEnemySchedule(unittest.TestCase):
+    """Unittesting EnemySchedule class
+    """
+
+    def test_patrol_bounces(self) -> None:
+        """Tests the table follows Enemy.update, staying put on a bounce
+        """
+        schedule: EnemySchedule = EnemySchedule(CROSSING, [CROSSING_ENEMY])
+        rows: List[int] = [schedule.cells_at(move * ENEMY_TICKS * TICK_MS)[0][0]
+                           for move in range(1, 8)]
+        self.assertEqual(rows, [1, 1, 2, 3, 3, 2, 1])
+        self.assertEqual(schedule.period, 6 * ENEMY_TICKS)
+
+    def test_quiet_ticks(self) -> None:
+        """Tests enemies only occupy cells on the ticks they move
+        """
+        schedule: EnemySchedule = EnemySchedule(CROSSING, [CROSSING_ENEMY])
+        self.assertEqual(schedule.cells_at(0), [])
+        self.assertEqual(schedule.cells_at(TICK_MS), [])
+        self.assertEqual(schedule.occupied(ENEMY_TICKS), frozenset({1 * 7 + 3}))
+
+    def test_combined_period(self) -> None:
+        """Tests patrols of different lengths share one table
+        """
+        maze: List[List[int]] = [[W, W, W, W],
+                                 [W, E, E, W],
+                                 [W, E, E, W],
+                                 [W, W, E, W],
+                                 [W, W, W, W]]
+        schedule: EnemySchedule = EnemySchedule(
+            maze, [EnemySpawn(1, 1, 1), EnemySpawn(1, 2, 1)])
+        self.assertEqual(schedule.period, 12 * ENEMY_TICKS)
+
+    def test_bad_spawn_rejected(self) -> None:
+        """Tests enemies on a wall, outside the maze or without a velocity
+        are rejected instead of patrolling forever
+        """
+        maze: List[List[int]] = [[W, W, W], [W, E, W], [W, E, W], [W, W, W]]
+        for spawn in (EnemySpawn(0, 1, 1), EnemySpawn(9, 1, 1), EnemySpawn(1, 1, 0)):
+            with self.assertRaises(ValueError):
+                EnemySchedule(maze, [spawn])
+        schedule: EnemySchedule = EnemySchedule(maze, [EnemySpawn(2, 1, -1)])
+        self.assertEqual(schedule.period, 4 * ENEMY_TICKS)
+
+    def test_no_enemies(self) -> None:
+        """Tests an empty schedule never blocks
+        """
+        schedule: EnemySchedule = EnemySchedule(CROSSING, [])
+        self.assertEqual(schedule.occupied(ENEMY_TICKS), frozenset())
+
+
+class TestTimedSolve(unittest.TestCase):
+    """Unittesting MazeSolver.solve with an enemy schedule
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        pygame.init()
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        """Tear down method
+        """
+        self._directory.cleanup()
+
+    def _play(self, level: LevelData, solution: Solution) -> Game:
+        """Plays a solution in a headless game one logic step at a time,
+        moving as soon as the player can unless the solution has move times"""
+        path: str = os.path.join(self._directory.name, "level.jsonl")
+        write_level_pack(path, [level])
+        keys: ScriptedInput = ScriptedInput()
+        game: Game = Game(headless=True, input_source=keys, level_pack=path)
+        directions: Dict[Tuple[int, int], int] = {
+            (-1, 0): pygame.K_UP, (1, 0): pygame.K_DOWN,
+            (0, -1): pygame.K_LEFT, (0, 1): pygame.K_RIGHT}
+        moves: List[Tuple[int, int]] = solution.moves()
+        times: List[int] = solution.times[1:] if isinstance(solution, TimedSolution) \
+            else [200 * (index + 1) for index in range(len(moves))]
+        schedule: Dict[int, int] = {
+            time: directions[move] for time, move in zip(times, moves)}
+        while not game.game_over and game.sim_time < times[-1]:
+            upcoming: int = game.sim_time + STEP_MS
+            if upcoming in schedule:
+                keys.press(schedule[upcoming])
+            else:
+                keys.release()
+            game.step()
+        return game
+
+    def test_naive_path_is_caught(self) -> None:
+        """Tests the shortest path runs into the enemy
+        """
+        level: LevelData = LevelData(CROSSING, (1, 1), [CROSSING_ENEMY])
+        solution: Solution | None = solve_level(level)
+        assert solution is not None
+        game: Game = self._play(level, solution)
+        self.assertTrue(game.game_over)
+        self.assertFalse(game.won)
+
+    def test_timed_path_dodges_enemy(self) -> None:
+        """Tests the timed path waits for the enemy and wins in the game
+        """
+        level: LevelData = LevelData(CROSSING, (1, 1), [CROSSING_ENEMY])
+        solution: Solution | None = solve_level(level, avoid_enemies=True)
+        assert isinstance(solution, TimedSolution)
+        self.assertEqual(solution.path, [(1, 1), (1, 2), (1, 3), (1, 4), (1, 5)])
+        self.assertGreater(solution.arrival, 200 * solution.length)
+        game: Game = self._play(level, solution)
+        self.assertTrue(game.won)
+
+    def test_slips_past_between_moves(self) -> None:
+        """Tests the player may share a cell with an enemy between its moves,
+        as Enemy.update only checks for the player when it moves
+        """
+        maze: List[List[int]] = [[W, W, W, W, W],
+                                 [W, E, E, G, W],
+                                 [W, W, W, W, W]]
+        # boxed in, the enemy bounces on the middle cell every move
+        level: LevelData = LevelData(maze, (1, 1), [EnemySpawn(1, 2, 1)])
+        solution: Solution | None = solve_level(level, avoid_enemies=True)
+        assert isinstance(solution, TimedSolution)
+        self.assertEqual(solution.times, [0, 200, 400])
+        self.assertTrue(self._play(level, solution).won)
+
+    def test_default_levels_solvable(self) -> None:
+        """Tests every shipped level can be finished without being caught
+        """
+        for level in LevelPack(DEFAULT_LEVEL_PACK):
+            solution: Solution | None = solve_level(level, avoid_enemies=True)
+            assert isinstance(solution, TimedSolution)
+            self.assertTrue(self._play(level, solution).won)
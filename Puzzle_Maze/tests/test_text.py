@@ -11,6 +11,8 @@ from unittest.mock import patch, MagicMock
 from typing import Dict, Any
 import pygame
 from text import Text
+from font_pool import FontPool
+from text_cache import TextCache
 from hypothesis import given
 from hypothesis.strategies import integers, floats
 
@@ -21,6 +23,8 @@ class TestText(unittest.TestCase):
         """
         pygame.init()
         pygame.font.init()
+        FontPool.reset_instance()
+        TextCache.reset_instance()
         self._mock_screen = MagicMock()
         self._mock_screen.get_size.return_value = (1024, 768)
         self._text_parameters: Dict[str, Any] = {
@@ -291,6 +295,8 @@ class TestText(unittest.TestCase):
             to avoid issues
             new_size (int): generated by hypothesis, new font size
         """
+        # setUp runs once for all the examples, the pool would keep their fonts
+        FontPool.reset_instance()
         mock_font = MagicMock()
         mock_font_obj.return_value = mock_font
 
@@ -310,6 +316,8 @@ class TestText(unittest.TestCase):
             to avoid issues
             new_size (int): generated by hypothesis, new font size
         """
+        # setUp runs once for all the examples, the pool would keep their fonts
+        FontPool.reset_instance()
         mock_font = MagicMock()
         mock_font_obj.return_value = mock_font
 
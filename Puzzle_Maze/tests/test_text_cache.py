@@ -0,0 +1,70 @@
+"""Testing with unittest for text_cache module
+"""
+
+import unittest
+import pygame
+from text import Text
+from font_pool import FontPool
+from text_cache import TextCache
+
+FONT: str = "assets/Cyberpunks.ttf"
+
+
+class TestTextCache(unittest.TestCase):
+    """Unittesting TextCache class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        pygame.init()
+        FontPool.reset_instance()
+        TextCache.reset_instance()
+        self._cache: TextCache = TextCache.get_instance()
+        self._screen: pygame.Surface = pygame.Surface((800, 600))
+
+    def tearDown(self) -> None:
+        """Tear down method
+        """
+        TextCache.reset_instance()
+
+    def test_render_once(self) -> None:
+        """Tests the same text is rendered once and then served from the cache
+        """
+        first: pygame.Surface = self._cache.render(FONT, 30, "Play", "White")
+        self.assertIs(self._cache.render(FONT, 30.7, "Play", "White"), first)
+        self.assertIsNot(self._cache.render(FONT, 30, "Play", "Light Green"), first)
+        self.assertEqual((self._cache.hits, self._cache.misses), (1, 2))
+        self.assertIn((FONT, 30, "Play", "White", True), self._cache)
+        self._cache.clear()
+        self.assertEqual((len(self._cache), self._cache.hits), (0, 0))
+
+    def test_least_recently_used_dropped(self) -> None:
+        """Tests the cache keeps the most recently used surfaces
+        """
+        cache: TextCache = TextCache(capacity=2)
+        cache.render(FONT, 20, "a", "White")
+        cache.render(FONT, 20, "b", "White")
+        cache.render(FONT, 20, "a", "White")
+        cache.render(FONT, 20, "c", "White")
+        self.assertEqual(len(cache), 2)
+        self.assertIn((FONT, 20, "a", "White", True), cache)
+        self.assertNotIn((FONT, 20, "b", "White", True), cache)
+        with self.assertRaises(ValueError):
+            TextCache(capacity=0)
+
+    def test_text_renders_on_change(self) -> None:
+        """Tests Text only renders again when its text, size or color changes
+        """
+        text: Text = Text(self._screen, 0.5, 0.5, FONT, 30, "Play", "White")
+        surface: pygame.Surface | None = text.surface
+        for _ in range(100):
+            text.dynamically_draw()
+        self.assertIs(text.surface, surface)
+        self.assertEqual((self._cache.hits, self._cache.misses), (0, 1))
+        text.color = "Light Green"
+        text.dynamically_draw()
+        text.color = "White"
+        text.dynamically_draw()
+        self.assertEqual(self._cache.misses, 2)
+        self.assertEqual(self._cache.hits, 1)
@@ -0,0 +1,65 @@
+"""Testing with unittest for tile_layer module
+"""
+
+from unittest.mock import MagicMock, call
+from typing import List
+import unittest
+import pygame
+from tile_layer import TileLayer
+from GameObjects import TILE_SIZE, TILE_EMPTY, TILE_WALL, TILE_KEY, TILE_DOOR
+
+
+class TestTileLayer(unittest.TestCase):
+    """Unittesting TileLayer class
+    """
+
+    def setUp(self) -> None:
+        """Setup method
+        """
+        self._tileset = MagicMock()
+        self._tileset.get_image.return_value = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        self._maze: List[List[int]] = [
+            [TILE_WALL, TILE_WALL, TILE_WALL],
+            [TILE_WALL, TILE_KEY, TILE_DOOR],
+        ]
+
+    def test_rebuild_size(self) -> None:
+        """Tests that the layer covers the whole maze
+        """
+        layer: TileLayer = TileLayer(self._tileset, self._maze)
+        self.assertEqual(layer.surface.get_size(), (3 * TILE_SIZE, 2 * TILE_SIZE))
+        self.assertEqual(self._tileset.get_image.call_count, 6)
+
+    def test_doors_drawn_as_empty(self) -> None:
+        """Tests that doors leave an empty tile in the layer
+        """
+        TileLayer(self._tileset, self._maze)
+        self._tileset.get_image.assert_any_call(TILE_EMPTY)
+        self.assertNotIn(call(TILE_DOOR), self._tileset.get_image.call_args_list)
+
+    def test_sync_unchanged(self) -> None:
+        """Tests that syncing an unchanged maze draws nothing
+        """
+        layer: TileLayer = TileLayer(self._tileset, self._maze)
+        self._tileset.get_image.reset_mock()
+        self.assertEqual(layer.sync(self._maze), [])
+        self._tileset.get_image.assert_not_called()
+
+    def test_sync_patches_changed_cell(self) -> None:
+        """Tests that only the changed cell is redrawn
+        """
+        layer: TileLayer = TileLayer(self._tileset, self._maze)
+        surface: pygame.Surface = layer.surface
+        self._maze[1][1] = TILE_EMPTY
+        changed: List[pygame.Rect] = layer.sync(self._maze)
+        self.assertEqual(changed, [pygame.Rect(TILE_SIZE, TILE_SIZE, TILE_SIZE, TILE_SIZE)])
+        self.assertIs(surface, layer.surface)
+
+    def test_sync_new_shape(self) -> None:
+        """Tests that a maze of another size rebuilds the layer
+        """
+        layer: TileLayer = TileLayer(self._tileset, self._maze)
+        surface: pygame.Surface = layer.surface
+        layer.sync([[TILE_EMPTY]])
+        self.assertIsNot(surface, layer.surface)
+        self.assertEqual(layer.surface.get_size(), (TILE_SIZE, TILE_SIZE))
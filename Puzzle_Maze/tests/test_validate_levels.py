@@ -0,0 +1,188 @@
+"""Testing with unittest for validate_levels module
+"""
+
+from multiprocessing.pool import AsyncResult, ThreadPool
+from threading import Event
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+from io import StringIO
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from GameObjects import TILE_WALL, TILE_EMPTY, TILE_GOAL
+from level_format import LevelData, LevelPack, EnemySpawn, write_level_pack
+from game import DEFAULT_LEVEL_PACK
+from maze_generator import LevelGenerator
+from solver import Solution, solve_level
+from validate_levels import (LevelReport, ValidationSummary, validate_level, validate_levels,
+                             play_solution, _bounded_map, main, WON, CAUGHT, TIMEOUT)
+
+W, E, G = TILE_WALL, TILE_EMPTY, TILE_GOAL
+CROSSING: List[List[int]] = [[W, W, W, W, W, W, W],
+                             [W, E, E, E, E, G, W],
+                             [W, W, W, E, W, W, W],
+                             [W, W, W, E, W, W, W],
+                             [W, W, W, W, W, W, W]]
+WALLED_OFF: List[List[int]] = [[W, W, W, W, W],
+                               [W, E, W, G, W],
+                               [W, W, W, W, W]]
+
+
+class TestValidateLevel(unittest.TestCase):
+    """Unittesting validate_level and play_solution functions
+    """
+
+    def test_default_levels_pass(self) -> None:
+        """Tests every level shipped with the game is beaten
+        """
+        for index, level in enumerate(LevelPack(DEFAULT_LEVEL_PACK)):
+            report: LevelReport = validate_level((index, level))
+            self.assertTrue(report.ok, report.to_dict())
+            self.assertIsNone(report.problem)
+            self.assertEqual(report.playthrough, WON)
+
+    def test_enemies_are_dodged(self) -> None:
+        """Tests the path played waits for the enemy, the shortest one is caught
+        """
+        level: LevelData = LevelData(CROSSING, (1, 1), [EnemySpawn(2, 3, -1)])
+        shortest: Solution | None = solve_level(level)
+        assert shortest is not None
+        self.assertEqual(play_solution(level, shortest), CAUGHT)
+        report: LevelReport = validate_level((0, level))
+        self.assertTrue(report.ok)
+        self.assertEqual(report.length, 4)
+        assert report.arrival is not None
+        self.assertGreater(report.arrival, 200 * 4)
+
+    def test_plays_from_any_directory(self) -> None:
+        """Tests a level is played without reading the default pack, which
+        is only found from the game's directory
+        """
+        level: LevelData = LevelData(CROSSING, (1, 1))
+        solution: Solution | None = solve_level(level)
+        assert solution is not None
+        with tempfile.TemporaryDirectory() as directory, \
+                patch('game.open_levels') as mock_open_levels:
+            previous: str = os.getcwd()
+            os.chdir(directory)
+            try:
+                self.assertEqual(play_solution(level, solution), WON)
+            finally:
+                os.chdir(previous)
+        mock_open_levels.assert_not_called()
+
+    def test_unsolvable(self) -> None:
+        """Tests a level without a way to the goal is reported
+        """
+        report: LevelReport = validate_level((3, LevelData(WALLED_OFF, (1, 1), name="shut")))
+        self.assertFalse(report.ok)
+        self.assertFalse(report.solvable)
+        self.assertIsNone(report.length)
+        self.assertEqual(report.to_dict()["name"], "shut")
+        self.assertEqual(report.problem, "the goal cannot be reached")
+
+    def test_errors_are_reported(self) -> None:
+        """Tests a broken level gives a report instead of raising
+        """
+        report: LevelReport = validate_level((0, LevelData(WALLED_OFF, (5, 5))))
+        self.assertFalse(report.ok)
+        assert report.error is not None
+        self.assertIn("ValueError", report.error)
+
+    def test_broken_enemy_reported(self) -> None:
+        """Tests an enemy spawned on a wall is reported instead of hanging
+        the solver
+        """
+        level: LevelData = LevelData(CROSSING, (1, 1), [EnemySpawn(0, 1, 1)], name="walled")
+        for report in validate_levels([level], workers=2, timeout=30):
+            self.assertFalse(report.ok)
+            assert report.error is not None
+            self.assertIn("ValueError", report.error)
+
+
+class NeverDone(ThreadPool):
+    """Pool whose jobs do not finish until released, like a level stuck in
+    a loop"""
+
+    def __init__(self) -> None:
+        super().__init__(1)
+        self.release: Event = Event()
+
+    def apply_async(self, func: Callable[..., Any], args: Iterable[Any] = (),
+                    *rest: Any, **kwargs: Any) -> "AsyncResult[Any]":
+        return super().apply_async(self.release.wait)
+
+
+class TestValidateLevels(unittest.TestCase):
+    """Unittesting validate_levels, ValidationSummary and main
+    """
+
+    def test_pool_matches_serial(self) -> None:
+        """Tests reports from the process pool come back in pack order
+        """
+        levels: List[LevelData] = [LevelGenerator(doors=2).generate(seed) for seed in range(8)]
+        levels.insert(3, LevelData(WALLED_OFF, (1, 1)))
+        serial: List[LevelReport] = list(validate_levels(levels, workers=1))
+        pooled: List[LevelReport] = list(validate_levels(levels, workers=2, max_in_flight=3))
+        self.assertEqual([report.to_dict() for report in pooled],
+                         [report.to_dict() for report in serial])
+        self.assertEqual([report.index for report in serial], list(range(9)))
+
+    def test_levels_read_as_needed(self) -> None:
+        """Tests no more than max_in_flight levels are read ahead
+        """
+        read: List[int] = []
+
+        def jobs() -> Iterator[Tuple[int, LevelData]]:
+            for index in range(20):
+                read.append(index)
+                yield index, LevelData(WALLED_OFF, (1, 1))
+
+        with ThreadPool(2) as pool:
+            for report in _bounded_map(pool, jobs(), 4):
+                self.assertLessEqual(len(read), report.index + 4)
+        self.assertEqual(len(read), 20)
+
+    def test_stuck_level_times_out(self) -> None:
+        """Tests a level that never finishes is reported as timed out
+        """
+        jobs: Iterator[Tuple[int, LevelData]] = iter(
+            [(0, LevelData(WALLED_OFF, (1, 1), name="stuck"))])
+        with NeverDone() as pool:
+            reports: List[LevelReport] = list(_bounded_map(pool, jobs, 4, timeout=0.01))
+            pool.release.set()
+        self.assertEqual([(report.index, report.name, report.error) for report in reports],
+                         [(0, "stuck", TIMEOUT)])
+        self.assertFalse(reports[0].ok)
+
+    def test_summary(self) -> None:
+        """Tests the totals over passing, unsolvable and broken levels
+        """
+        summary: ValidationSummary = ValidationSummary()
+        summary.add(LevelReport(0, "a", True, True, 6, 1200, 1, 1, WON))
+        summary.add(LevelReport(1, "b", True, True, 0, 0, 0, 0, WON))
+        summary.add(LevelReport(2, "c"))
+        summary.add(LevelReport(3, "d", error="ValueError: bad"))
+        totals = summary.to_dict()
+        self.assertEqual((totals["levels"], totals["passed"], totals["failed"]), (4, 2, 2))
+        self.assertEqual((totals["unsolvable"], totals["errors"]), (1, 1))
+        self.assertEqual((totals["shortest"], totals["longest"], totals["mean_length"]),
+                         (0, 6, 3.0))
+        self.assertEqual(totals["keys_collected"], 1)
+
+    def test_main_writes_report(self) -> None:
+        """Tests the command line writes one line per level and fails on a
+        bad level
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            pack: str = os.path.join(directory, "levels.jsonl")
+            report_path: str = os.path.join(directory, "report.jsonl")
+            write_level_pack(pack, [LevelGenerator().generate(1), LevelData(WALLED_OFF, (1, 1))])
+            with patch('sys.stdout', new_callable=StringIO) as output:
+                status: int = main([pack, "--report", report_path, "--workers", "1"])
+            self.assertEqual(status, 1)
+            self.assertIn("level 1 () failed", output.getvalue())
+            with open(report_path, encoding="utf-8") as report_file:
+                lines = [json.loads(line) for line in report_file]
+            self.assertEqual([line["ok"] for line in lines], [True, False])
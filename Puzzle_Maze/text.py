@@ -8,6 +8,8 @@ __license__ = "MIT"
 from typing_extensions import override
 import pygame
 from drawable import Drawable
+from font_pool import FontPool
+from text_cache import TextCache, TextKey
 
 
 class Text(Drawable):
@@ -31,12 +33,14 @@ class Text(Drawable):
         super().__init__(screen, factor_of_x_pos, factor_of_y_pos,
                          image_dir, size, text)
         self._color: str = color
-        self._font: pygame.font.Font = pygame.font.Font(
-            self.image_dir, int(self.size)
-        )
-
-        self.surface = self._font.render(self.data, True, self._color)
-        self.rect = self.surface.get_rect(
+        self._font: pygame.font.Font = FontPool.get_instance().get(self.image_dir, self.size)
+        # font, size, text and color the surface was rendered with
+        self._rendered: TextKey = (self.image_dir, int(self.size), self.data,
+                                   self._color, True)
+        # the surface last rendered, typed unlike the optional base attribute
+        self._text_surface: pygame.Surface = TextCache.get_instance().render(*self._rendered)
+        self.surface = self._text_surface
+        self.rect = self._text_surface.get_rect(
             center=(
                 self.x_pos, self.y_pos
             )
@@ -61,16 +65,30 @@ class Text(Drawable):
         """Implementation of _adjust_to_changes function from base class
         """
         self.resize_screen()
-        self._font = pygame.font.Font(
-            self.image_dir, int(self.size)
-        )
-        self.surface = self._font.render(self.data, True, self._color)
-        self.rect = self.surface.get_rect(
+        surface: pygame.Surface = self._render()
+        self.surface = surface
+        self.rect = surface.get_rect(
             center=(
                 self.x_pos, self.y_pos
             )
         )
 
+    def _render(self) -> pygame.Surface:
+        """Renders the text again, only if the font, size, text or color
+        changed since the last render
+
+        Returns:
+            pygame.Surface: the text as it is now
+        """
+        key: TextKey = (self.image_dir, int(self.size), self.data, self._color, True)
+        if key == self._rendered:
+            return self._text_surface
+        if key[:2] != self._rendered[:2]:
+            self._font = FontPool.get_instance().get(self.image_dir, self.size)
+        self._text_surface = TextCache.get_instance().render(*key)
+        self._rendered = key
+        return self._text_surface
+
     @property
     def color(self) -> str:
         """Getter for the color variable
@@ -0,0 +1,94 @@
+"""Process wide cache of rendered text. Menus draw the same few strings
+every frame, so Text and Outline look their surfaces up here by font, size,
+text, color and antialiasing instead of rendering them again. The least
+recently used surfaces are dropped once the cache is full. Fonts come from
+the FontPool."""
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+import pygame
+from font_pool import FontPool
+
+TextKey = Tuple[str, int, str, str, bool]
+# rendered strings kept, the menus use a few dozen
+DEFAULT_CAPACITY: int = 256
+
+
+class TextCache:
+    """Singleton LRU cache of rendered text surfaces, with hit and miss
+    counters"""
+    _instance: Optional['TextCache'] = None
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Constructor for TextCache
+
+        Args:
+            capacity (int): surfaces kept before the least recently used
+            one is dropped
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity: int = capacity
+        self._surfaces: OrderedDict[TextKey, pygame.Surface] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def render(self, font_path: str, size: float, text: str, color: str,
+               antialias: bool = True) -> pygame.Surface:
+        """Returns text rendered in the font at font_path, rendering it only
+        if it is not cached yet
+
+        Args:
+            font_path (str): path of the font file
+            size (float): font size, truncated like pygame.font.Font does
+            text (str): text to render
+            color (str): color of the text
+            antialias (bool): smooth the edges of the glyphs
+        """
+        key: TextKey = (font_path, int(size), text, color, antialias)
+        surface: pygame.Surface | None = self._surfaces.get(key)
+        if surface is not None:
+            self._hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self._misses += 1
+        font: pygame.font.Font = FontPool.get_instance().get(font_path, size)
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """Drops every cached surface and resets the counters"""
+        self._surfaces.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._surfaces
+
+    @property
+    def hits(self) -> int:
+        """returns how many renders were served from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """returns how many renders had to draw the text"""
+        return self._misses
+
+    @classmethod
+    def get_instance(cls) -> 'TextCache':
+        """Returns the shared cache, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Drops the shared cache, the next get_instance starts empty"""
+        cls._instance = None
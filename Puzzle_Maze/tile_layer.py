@@ -0,0 +1,66 @@
+"""Pre-rendered static tile layer of a level. The tiles are drawn once into a
+surface and only the cells that changed in the maze are re-drawn."""
+
+from typing import List, Protocol
+import numpy as np
+import numpy.typing as npt
+import pygame
+from GameObjects import TILE_SIZE, TILE_EMPTY, TILE_WALL, TILE_GOAL, TILE_KEY
+from maze_grid import MazeGrid, MazeLike
+
+
+class TileImages(Protocol):
+    """What the layer needs from game.TileSet"""
+
+    def get_image(self, tile_index: int) -> pygame.Surface:
+        ...
+
+
+class TileLayer:
+    """Surface holding the walls, goals, keys and floor of one level"""
+
+    def __init__(self, tileset: TileImages, maze: MazeLike) -> None:
+        self._tileset: TileImages = tileset
+        self._tiles: npt.NDArray[np.uint8] = np.zeros((0, 0), dtype=np.uint8)
+        self._surface: pygame.Surface = pygame.Surface((0, 0))
+        self.rebuild(maze)
+
+    @property
+    def surface(self) -> pygame.Surface:
+        """returns the rendered layer"""
+        return self._surface
+
+    def rebuild(self, maze: MazeLike) -> None:
+        """Renders every tile of the maze into a new surface"""
+        self._tiles = MazeGrid.coerce(maze).cells.copy()
+        rows, cols = self._tiles.shape
+        self._surface = pygame.Surface((cols * TILE_SIZE, rows * TILE_SIZE))
+        for (row, col), tile_value in np.ndenumerate(self._tiles):
+            self._draw_tile(row, col, int(tile_value))
+
+    def sync(self, maze: MazeLike) -> List[pygame.Rect]:
+        """Patches the cells that differ from the maze the layer was drawn
+        from, returns the screen areas that changed. A maze of a different
+        shape is rebuilt into a new surface."""
+        cells: npt.NDArray[np.uint8] = MazeGrid.coerce(maze).cells
+        if cells.shape != self._tiles.shape:
+            self.rebuild(maze)
+            return [self._surface.get_rect()]
+
+        changed: List[pygame.Rect] = []
+        for row, col in np.argwhere(cells != self._tiles):
+            tile_value: int = int(cells[row, col])
+            self._tiles[row, col] = tile_value
+            changed.append(self._draw_tile(int(row), int(col), tile_value))
+        return changed
+
+    def _draw_tile(self, row: int, col: int, tile_value: int) -> pygame.Rect:
+        """Draws one cell of the layer, returns its area"""
+        ###################################
+        # need to add in the empty tile image behind doors:
+        if tile_value in {TILE_WALL, TILE_GOAL, TILE_KEY}:
+            tile_img: pygame.Surface = self._tileset.get_image(tile_value)
+        else:
+            # filles in the empty and tilespots behind doors:
+            tile_img = self._tileset.get_image(TILE_EMPTY)
+        return self._surface.blit(tile_img, (col * TILE_SIZE, row * TILE_SIZE))
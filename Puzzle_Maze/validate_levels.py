@@ -0,0 +1,303 @@
+"""Validation of level packs. Every level is solved, around its enemies and
+without them, then the path found is played through a headless Game to
+check the game agrees with the solver. Levels are streamed from the pack
+and fanned out to a process pool with a bounded number of levels in
+flight, and the results stream into a JSON Lines report and a running
+summary, so memory stays the same whatever the size of the pack. A level
+that takes longer than the timeout is reported as failed, and the workers
+are stopped at the end of the run.
+
+    python validate_levels.py levels/levels.jsonl --report report.jsonl
+"""
+
+from collections import deque
+from contextlib import redirect_stdout
+from multiprocessing.pool import AsyncResult, Pool
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import sys
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Sequence, Tuple
+import pygame
+from game import Game, STEP_MS
+from game_input import ScriptedInput
+from level_format import LevelData
+from level_archive import open_levels
+from solver import Solution, TimedSolution, solve_level
+from GameObjects import PLAYER_MOVE_DELAY
+
+# outcomes of the playthrough
+WON: str = "won"
+CAUGHT: str = "caught"
+STUCK: str = "stuck"
+SKIPPED: str = "skipped"
+# error of a level that was not validated within the timeout
+TIMEOUT: str = "timeout"
+# seconds a level may take, they usually take a few ms
+DEFAULT_TIMEOUT: float = 60.0
+DIRECTIONS: Dict[Tuple[int, int], int] = {
+    (-1, 0): pygame.K_UP, (1, 0): pygame.K_DOWN,
+    (0, -1): pygame.K_LEFT, (0, 1): pygame.K_RIGHT}
+
+
+class LevelReport:
+    """Validation result of one level"""
+
+    def __init__(self, index: int, name: str, solvable: bool = False,
+                 survivable: bool = False, length: int | None = None,
+                 arrival: int | None = None, keys_collected: int = 0, doors_opened: int = 0,
+                 playthrough: str = SKIPPED, error: str | None = None) -> None:
+        """Constructor for LevelReport
+
+        Args:
+            index (int): position of the level in the pack
+            name (str): name of the level
+            solvable (bool): the goal can be reached, ignoring enemies
+            survivable (bool): the goal can be reached without being caught
+            length (int | None): moves on the shortest path, ignoring enemies
+            arrival (int | None): ms to reach the goal around the enemies
+            keys_collected (int): keys picked up on the path played
+            doors_opened (int): doors opened on the path played
+            playthrough (str): how the game ended playing the path
+            error (str | None): exception raised while validating, if any
+        """
+        self.index: int = index
+        self.name: str = name
+        self.solvable: bool = solvable
+        self.survivable: bool = survivable
+        self.length: int | None = length
+        self.arrival: int | None = arrival
+        self.keys_collected: int = keys_collected
+        self.doors_opened: int = doors_opened
+        self.playthrough: str = playthrough
+        self.error: str | None = error
+
+    @property
+    def ok(self) -> bool:
+        """returns whether the level can be beaten and the game agrees"""
+        return self.error is None and self.survivable and self.playthrough == WON
+
+    @property
+    def problem(self) -> str | None:
+        """returns why the level failed, None if it passed"""
+        if self.error is not None:
+            return self.error
+        if not self.solvable:
+            return "the goal cannot be reached"
+        if not self.survivable:
+            return "the enemies cannot be avoided"
+        if self.playthrough != WON:
+            return f"the game ended {self.playthrough} playing the solution"
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """returns the report as JSON compatible data"""
+        return {"index": self.index, "name": self.name, "ok": self.ok,
+                "solvable": self.solvable, "survivable": self.survivable,
+                "length": self.length, "arrival": self.arrival,
+                "keys_collected": self.keys_collected, "doors_opened": self.doors_opened,
+                "playthrough": self.playthrough, "error": self.error}
+
+
+class ValidationSummary:
+    """Running totals over the reports of a pack"""
+
+    def __init__(self) -> None:
+        self.levels: int = 0
+        self.passed: int = 0
+        self.unsolvable: int = 0
+        self.unsurvivable: int = 0
+        self.playthrough_failed: int = 0
+        self.errors: int = 0
+        self.keys_collected: int = 0
+        self.doors_opened: int = 0
+        self.shortest: int | None = None
+        self.longest: int | None = None
+        self._total_length: int = 0
+        self._solved: int = 0
+
+    def add(self, report: LevelReport) -> None:
+        """Counts one level"""
+        self.levels += 1
+        self.passed += report.ok
+        if report.error is not None:
+            self.errors += 1
+            return
+        self.unsolvable += not report.solvable
+        self.unsurvivable += report.solvable and not report.survivable
+        self.playthrough_failed += report.survivable and report.playthrough != WON
+        self.keys_collected += report.keys_collected
+        self.doors_opened += report.doors_opened
+        if report.length is not None:
+            self._solved += 1
+            self._total_length += report.length
+            self.shortest = report.length if self.shortest is None \
+                else min(self.shortest, report.length)
+            self.longest = report.length if self.longest is None \
+                else max(self.longest, report.length)
+
+    @property
+    def mean_length(self) -> float | None:
+        """returns the mean shortest path length of the solvable levels"""
+        return self._total_length / self._solved if self._solved else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """returns the totals as JSON compatible data"""
+        return {"levels": self.levels, "passed": self.passed, "failed": self.levels - self.passed,
+                "unsolvable": self.unsolvable, "unsurvivable": self.unsurvivable,
+                "playthrough_failed": self.playthrough_failed, "errors": self.errors,
+                "keys_collected": self.keys_collected, "doors_opened": self.doors_opened,
+                "shortest": self.shortest, "longest": self.longest,
+                "mean_length": self.mean_length}
+
+
+def play_solution(level: LevelData, solution: Solution) -> str:
+    """Plays a solution in a headless game, one logic step at a time, and
+    returns how it ended. A TimedSolution moves at its times, any other as
+    soon as the player can move."""
+    keys: ScriptedInput = ScriptedInput()
+    game: Game = Game(headless=True, input_source=keys, levels=[level])
+    moves: List[Tuple[int, int]] = solution.moves()
+    times: List[int] = solution.times[1:] if isinstance(solution, TimedSolution) \
+        else [PLAYER_MOVE_DELAY * (index + 1) for index in range(len(moves))]
+    schedule: Dict[int, int] = {time: DIRECTIONS[move] for time, move in zip(times, moves)}
+    end_time: int = times[-1] if times else STEP_MS
+    while not game.game_over and game.sim_time < end_time:
+        upcoming: int = game.sim_time + STEP_MS
+        if upcoming in schedule:
+            keys.press(schedule[upcoming])
+        else:
+            keys.release()
+        game.step()
+    if game.won:
+        return WON
+    return CAUGHT if game.game_over else STUCK
+
+
+def validate_level(job: Tuple[int, LevelData]) -> LevelReport:
+    """Solves and plays one level, the work done by each process. Exceptions
+    are reported rather than raised so one broken level does not stop the
+    run, levels that never finish are caught by the timeout of
+    validate_levels."""
+    index, level = job
+    report: LevelReport = LevelReport(index, level.name)
+    try:
+        # the game prints as keys are picked up and levels are completed
+        with redirect_stdout(io.StringIO()):
+            _validate(level, report)
+    except Exception as error:
+        report.error = f"{type(error).__name__}: {error}"
+    return report
+
+
+def _validate(level: LevelData, report: LevelReport) -> None:
+    """Fills in the report of a level"""
+    shortest: Solution | None = solve_level(level)
+    if shortest is None:
+        return
+    report.solvable = True
+    report.length = shortest.length
+    played: Solution = shortest
+    if level.enemies:
+        timed: Solution | None = solve_level(level, avoid_enemies=True)
+        report.survivable = timed is not None
+        if timed is not None:
+            played = timed
+    else:
+        report.survivable = True
+    report.arrival = played.arrival if isinstance(played, TimedSolution) \
+        else PLAYER_MOVE_DELAY * played.length
+    report.keys_collected = played.keys_collected
+    report.doors_opened = played.doors_opened
+    report.playthrough = play_solution(level, played)
+
+
+def validate_levels(levels: Iterable[LevelData], workers: int | None = None,
+                    max_in_flight: int | None = None,
+                    timeout: float | None = DEFAULT_TIMEOUT) -> Iterator[LevelReport]:
+    """Validates levels across a process pool unless workers is 1, yielding
+    the reports in pack order
+
+    Args:
+        levels (Iterable[LevelData]): levels to check, read as they are needed
+        workers (int | None): processes to use, defaults to one per CPU
+        max_in_flight (int | None): levels submitted and not yet reported,
+        defaults to four per process
+        timeout (float | None): seconds to wait for each report once it is
+        next in order, None to wait forever. Not applied when workers is 1.
+    """
+    jobs: Iterator[Tuple[int, LevelData]] = enumerate(levels)
+    if workers == 1:
+        yield from map(validate_level, jobs)
+        return
+    workers = workers or os.cpu_count() or 1
+    # spawned, a worker forked while another thread holds a lock can hang
+    pool: Pool = multiprocessing.get_context("spawn").Pool(processes=workers)
+    try:
+        yield from _bounded_map(pool, jobs, max_in_flight or workers * 4, timeout)
+    finally:
+        # a level that timed out is still running, terminating the workers
+        # stops it where waiting for the pool would block forever
+        pool.terminate()
+        pool.join()
+
+
+def _bounded_map(pool: Pool, jobs: Iterator[Tuple[int, LevelData]],
+                 max_in_flight: int, timeout: float | None = None) -> Iterator[LevelReport]:
+    """Pool.imap reads jobs as fast as the workers take them, this only
+    reads the next level once a report is taken"""
+    pending: Deque[Tuple[Tuple[int, LevelData], AsyncResult[LevelReport]]] = deque()
+    for job in jobs:
+        pending.append((job, pool.apply_async(validate_level, (job,))))
+        if len(pending) >= max_in_flight:
+            yield _result(*pending.popleft(), timeout)
+    while pending:
+        yield _result(*pending.popleft(), timeout)
+
+
+def _result(job: Tuple[int, LevelData], result: AsyncResult[LevelReport],
+            timeout: float | None) -> LevelReport:
+    """returns the report of a submitted level, or a timeout report if it
+    does not arrive within timeout seconds"""
+    try:
+        return result.get(timeout=timeout)
+    except multiprocessing.TimeoutError:
+        return LevelReport(job[0], job[1].name, error=TIMEOUT)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Validates a level pack, writes the report and prints the totals.
+    Returns 1 if any level failed, for use in scripts."""
+    parser = argparse.ArgumentParser(description="Check every level of a pack can be beaten")
+    parser.add_argument("levels", help="level pack (.jsonl) or archive to check")
+    parser.add_argument("--report", default=None, help="JSON Lines file, one line per level")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="levels queued for the processes at a time")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="seconds a level may take before it is reported as failed")
+    args = parser.parse_args(argv)
+    summary: ValidationSummary = ValidationSummary()
+    report_file: IO[str] | None = \
+        open(args.report, "w", encoding="utf-8") if args.report else None
+    try:
+        with open_levels(args.levels) as levels:
+            reports: Iterator[LevelReport] = validate_levels(levels, args.workers,
+                                                             args.max_in_flight, args.timeout)
+            for report in reports:
+                summary.add(report)
+                if report_file is not None:
+                    report_file.write(json.dumps(report.to_dict()) + "\n")
+                if not report.ok:
+                    print(f"level {report.index} ({report.name}) failed: {report.problem}")
+    finally:
+        if report_file is not None:
+            report_file.close()
+    print(json.dumps(summary.to_dict(), indent=2))
+    return 0 if summary.passed == summary.levels else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())  # pragma: no cover